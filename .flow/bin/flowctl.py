@@ -7,21 +7,23 @@ Agents must use flowctl for all writes - never edit .flow/* directly.
 """
 
 import argparse
+import fnmatch
 import json
 import os
 import re
-import secrets
-import string
-import subprocess
-import shlex
-import shutil
 import sys
-import tempfile
+import time
+# Heavier stdlib modules (subprocess, tempfile, sqlite3, socket, ...) are
+# imported inside the functions that need them to keep startup fast.
 from abc import ABC, abstractmethod
-from contextlib import contextmanager
-from datetime import datetime
+from collections import deque
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from pathlib import Path
-from typing import Any, ContextManager, Optional
+from typing import TYPE_CHECKING, Any, ContextManager, Optional, Union
+
+if TYPE_CHECKING:  # Annotations only; imported lazily at runtime
+    import sqlite3
+    import subprocess
 
 # Platform-specific file locking (fcntl on Unix, no-op on Windows)
 try:
@@ -56,6 +58,11 @@ CONFIG_FILE = "config.json"
 EPIC_STATUS = ["open", "done"]
 TASK_STATUS = ["todo", "in_progress", "blocked", "done"]
 
+STATE_BACKENDS = ["file", "sqlite"]
+# FLOW_STATE_DIR=sqlite:<dir> selects the SQLite backend for that dir
+SQLITE_STATE_SCHEME = "sqlite:"
+SQLITE_STATE_DB = "state.db"
+
 TASK_SPEC_HEADINGS = [
     "## Description",
     "## Acceptance",
@@ -78,24 +85,75 @@ RUNTIME_FIELDS = {
 # --- Helpers ---
 
 
-def get_repo_root() -> Path:
-    """Find git repo root."""
+# Process-wide cache for resolved paths. Resolving them forks git, and hot
+# paths (load_task_with_state per task) would otherwise pay that per call.
+_resolved_paths: dict[str, Optional[Path]] = {}
+
+
+def _resolve_git_paths() -> None:
+    """Resolve repo root and git common-dir once per process.
+
+    Resolution order:
+    1. FLOW_REPO_ROOT / FLOW_GIT_COMMON_DIR env vars (orchestrators like
+       ralph.sh export these once so child flowctl calls never fork git)
+    2. A single `git rev-parse --show-toplevel --git-common-dir` call
+    3. Fallback to current directory (non-git repos, no common-dir)
+    """
+    repo_root = os.environ.get("FLOW_REPO_ROOT")
+    common_dir = os.environ.get("FLOW_GIT_COMMON_DIR")
+    if repo_root and common_dir:
+        _resolved_paths["repo_root"] = Path(repo_root)
+        _resolved_paths["git_common_dir"] = Path(common_dir)
+        return
+
+    import subprocess
+
     try:
         result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
+            ["git", "rev-parse", "--show-toplevel", "--git-common-dir"],
             capture_output=True,
             text=True,
             check=True,
         )
-        return Path(result.stdout.strip())
-    except subprocess.CalledProcessError:
-        # Fallback to current directory
-        return Path.cwd()
+        lines = result.stdout.strip().split("\n")
+        git_root = Path(lines[0])
+        # --git-common-dir may be relative to cwd (e.g. ".git")
+        git_common = (Path.cwd() / lines[1]).resolve() if len(lines) > 1 else None
+    except (subprocess.CalledProcessError, FileNotFoundError, IndexError):
+        git_root = None
+        git_common = None
+
+    _resolved_paths["repo_root"] = Path(repo_root) if repo_root else (git_root or Path.cwd())
+    _resolved_paths["git_common_dir"] = Path(common_dir) if common_dir else git_common
+
+
+def clear_path_cache() -> None:
+    """Forget resolved paths (e.g. after chdir or env changes)."""
+    flush_flow_index()
+    _resolved_paths.clear()
+    _state_stores.clear()
+    _flow_indexes.clear()
+
+
+def get_repo_root() -> Path:
+    """Find git repo root."""
+    if "repo_root" not in _resolved_paths:
+        _resolve_git_paths()
+    return _resolved_paths["repo_root"]
+
+
+def get_git_common_dir() -> Optional[Path]:
+    """Get git common-dir (shared across worktrees). None outside git."""
+    if "git_common_dir" not in _resolved_paths:
+        _resolve_git_paths()
+    return _resolved_paths["git_common_dir"]
 
 
 def get_flow_dir() -> Path:
     """Get .flow/ directory path."""
-    return get_repo_root() / FLOW_DIR
+    if "flow_dir" not in _resolved_paths:
+        _resolved_paths["flow_dir"] = get_repo_root() / FLOW_DIR
+    return _resolved_paths["flow_dir"]
 
 
 def ensure_flow_exists() -> bool:
@@ -111,25 +169,24 @@ def get_state_dir() -> Path:
     2. git common-dir (shared across all worktrees automatically)
     3. Fallback to .flow/state for non-git repos
     """
-    # 1. Explicit override
-    if state_dir := os.environ.get("FLOW_STATE_DIR"):
-        return Path(state_dir).resolve()
-
+    override = os.environ.get("FLOW_STATE_DIR", "")
+    cache_key = f"state_dir:{override}"
+    if cache_key in _resolved_paths:
+        return _resolved_paths[cache_key]
+
+    # 1. Explicit override (may carry a backend scheme, e.g. sqlite:<dir>)
+    if state_dir := override:
+        if state_dir.startswith(SQLITE_STATE_SCHEME):
+            state_dir = state_dir[len(SQLITE_STATE_SCHEME):]
+        resolved = Path(state_dir).resolve()
     # 2. Git common-dir (shared across worktrees)
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-common-dir", "--path-format=absolute"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        common = result.stdout.strip()
-        return Path(common) / "flow-state"
-    except subprocess.CalledProcessError:
-        pass
-
+    elif common := get_git_common_dir():
+        resolved = common / "flow-state"
     # 3. Fallback for non-git repos
-    return get_flow_dir() / "state"
+    else:
+        resolved = get_flow_dir() / "state"
+    _resolved_paths[cache_key] = resolved
+    return resolved
 
 
 # --- StateStore (runtime task state) ---
@@ -153,19 +210,38 @@ class StateStore(ABC):
         """Context manager for exclusive task lock."""
         ...
 
+    @abstractmethod
+    def delete_runtime(self, task_id: str) -> None:
+        """Delete runtime state for a task (no-op if none)."""
+        ...
+
     @abstractmethod
     def list_runtime_files(self) -> list[str]:
         """List all task IDs that have runtime state files."""
         ...
 
+    def load_many_runtime(self, task_ids: list[str]) -> dict[str, dict]:
+        """Load runtime state for the given tasks, keyed by task ID (missing omitted)."""
+        result = {}
+        for task_id in task_ids:
+            runtime = self.load_runtime(task_id)
+            if runtime is not None:
+                result[task_id] = runtime
+        return result
+
+    def load_all_runtime(self) -> dict[str, dict]:
+        """Load runtime state for every task that has any, keyed by task ID."""
+        return self.load_many_runtime(self.list_runtime_files())
+
 
 class LocalFileStateStore(StateStore):
     """File-based state store with fcntl locking."""
 
-    def __init__(self, state_dir: Path):
+    def __init__(self, state_dir: Path, index: Optional["FlowIndex"] = None):
         self.state_dir = state_dir
         self.tasks_dir = state_dir / "tasks"
         self.locks_dir = state_dir / "locks"
+        self.index = index
 
     def _state_path(self, task_id: str) -> Path:
         return self.tasks_dir / f"{task_id}.state.json"
@@ -173,22 +249,29 @@ class LocalFileStateStore(StateStore):
     def _lock_path(self, task_id: str) -> Path:
         return self.locks_dir / f"{task_id}.lock"
 
-    def load_runtime(self, task_id: str) -> Optional[dict]:
-        state_path = self._state_path(task_id)
-        if not state_path.exists():
-            return None
+    def _read_state(self, state_path) -> Optional[dict]:
         try:
+            if self.index is not None:
+                return self.index.load(state_path)
             with open(state_path, encoding="utf-8") as f:
                 return json.load(f)
         except (json.JSONDecodeError, IOError):
             return None
 
+    def load_runtime(self, task_id: str) -> Optional[dict]:
+        return self._read_state(self._state_path(task_id))
+
     def save_runtime(self, task_id: str, data: dict) -> None:
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
         state_path = self._state_path(task_id)
         content = json.dumps(data, indent=2, sort_keys=True) + "\n"
         atomic_write(state_path, content)
 
+    def delete_runtime(self, task_id: str) -> None:
+        state_path = self._state_path(task_id)
+        if state_path.exists():
+            state_path.unlink()
+
     @contextmanager
     def lock_task(self, task_id: str):
         """Acquire exclusive lock for task operations."""
@@ -209,10 +292,292 @@ class LocalFileStateStore(StateStore):
             for f in self.tasks_dir.glob("*.state.json")
         ]
 
+    def load_all_runtime(self) -> dict[str, dict]:
+        # One scandir pass; entry paths are used as-is (no per-task Path building)
+        suffix = ".state.json"
+        result = {}
+        try:
+            entries = list(os.scandir(self.tasks_dir))
+        except FileNotFoundError:
+            return result
+        for entry in entries:
+            if not entry.name.endswith(suffix):
+                continue
+            runtime = self._read_state(entry.path)
+            if runtime is not None:
+                result[entry.name[: -len(suffix)]] = runtime
+        return result
+
+
+class SqliteStateStore(StateStore):
+    """SQLite-backed state store (one row per task, WAL mode).
+
+    lock_task() opens a BEGIN IMMEDIATE transaction: claims (start/done)
+    read, check and write their row atomically while WAL readers (status,
+    ready) keep reading the last committed state without blocking.
+    """
+
+    def __init__(self, state_dir: Path):
+        self.state_dir = state_dir
+        self.db_path = state_dir / SQLITE_STATE_DB
+        self._conn: Optional["sqlite3.Connection"] = None
+        self._in_lock = False
+
+    @property
+    def conn(self) -> "sqlite3.Connection":
+        import sqlite3
+
+        if self._conn is None:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            # isolation_level=None: explicit transactions only (see lock_task)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS task_state ("
+                "task_id TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at TEXT)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def load_runtime(self, task_id: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT data FROM task_state WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def save_runtime(self, task_id: str, data: dict) -> None:
+        self.conn.execute(
+            "INSERT INTO task_state (task_id, data, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(task_id) DO UPDATE SET "
+            "data = excluded.data, updated_at = excluded.updated_at",
+            (task_id, json.dumps(data, sort_keys=True), data.get("updated_at")),
+        )
+
+    def delete_runtime(self, task_id: str) -> None:
+        self.conn.execute("DELETE FROM task_state WHERE task_id = ?", (task_id,))
+
+    @contextmanager
+    def lock_task(self, task_id: str):
+        """Hold a write transaction for the duration of a task operation."""
+        if self._in_lock:
+            yield
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        self._in_lock = True
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self.conn.execute("COMMIT")
+        finally:
+            self._in_lock = False
+
+    def list_runtime_files(self) -> list[str]:
+        return [
+            row[0] for row in self.conn.execute("SELECT task_id FROM task_state")
+        ]
+
+    def _decode_rows(self, rows) -> dict[str, dict]:
+        result = {}
+        for task_id, data in rows:
+            try:
+                result[task_id] = json.loads(data)
+            except json.JSONDecodeError:
+                continue
+        return result
+
+    def load_many_runtime(self, task_ids: list[str]) -> dict[str, dict]:
+        result = {}
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(task_ids), 500):
+            chunk = task_ids[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            result.update(
+                self._decode_rows(
+                    self.conn.execute(
+                        f"SELECT task_id, data FROM task_state WHERE task_id IN ({placeholders})",
+                        chunk,
+                    )
+                )
+            )
+        return result
+
+    def load_all_runtime(self) -> dict[str, dict]:
+        return self._decode_rows(
+            self.conn.execute("SELECT task_id, data FROM task_state")
+        )
+
+
+_state_stores: dict[Path, StateStore] = {}
+
+
+def get_state_backend() -> str:
+    """Resolve the runtime state backend.
+
+    FLOW_STATE_DIR=sqlite:<dir> wins; otherwise config `state.backend`
+    ("file" or "sqlite"), defaulting to the per-task JSON file store.
+    """
+    if os.environ.get("FLOW_STATE_DIR", "").startswith(SQLITE_STATE_SCHEME):
+        return "sqlite"
+    backend = get_config("state.backend", "file")
+    return backend if backend in STATE_BACKENDS else "file"
+
+
+def get_state_store() -> StateStore:
+    """Get the state store instance (one per state dir per process)."""
+    state_dir = get_state_dir()
+    if state_dir not in _state_stores:
+        if get_state_backend() == "sqlite":
+            _state_stores[state_dir] = SqliteStateStore(state_dir)
+        else:
+            _state_stores[state_dir] = LocalFileStateStore(
+                state_dir, index=get_flow_index()
+            )
+    return _state_stores[state_dir]
+
+
+# --- Flow Index (parsed JSON cache) ---
+
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+# Files modified this recently are never cached: a rewrite within the same
+# mtime tick and with the same size would otherwise go unnoticed.
+INDEX_RACY_NS = 2_000_000_000
+
+
+class FlowIndex:
+    """Persistent cache of parsed .flow JSON files (epics, tasks, state).
+
+    Entries are keyed by absolute path and validated against one stat
+    (mtime_ns, size, inode), so listing commands cost a stat sweep instead
+    of an open + json.load per file. Lives in the state dir; rewritten
+    atomically at exit only when an entry changed.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: dict[str, list] = {}
+        self.seen: set[str] = set()
+        self.dirty = False
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION and isinstance(
+                data.get("entries"), dict
+            ):
+                self.entries = data["entries"]
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+
+    def get(self, path: Path) -> Optional[dict]:
+        """Return cached JSON for path if the file is unchanged, else None."""
+        self._ensure_loaded()
+        key = str(path)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            st = os.stat(key)
+        except OSError:
+            del self.entries[key]
+            self.dirty = True
+            return None
+        if entry[:3] != [st.st_mtime_ns, st.st_size, st.st_ino]:
+            return None
+        self.seen.add(key)
+        # Shallow copy: callers (normalize_*) add top-level keys
+        return dict(entry[3])
+
+    def load(self, path: Path) -> dict:
+        """Load JSON through the index. Raises like load_json on a miss."""
+        cached = self.get(path)
+        if cached is not None:
+            return cached
+        with open(path, encoding="utf-8") as f:
+            # fstat the handle we read, not the path, so a concurrent
+            # replace can't pair new stat data with old content
+            st = os.fstat(f.fileno())
+            data = json.load(f)
+        key = str(path)
+        self.seen.add(key)
+        if isinstance(data, dict) and time.time_ns() - st.st_mtime_ns > INDEX_RACY_NS:
+            self.entries[key] = [st.st_mtime_ns, st.st_size, st.st_ino, data]
+            self.dirty = True
+            return dict(data)
+        if self.entries.pop(key, None) is not None:
+            self.dirty = True
+        return data
+
+    def save(self) -> None:
+        """Write the index if anything changed. Best-effort."""
+        if not self.dirty:
+            return
+        # Drop entries for files deleted since they were cached
+        for key in [k for k in self.entries if k not in self.seen]:
+            if not os.path.exists(key):
+                del self.entries[key]
+        content = json.dumps(
+            {"version": INDEX_VERSION, "entries": self.entries},
+            separators=(",", ":"),
+        )
+        try:
+            atomic_write(self.path, content)
+            self.dirty = False
+        except OSError:
+            pass
+
+
+_flow_indexes: dict[Path, FlowIndex] = {}
+
+
+def get_flow_index() -> Optional[FlowIndex]:
+    """Get the index for the current state dir (None if FLOW_NO_INDEX is set)."""
+    if os.environ.get("FLOW_NO_INDEX"):
+        return None
+    state_dir = get_state_dir()
+    if state_dir not in _flow_indexes:
+        _flow_indexes[state_dir] = FlowIndex(state_dir / INDEX_FILE)
+    return _flow_indexes[state_dir]
+
+
+def flush_flow_index() -> None:
+    """Persist any index updates made by this process."""
+    for index in _flow_indexes.values():
+        index.save()
+
 
-def get_state_store() -> LocalFileStateStore:
-    """Get the state store instance."""
-    return LocalFileStateStore(get_state_dir())
+def load_json_cached(path: Path) -> dict:
+    """load_json, served from the flow index when the file is unchanged."""
+    index = get_flow_index()
+    if index is None:
+        return load_json(path)
+    return index.load(path)
+
+
+def load_json_indexed(path: Path, what: str, use_json: bool = True) -> dict:
+    """load_json_or_exit, served from the flow index when the file is unchanged."""
+    try:
+        return load_json_cached(path)
+    except FileNotFoundError:
+        error_exit(f"{what} missing: {path}", use_json=use_json)
+    except json.JSONDecodeError as e:
+        error_exit(f"{what} invalid JSON: {path} ({e})", use_json=use_json)
+    except Exception as e:
+        error_exit(f"{what} unreadable: {path} ({e})", use_json=use_json)
 
 
 # --- Task Loading with State Merge ---
@@ -222,7 +587,7 @@ def load_task_definition(task_id: str, use_json: bool = True) -> dict:
     """Load task definition from tracked file (no runtime state)."""
     flow_dir = get_flow_dir()
     def_path = flow_dir / TASKS_DIR / f"{task_id}.json"
-    return load_json_or_exit(def_path, f"Task {task_id}", use_json=use_json)
+    return load_json_indexed(def_path, f"Task {task_id}", use_json=use_json)
 
 
 def load_task_with_state(task_id: str, use_json: bool = True) -> dict:
@@ -232,11 +597,50 @@ def load_task_with_state(task_id: str, use_json: bool = True) -> dict:
     fields from definition file.
     """
     definition = load_task_definition(task_id, use_json=use_json)
+    runtime = get_state_store().load_runtime(task_id)
+    return merge_task_runtime(definition, runtime)
 
-    # Load runtime state
-    store = get_state_store()
-    runtime = store.load_runtime(task_id)
 
+def load_tasks_with_state(
+    pattern: str = "fn-*.json",
+    use_json: bool = True,
+    runtime_states: Optional[dict[str, dict]] = None,
+) -> dict[str, dict]:
+    """Load all tasks matching a filename pattern, merged with runtime state.
+
+    One directory scan plus one bulk runtime load (pass runtime_states to
+    reuse it across calls). Returns {task_id: task} in filename order;
+    artifact files without an "id" are included, callers filter them.
+    """
+    tasks_dir = get_flow_dir() / TASKS_DIR
+    try:
+        names = sorted(
+            entry.name
+            for entry in os.scandir(tasks_dir)
+            if fnmatch.fnmatchcase(entry.name, pattern)
+        )
+    except FileNotFoundError:
+        return {}
+    # Skip non-task files (must have . before .json)
+    task_ids = [name[: -len(".json")] for name in names if "." in name[: -len(".json")]]
+    if runtime_states is None:
+        store = get_state_store()
+        if pattern == "fn-*.json":
+            runtime_states = store.load_all_runtime()
+        else:
+            runtime_states = store.load_many_runtime(task_ids)
+
+    tasks = {}
+    for task_id in task_ids:
+        definition = load_json_indexed(
+            tasks_dir / f"{task_id}.json", f"Task {task_id}", use_json=use_json
+        )
+        tasks[task_id] = merge_task_runtime(definition, runtime_states.get(task_id))
+    return tasks
+
+
+def merge_task_runtime(definition: dict, runtime: Optional[dict]) -> dict:
+    """Merge runtime state over a task definition."""
     if runtime is None:
         # Backward compat: extract runtime fields from definition
         runtime = {k: definition[k] for k in RUNTIME_FIELDS if k in definition}
@@ -269,9 +673,7 @@ def delete_task_runtime(task_id: str) -> None:
     """Delete runtime state file entirely. Used by checkpoint restore when no runtime."""
     store = get_state_store()
     with store.lock_task(task_id):
-        state_path = store._state_path(task_id)
-        if state_path.exists():
-            state_path.unlink()
+        store.delete_runtime(task_id)
 
 
 def save_task_definition(task_id: str, definition: dict) -> None:
@@ -289,6 +691,7 @@ def get_default_config() -> dict:
         "memory": {"enabled": False},
         "planSync": {"enabled": False, "crossEpic": False},
         "review": {"backend": None},
+        "state": {"backend": "file"},
     }
 
 
@@ -380,11 +783,15 @@ def error_exit(message: str, code: int = 1, use_json: bool = True) -> None:
 
 def now_iso() -> str:
     """Current timestamp in ISO format."""
+    from datetime import datetime
+
     return datetime.utcnow().isoformat() + "Z"
 
 
 def require_rp_cli() -> str:
     """Ensure rp-cli is available."""
+    import shutil
+
     rp = shutil.which("rp-cli")
     if not rp:
         error_exit("rp-cli not found in PATH", use_json=False, code=2)
@@ -393,13 +800,15 @@ def require_rp_cli() -> str:
 
 def run_rp_cli(
     args: list[str], timeout: Optional[int] = None
-) -> subprocess.CompletedProcess:
+) -> "subprocess.CompletedProcess":
     """Run rp-cli with safe error handling and timeout.
 
     Args:
         args: Command arguments to pass to rp-cli
         timeout: Max seconds to wait. Default from FLOW_RP_TIMEOUT env or 1200s (20min).
     """
+    import subprocess
+
     if timeout is None:
         timeout = int(os.environ.get("FLOW_RP_TIMEOUT", "1200"))
     rp = require_rp_cli()
@@ -516,6 +925,8 @@ def is_supported_schema(version: Any) -> bool:
 
 def atomic_write(path: Path, content: str) -> None:
     """Write file atomically via temp + rename."""
+    import tempfile
+
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
@@ -578,6 +989,9 @@ def read_file_or_stdin(file_arg: str, what: str, use_json: bool = True) -> str:
 
 def generate_epic_suffix(length: int = 3) -> str:
     """Generate random alphanumeric suffix for epic IDs (a-z0-9)."""
+    import secrets
+    import string
+
     alphabet = string.ascii_lowercase + string.digits
     return "".join(secrets.choice(alphabet) for _ in range(length))
 
@@ -657,6 +1071,8 @@ def epic_id_from_task(task_id: str) -> str:
 
 def get_changed_files(base_branch: str) -> list[str]:
     """Get files changed between base branch and HEAD."""
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", "diff", "--name-only", base_branch],
@@ -679,11 +1095,21 @@ def extract_symbols_from_file(file_path: Path) -> list[str]:
         if not file_path.exists():
             return []
         content = file_path.read_text(encoding="utf-8", errors="ignore")
+    except Exception:
+        return []
+    return extract_symbols(content, file_path.suffix.lower())
+
+
+def extract_symbols(content: str, ext: str) -> list[str]:
+    """Extract defined symbols from source text; ext selects the language.
+
+    Returns empty list on any error - never crashes.
+    """
+    try:
         if not content:
             return []
 
         symbols = []
-        ext = file_path.suffix.lower()
 
         # Python: def/class definitions
         if ext == ".py":
@@ -784,75 +1210,261 @@ def extract_symbols_from_file(file_path: Path) -> list[str]:
             ):
                 symbols.append(match.group(1))
 
+        # Swift: types, extensions, funcs, and type-level/top-level properties
+        elif ext == ".swift":
+            # One pass: indent, attributes (@MainActor, @available(...)) and
+            # modifiers, then the declaration keyword and name
+            for match in re.finditer(
+                r"^([ \t]*)(?:@\w+(?:\([^)\n]*\))?\s+)*"
+                r"(?:(?:public|private|fileprivate|internal|open|package|final|static|"
+                r"class|override|mutating|nonmutating|nonisolated|convenience|required|"
+                r"indirect|lazy|weak|unowned|dynamic)(?:\([^)\n]*\))?\s+)*"
+                r"(?:(?:class|struct|enum|protocol|actor|typealias|extension)\s+"
+                r"(?!func\b|var\b|let\b)(\w+)|func\s+(\w+)|(?:let|var)\s+(\w+))",
+                content,
+                re.MULTILINE,
+            ):
+                indent, type_name, func_name, prop_name = match.groups()
+                if prop_name:
+                    # Properties only at file or type-member depth
+                    # (<= 4 spaces / 1 tab) so locals inside bodies are skipped
+                    if len(indent.expandtabs(4)) <= 4:
+                        symbols.append(prop_name)
+                else:
+                    symbols.append(type_name or func_name)
+
         return list(set(symbols))
     except Exception:
         # Never crash on parse errors - just return empty
         return []
 
 
+# Source files searched for references (git grep pathspecs)
+REFERENCE_GLOBS = [
+    # Python
+    "*.py",
+    # JavaScript/TypeScript
+    "*.js",
+    "*.ts",
+    "*.tsx",
+    "*.jsx",
+    "*.mjs",
+    # Go
+    "*.go",
+    # Rust
+    "*.rs",
+    # C/C++
+    "*.c",
+    "*.h",
+    "*.cpp",
+    "*.hpp",
+    "*.cc",
+    "*.cxx",
+    # Java
+    "*.java",
+    # C#
+    "*.cs",
+    # Swift
+    "*.swift",
+]
+
+
+def find_references_batch(
+    symbols: list[str], exclude_files: list[str], max_results: int = 3
+) -> dict[str, list[tuple[str, int]]]:
+    """Find files referencing each symbol with a single `git grep`.
+
+    All symbols go into one -E alternation; each matching line is mapped
+    back to the symbols among its words (whole-word, as `git grep -w`). Per symbol the
+    result equals find_references(): the first max_results hits in git grep
+    order, excluding exclude_files. Stops reading once every symbol is full.
+    """
+    import subprocess
+
+    symbols = list(dict.fromkeys(s for s in symbols if s))
+    refs: dict[str, list[tuple[str, int]]] = {s: [] for s in symbols}
+    if not symbols:
+        return refs
+    wanted = set(symbols)
+    excluded = set(exclude_files)
+    # One alternation, not one -e per symbol: git's multi-pattern matching
+    # is linear in the pattern count, the regex engine is not
+    pattern = "(" + "|".join(re.sub(r"[^\w]", ".", s) for s in symbols) + ")"
+    cmd = ["git", "grep", "-n", "-w", "-E", "-e", pattern, "--", *REFERENCE_GLOBS]
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            cwd=get_repo_root(),
+        )
+    except OSError:
+        return refs
+    pending = len(symbols)
+    try:
+        for line in proc.stdout:
+            # Format: file:line:content
+            parts = line.rstrip("\n").split(":", 2)
+            if len(parts) < 3 or parts[0] in excluded:
+                continue
+            try:
+                line_num = int(parts[1])
+            except ValueError:
+                continue
+            for symbol in dict.fromkeys(re.findall(r"\w+", parts[2])):
+                if symbol not in wanted:
+                    continue
+                hits = refs[symbol]
+                if len(hits) < max_results:
+                    hits.append((parts[0], line_num))
+                    if len(hits) == max_results:
+                        pending -= 1
+            if pending == 0:
+                break
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+    return refs
+
+
 def find_references(
     symbol: str, exclude_files: list[str], max_results: int = 3
 ) -> list[tuple[str, int]]:
     """Find files referencing a symbol. Returns [(path, line_number), ...]."""
+    return find_references_batch([symbol], exclude_files, max_results)[symbol]
+
+
+SYMBOL_INDEX_FILE = "symbols.json"
+SYMBOL_INDEX_VERSION = 1
+# Bounds on what the symbol index keeps (oldest entries are dropped first)
+SYMBOL_INDEX_MAX_BLOBS = 5000
+SYMBOL_INDEX_MAX_TREES = 8
+
+
+def git_blob_hash(data: bytes) -> str:
+    """Object id `git hash-object` would give this content (no filters)."""
+    import hashlib
+
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def reference_tree_signature() -> Optional[str]:
+    """Hash identifying the content git grep searches for references.
+
+    Staged blob ids of all REFERENCE_GLOBS files, plus in-process blob
+    hashes of files with unstaged edits. None if git is unavailable.
+    """
+    import hashlib
+    import subprocess
+
     repo_root = get_repo_root()
     try:
-        result = subprocess.run(
-            [
-                "git",
-                "grep",
-                "-n",
-                "-w",
-                symbol,
-                "--",
-                # Python
-                "*.py",
-                # JavaScript/TypeScript
-                "*.js",
-                "*.ts",
-                "*.tsx",
-                "*.jsx",
-                "*.mjs",
-                # Go
-                "*.go",
-                # Rust
-                "*.rs",
-                # C/C++
-                "*.c",
-                "*.h",
-                "*.cpp",
-                "*.hpp",
-                "*.cc",
-                "*.cxx",
-                # Java
-                "*.java",
-                # C#
-                "*.cs",
-            ],
+        staged = subprocess.run(
+            ["git", "ls-files", "-s", "-z", "--", *REFERENCE_GLOBS],
             capture_output=True,
-            text=True,
+            check=True,
             cwd=repo_root,
+        ).stdout
+        dirty = subprocess.run(
+            ["git", "diff", "--name-only", "-z", "--", *REFERENCE_GLOBS],
+            capture_output=True,
+            check=True,
+            cwd=repo_root,
+        ).stdout
+    except (subprocess.CalledProcessError, OSError):
+        return None
+    digest = hashlib.sha256(staged)
+    for name in sorted(filter(None, dirty.split(b"\0"))):
+        try:
+            blob = git_blob_hash((repo_root / os.fsdecode(name)).read_bytes())
+        except OSError:
+            blob = "deleted"
+        digest.update(b"\0" + name + b"\0" + blob.encode())
+    return digest.hexdigest()
+
+
+class SymbolIndex:
+    """Persistent symbol/reference cache for review context hints.
+
+    Symbols are stored per git blob id (+ extension), so a file is only
+    re-parsed when its content changes. Reference hits are stored per
+    reference_tree_signature(); a later review over the same tree only
+    greps for symbols it hasn't looked up yet. Lives in the state dir.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.symbols: dict[str, list[str]] = {}
+        self.trees: dict[str, dict[str, list]] = {}
+        self.dirty = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == SYMBOL_INDEX_VERSION:
+                self.symbols = dict(data.get("symbols") or {})
+                self.trees = dict(data.get("trees") or {})
+        except (OSError, ValueError, AttributeError, TypeError):
+            pass
+
+    def file_symbols(self, file_path: Path) -> list[str]:
+        """extract_symbols_from_file(), cached by blob id."""
+        try:
+            data = file_path.read_bytes()
+        except OSError:
+            return []
+        ext = file_path.suffix.lower()
+        key = f"{git_blob_hash(data)}{ext}"
+        if key not in self.symbols:
+            self.symbols[key] = extract_symbols(
+                data.decode("utf-8", errors="ignore"), ext
+            )
+            self.dirty = True
+        return self.symbols[key]
+
+    def references(
+        self, symbols: list[str], exclude_files: list[str], max_results: int = 3
+    ) -> dict[str, list[tuple[str, int]]]:
+        """find_references_batch(), reusing hits from earlier runs."""
+        tree = reference_tree_signature()
+        if tree is None:
+            return find_references_batch(symbols, exclude_files, max_results)
+        # Hits depend on the exclusions and cap as well as the tree
+        key = json.dumps([tree, sorted(exclude_files), max_results])
+        cached = self.trees.pop(key, {})
+        missing = [s for s in dict.fromkeys(symbols) if s not in cached]
+        if missing:
+            found = find_references_batch(missing, exclude_files, max_results)
+            cached.update({s: [list(hit) for hit in hits] for s, hits in found.items()})
+            self.dirty = True
+        # Re-insert so the most recently used trees are kept
+        self.trees[key] = cached
+        return {s: [tuple(hit) for hit in cached.get(s, [])] for s in symbols}
+
+    def save(self) -> None:
+        """Write the index if anything changed. Best-effort."""
+        if not self.dirty:
+            return
+        for key in list(self.symbols)[: -SYMBOL_INDEX_MAX_BLOBS]:
+            del self.symbols[key]
+        for key in list(self.trees)[: -SYMBOL_INDEX_MAX_TREES]:
+            del self.trees[key]
+        content = json.dumps(
+            {
+                "version": SYMBOL_INDEX_VERSION,
+                "symbols": self.symbols,
+                "trees": self.trees,
+            },
+            separators=(",", ":"),
         )
-        refs = []
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            # Format: file:line:content
-            parts = line.split(":", 2)
-            if len(parts) >= 2:
-                file_path = parts[0]
-                # Skip excluded files (the changed files themselves)
-                if file_path in exclude_files:
-                    continue
-                try:
-                    line_num = int(parts[1])
-                    refs.append((file_path, line_num))
-                except ValueError:
-                    continue
-            if len(refs) >= max_results:
-                break
-        return refs
-    except subprocess.CalledProcessError:
-        return []
+        try:
+            atomic_write(self.path, content)
+            self.dirty = False
+        except OSError:
+            pass
 
 
 def gather_context_hints(base_branch: str, max_hints: int = 15) -> str:
@@ -875,14 +1487,24 @@ def gather_context_hints(base_branch: str, max_hints: int = 15) -> str:
     hints = []
     seen_files = set(changed_files)
 
-    # Extract symbols from changed files and find references
-    for changed_file in changed_files:
-        file_path = repo_root / changed_file
-        symbols = extract_symbols_from_file(file_path)
+    # Extract symbols from changed files (limited per file), then look up
+    # references for all of them in one git grep. Both go through the
+    # symbol index, so re-reviews only redo work for changed content.
+    index = SymbolIndex(get_state_dir() / SYMBOL_INDEX_FILE)
+    file_symbols = [
+        index.file_symbols(repo_root / changed_file)[:10]
+        for changed_file in changed_files
+    ]
+    all_refs = index.references(
+        [symbol for symbols in file_symbols for symbol in symbols],
+        changed_files,
+        max_results=2,
+    )
+    index.save()
 
-        # Limit symbols per file
-        for symbol in symbols[:10]:
-            refs = find_references(symbol, changed_files, max_results=2)
+    for symbols in file_symbols:
+        for symbol in symbols:
+            refs = all_refs.get(symbol, [])
             for ref_path, ref_line in refs:
                 if ref_path not in seen_files:
                     hints.append(f"- {ref_path}:{ref_line} - references {symbol}")
@@ -905,102 +1527,310 @@ def gather_context_hints(base_branch: str, max_hints: int = 15) -> str:
 
 def require_codex() -> str:
     """Ensure codex CLI is available. Returns path to codex."""
+    import shutil
+
     codex = shutil.which("codex")
     if not codex:
         error_exit("codex not found in PATH", use_json=False, code=2)
     return codex
 
 
-def get_codex_version() -> Optional[str]:
-    """Get codex version, or None if not available."""
-    codex = shutil.which("codex")
-    if not codex:
-        return None
+def get_codex_version() -> Optional[str]:
+    """Get codex version, or None if not available."""
+    import shutil
+    import subprocess
+
+    codex = shutil.which("codex")
+    if not codex:
+        return None
+    try:
+        result = subprocess.run(
+            [codex, "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # Parse version from output like "codex 0.1.2" or "0.1.2"
+        output = result.stdout.strip()
+        match = re.search(r"(\d+\.\d+\.\d+)", output)
+        return match.group(1) if match else output
+    except subprocess.CalledProcessError:
+        return None
+
+
+# Seconds a single codex exec may run
+CODEX_EXEC_TIMEOUT = 600
+
+
+def codex_model(model: Optional[str] = None) -> str:
+    """Model priority: env > parameter > default (gpt-5.2 + high reasoning = GPT 5.2 High)."""
+    return os.environ.get("FLOW_CODEX_MODEL") or model or "gpt-5.2"
+
+
+def codex_exec_command(
+    codex: str,
+    session_id: Optional[str] = None,
+    sandbox: str = "read-only",
+    model: Optional[str] = None,
+) -> list[str]:
+    """Build the codex exec argv (resume if session_id, else a new session).
+
+    Model: FLOW_CODEX_MODEL env > parameter > default (gpt-5.2 + high reasoning).
+    The prompt is always read from stdin ('-').
+    """
+    if session_id:
+        # Resume - model already set in original session
+        return [codex, "exec", "resume", session_id, "-"]
+    effective_model = codex_model(model)
+    # New session with model + high reasoning effort
+    # --skip-git-repo-check: safe with read-only sandbox, allows reviews from /tmp etc (GH-33)
+    # Use '-' to read prompt from stdin - avoids Windows CLI length limits (GH-35)
+    return [
+        codex,
+        "exec",
+        "--model",
+        effective_model,
+        "-c",
+        'model_reasoning_effort="high"',
+        "--sandbox",
+        sandbox,
+        "--skip-git-repo-check",
+        "--json",
+        "-",
+    ]
+
+
+def run_codex_exec(
+    prompt: str,
+    session_id: Optional[str] = None,
+    sandbox: str = "read-only",
+    model: Optional[str] = None,
+    stream_path: Optional[Path] = None,
+) -> tuple[str, Optional[str], Optional[str]]:
+    """Run codex exec and return (output, thread_id, verdict).
+
+    If session_id provided, tries to resume. Falls back to new session if resume fails.
+    Model: FLOW_CODEX_MODEL env > parameter > default (gpt-5.2 + high reasoning).
+    stdout is parsed as it streams (see CodexStream) and, if stream_path is
+    given, appended there as it arrives. The verdict is the stream's, so it
+    is found even if output was truncated.
+
+    Note: Prompt is passed via stdin (using '-') to avoid Windows command-line
+    length limits (~8191 chars) and special character escaping issues. (GH-35)
+    """
+    import asyncio
+
+    try:
+        result = asyncio.run(
+            run_codex_exec_async(
+                prompt,
+                session_id=session_id,
+                sandbox=sandbox,
+                model=model,
+                stream_path=stream_path,
+            )
+        )
+    except ReviewError as e:
+        error_exit(str(e), use_json=False, code=2)
+    return result.output, result.thread_id, result.verdict
+
+
+class ReviewError(Exception):
+    """A review backend call failed (non-zero exit or timeout)."""
+
+
+# Raw codex output kept for receipts; past this, only agent messages and
+# non-item events are kept (FLOW_CODEX_MAX_OUTPUT overrides, in bytes).
+# stderr is capped at the same size (its tail is kept).
+CODEX_OUTPUT_MAX_BYTES = 8 * 1024 * 1024
+CODEX_VERDICT_RE = re.compile(r"<verdict>(SHIP|NEEDS_WORK|MAJOR_RETHINK)</verdict>")
+
+
+class CodexStream:
+    """Incremental parser for `codex exec --json` stdout (JSONL).
+
+    feed() raw chunks as they arrive. The thread id and the first verdict
+    tag are picked up as soon as their line completes, giving the same
+    answers as parse_codex_thread_id / parse_codex_verdict on the full
+    output. Retained output is capped at max_bytes: beyond it, bulky
+    item events (command output, reasoning, file reads) are dropped and
+    a final {"type": "flowctl.truncated"} line records how much.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            max_bytes = int(
+                os.environ.get("FLOW_CODEX_MAX_OUTPUT", CODEX_OUTPUT_MAX_BYTES)
+            )
+        self.max_bytes = max_bytes
+        self.thread_id: Optional[str] = None
+        self.verdict: Optional[str] = None
+        self.dropped_bytes = 0
+        self._lines: list[str] = []
+        self._size = 0
+        self._pending: list[bytes] = []
+
+    def feed(self, data: bytes) -> None:
+        if b"\n" not in data:
+            self._pending.append(data)
+            return
+        self._pending.append(data)
+        *lines, rest = b"".join(self._pending).split(b"\n")
+        self._pending = [rest] if rest else []
+        for raw in lines:
+            self._add_line(raw.decode("utf-8", errors="replace") + "\n")
+
+    def close(self) -> None:
+        """Flush a trailing line without newline."""
+        if self._pending:
+            self._add_line(b"".join(self._pending).decode("utf-8", errors="replace"))
+            self._pending = []
+
+    def _add_line(self, line: str) -> None:
+        if self.verdict is None and (match := CODEX_VERDICT_RE.search(line)):
+            self.verdict = match.group(1)
+        over_budget = self._size + len(line) > self.max_bytes
+        if self.thread_id is None or over_budget:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                event = None
+            if isinstance(event, dict):
+                if (
+                    self.thread_id is None
+                    and event.get("type") == "thread.started"
+                    and "thread_id" in event
+                ):
+                    self.thread_id = event["thread_id"]
+                if over_budget:
+                    item = event.get("item")
+                    over_budget = str(event.get("type", "")).startswith("item.") and not (
+                        isinstance(item, dict) and item.get("type") == "agent_message"
+                    )
+        if over_budget:
+            self.dropped_bytes += len(line)
+            return
+        self._lines.append(line)
+        self._size += len(line)
+
+    @property
+    def output(self) -> str:
+        output = "".join(self._lines)
+        if self.dropped_bytes:
+            if output and not output.endswith("\n"):
+                output += "\n"
+            output += (
+                json.dumps({"type": "flowctl.truncated", "dropped_bytes": self.dropped_bytes})
+                + "\n"
+            )
+        return output
+
+
+async def _codex_exec_streaming(
+    cmd: list[str], prompt: str, stream_path: Optional[Path] = None
+) -> CodexStream:
+    """Run one codex exec, parsing stdout (and appending it to stream_path)
+    as it arrives.
+
+    Kills the process on timeout or cancellation. Raises ReviewError on
+    failure.
+    """
+    import asyncio
+
+    # Own process group, so cancelling also kills codex's children (which
+    # would otherwise hold the pipes open)
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=hasattr(os, "killpg"),
+    )
+    parsed = CodexStream()
+
+    async def feed() -> None:
+        proc.stdin.write(prompt.encode("utf-8"))
+        try:
+            await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        proc.stdin.close()
+
+    async def pump() -> None:
+        stream = open(stream_path, "ab") if stream_path else None
+        try:
+            while chunk := await proc.stdout.read(65536):
+                parsed.feed(chunk)
+                if stream:
+                    stream.write(chunk)
+                    stream.flush()
+        finally:
+            if stream:
+                stream.close()
+        parsed.close()
+
+    async def drain_stderr() -> bytes:
+        # Only used for the failure message; keep the tail, where errors land
+        kept = bytearray()
+        while chunk := await proc.stderr.read(65536):
+            kept += chunk
+            if len(kept) > parsed.max_bytes:
+                del kept[: len(kept) - parsed.max_bytes]
+        return bytes(kept)
+
+    async def communicate() -> list:
+        results = await asyncio.gather(feed(), pump(), drain_stderr())
+        await proc.wait()
+        return results
+
     try:
-        result = subprocess.run(
-            [codex, "--version"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        # Parse version from output like "codex 0.1.2" or "0.1.2"
-        output = result.stdout.strip()
-        match = re.search(r"(\d+\.\d+\.\d+)", output)
-        return match.group(1) if match else output
-    except subprocess.CalledProcessError:
-        return None
+        _, _, stderr = await asyncio.wait_for(communicate(), timeout=CODEX_EXEC_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise ReviewError(f"codex exec timed out ({CODEX_EXEC_TIMEOUT}s)")
+    finally:
+        if proc.returncode is None:
+            try:
+                if hasattr(os, "killpg"):
+                    os.killpg(proc.pid, 9)  # SIGKILL
+                else:
+                    proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+    if proc.returncode != 0:
+        msg = (stderr.decode("utf-8", errors="replace") or parsed.output).strip()
+        raise ReviewError(f"codex exec failed: {msg}")
+    return parsed
 
 
-def run_codex_exec(
+async def run_codex_exec_async(
     prompt: str,
     session_id: Optional[str] = None,
     sandbox: str = "read-only",
     model: Optional[str] = None,
-) -> tuple[str, Optional[str]]:
-    """Run codex exec and return (output, thread_id).
-
-    If session_id provided, tries to resume. Falls back to new session if resume fails.
-    Model: FLOW_CODEX_MODEL env > parameter > default (gpt-5.2 + high reasoning).
+    stream_path: Optional[Path] = None,
+) -> CodexStream:
+    """Async run_codex_exec(): same resume fallback, streamed stdout.
 
-    Note: Prompt is passed via stdin (using '-') to avoid Windows command-line
-    length limits (~8191 chars) and special character escaping issues. (GH-35)
+    Returns the parsed stream (output, thread_id, verdict). Raises
+    ReviewError instead of exiting, so one failed review doesn't abort a
+    batch.
     """
     codex = require_codex()
-    # Model priority: env > parameter > default (gpt-5.2 + high reasoning = GPT 5.2 High)
-    effective_model = os.environ.get("FLOW_CODEX_MODEL") or model or "gpt-5.2"
-
     if session_id:
-        # Try resume first - use stdin for prompt (model already set in original session)
-        cmd = [codex, "exec", "resume", session_id, "-"]
         try:
-            result = subprocess.run(
-                cmd,
-                input=prompt,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=600,
+            parsed = await _codex_exec_streaming(
+                codex_exec_command(codex, session_id), prompt, stream_path
             )
-            output = result.stdout
             # For resumed sessions, thread_id stays the same
-            return output, session_id
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            parsed.thread_id = session_id
+            return parsed
+        except ReviewError:
             # Resume failed - fall through to new session
             pass
-
-    # New session with model + high reasoning effort
-    # --skip-git-repo-check: safe with read-only sandbox, allows reviews from /tmp etc (GH-33)
-    # Use '-' to read prompt from stdin - avoids Windows CLI length limits (GH-35)
-    cmd = [
-        codex,
-        "exec",
-        "--model",
-        effective_model,
-        "-c",
-        'model_reasoning_effort="high"',
-        "--sandbox",
-        sandbox,
-        "--skip-git-repo-check",
-        "--json",
-        "-",
-    ]
-    try:
-        result = subprocess.run(
-            cmd,
-            input=prompt,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=600,
-        )
-        output = result.stdout
-        thread_id = parse_codex_thread_id(output)
-        return output, thread_id
-    except subprocess.TimeoutExpired:
-        error_exit("codex exec timed out (600s)", use_json=False, code=2)
-    except subprocess.CalledProcessError as e:
-        msg = (e.stderr or e.stdout or str(e)).strip()
-        error_exit(f"codex exec failed: {msg}", use_json=False, code=2)
+    return await _codex_exec_streaming(
+        codex_exec_command(codex, sandbox=sandbox, model=model), prompt, stream_path
+    )
 
 
 def parse_codex_thread_id(output: str) -> Optional[str]:
@@ -1029,17 +1859,149 @@ def parse_codex_verdict(output: str) -> Optional[str]:
     return match.group(1) if match else None
 
 
+# Review prompt size cap in UTF-8 bytes (~50k tokens); FLOW_REVIEW_PROMPT_BUDGET
+# overrides, 0 disables. Instructions are never cut; the sections below give
+# way in this order (lowest priority first), first down to their floor (a
+# fraction of the budget), then further only if still over.
+REVIEW_PROMPT_BUDGET = 200_000
+REVIEW_PROMPT_COMPACT_ORDER = (
+    ("context_hints", 0.0),
+    ("diff_summary", 0.1),
+    ("task_specs", 0.35),
+    ("spec", 0.5),
+)
+TASK_SPECS_SEPARATOR = "\n\n---\n\n"
+
+
+def env_int(name: str, default: int) -> int:
+    """Non-negative integer from the environment; default when unset or invalid."""
+    try:
+        return max(0, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def review_prompt_budget() -> int:
+    """Byte budget for review prompts (0 = unlimited)."""
+    return env_int("FLOW_REVIEW_PROMPT_BUDGET", REVIEW_PROMPT_BUDGET)
+
+
+def truncate_lines(text: str, max_bytes: int, keep_last: int = 0) -> tuple[str, int]:
+    """Cut text to about max_bytes (UTF-8) on line boundaries.
+
+    Keeps leading lines plus the last keep_last lines (e.g. the totals line
+    of `git diff --stat`), with a marker where lines were left out.
+    Returns (text, omitted line count); text is "" if nothing useful fits.
+    """
+    if len(text.encode("utf-8")) <= max_bytes:
+        return text, 0
+    lines = text.splitlines()
+    marker_reserve = 64
+    if max_bytes < marker_reserve:
+        return "", len(lines)
+    tail = lines[-keep_last:] if 0 < keep_last < len(lines) else []
+    room = max_bytes - marker_reserve - sum(len(line.encode("utf-8")) + 1 for line in tail)
+    if room < 0:
+        tail = []
+        room = max_bytes - marker_reserve
+    kept = []
+    for line in lines[: len(lines) - len(tail)]:
+        size = len(line.encode("utf-8")) + 1
+        if size > room:
+            break
+        kept.append(line)
+        room -= size
+    omitted = len(lines) - len(kept) - len(tail)
+    marker = f"[... {omitted} lines omitted to fit the review prompt budget ...]"
+    return "\n".join(kept + [marker] + tail), omitted
+
+
+def compact_task_specs(task_specs: str, max_bytes: int) -> tuple[str, int]:
+    """Shrink combined task specs to about max_bytes, fairly across tasks.
+
+    Small specs are kept whole; the rest share what is left equally and are
+    cut from the end. Each task keeps at least its `### <id>` heading.
+    """
+    parts = task_specs.split(TASK_SPECS_SEPARATOR)
+    remaining = max_bytes - len(TASK_SPECS_SEPARATOR) * (len(parts) - 1)
+    shares = {}
+    order = sorted(range(len(parts)), key=lambda i: (len(parts[i].encode("utf-8")), i))
+    for n, i in enumerate(order):
+        share = max(0, remaining) // (len(parts) - n)
+        shares[i] = min(len(parts[i].encode("utf-8")), share)
+        remaining -= shares[i]
+    out = []
+    omitted = 0
+    for i, part in enumerate(parts):
+        text, cut = truncate_lines(part, shares[i])
+        if not text:
+            heading, _, rest = part.partition("\n")
+            text = f"{heading}\n[... {cut - 1} lines omitted to fit the review prompt budget ...]"
+        out.append(text)
+        omitted += cut
+    return TASK_SPECS_SEPARATOR.join(out), omitted
+
+
+def compact_prompt_sections(
+    sections: dict[str, str], budget: int, report: Optional[list] = None
+) -> dict[str, str]:
+    """Trim prompt sections (see REVIEW_PROMPT_COMPACT_ORDER) to fit budget bytes.
+
+    Deterministic: same input, same output. Each trimmed section is
+    appended to report as {section, bytes, kept_bytes, omitted_lines}.
+    """
+    out = dict(sections)
+    sizes = {name: len(text.encode("utf-8")) for name, text in sections.items()}
+    excess = sum(sizes.values()) - budget
+    targets = dict(sizes)
+    for use_floor in (True, False):
+        for name, floor in REVIEW_PROMPT_COMPACT_ORDER:
+            if excess <= 0 or not sections.get(name):
+                continue
+            keep = int(budget * floor) if use_floor else 0
+            target = max(keep, targets[name] - excess)
+            if target < targets[name]:
+                excess -= targets[name] - target
+                targets[name] = target
+
+    for name, _ in REVIEW_PROMPT_COMPACT_ORDER:
+        if targets.get(name, 0) >= sizes.get(name, 0):
+            continue
+        if name == "task_specs":
+            new, omitted = compact_task_specs(sections[name], targets[name])
+        else:
+            new, omitted = truncate_lines(
+                sections[name], targets[name], keep_last=1 if name == "diff_summary" else 0
+            )
+        out[name] = new
+        if report is not None:
+            report.append(
+                {
+                    "section": name,
+                    "bytes": sizes[name],
+                    "kept_bytes": len(new.encode("utf-8")),
+                    "omitted_lines": omitted,
+                }
+            )
+    return out
+
+
 def build_review_prompt(
     review_type: str,
     spec_content: str,
     context_hints: str,
     diff_summary: str = "",
     task_specs: str = "",
+    budget: Optional[int] = None,
+    report: Optional[list] = None,
 ) -> str:
     """Build XML-structured review prompt for codex.
 
     review_type: 'impl' or 'plan'
     task_specs: Combined task spec content (plan reviews only)
+    budget: Max prompt bytes (default: review_prompt_budget(); 0 = no limit).
+        Over budget, sections are trimmed by compact_prompt_sections and
+        what was cut is appended to report.
 
     Uses same Carmack-level criteria as RepoPrompt workflow to ensure parity.
     """
@@ -1187,6 +2149,26 @@ Be critical. Find real issues.
 Do NOT skip this tag. The automation depends on it."""
         )
 
+    if budget is None:
+        budget = review_prompt_budget()
+    if budget:
+        # Tags and separators add ~150 bytes on top of the section bodies
+        fixed = len(instruction.encode("utf-8")) + 150
+        sections = compact_prompt_sections(
+            {
+                "context_hints": context_hints,
+                "diff_summary": diff_summary,
+                "spec": spec_content,
+                "task_specs": task_specs,
+            },
+            budget - fixed,
+            report,
+        )
+        context_hints = sections["context_hints"]
+        diff_summary = sections["diff_summary"]
+        spec_content = sections["spec"]
+        task_specs = sections["task_specs"]
+
     parts = []
 
     if context_hints:
@@ -1255,19 +2237,47 @@ After re-reading, conduct a fresh {review_type} review on the updated code.
 """
 
 
-def get_actor() -> str:
-    """Determine current actor for soft-claim semantics.
+ACTOR_CACHE_FILE = "actor.json"
 
-    Priority:
-    1. FLOW_ACTOR env var
-    2. git config user.email
-    3. git config user.name
-    4. $USER env var
-    5. "unknown"
+# Per-process actor cache: {"key": config signature, "actor", "source"}
+_actor_cache: dict[str, Any] = {}
+
+
+def _git_config_signature() -> list:
+    """Stat signature of the git config files that can set user.email/name.
+
+    Covers system, global (incl. XDG / GIT_CONFIG_GLOBAL) and repo config plus
+    the env that selects them. Files pulled in via [include] aren't tracked.
     """
-    # 1. FLOW_ACTOR env var
-    if actor := os.environ.get("FLOW_ACTOR"):
-        return actor.strip()
+    home = os.path.expanduser("~")
+    xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+    paths = [
+        os.environ.get("GIT_CONFIG_SYSTEM") or "/etc/gitconfig",
+        os.environ.get("GIT_CONFIG_GLOBAL") or os.path.join(home, ".gitconfig"),
+        os.path.join(xdg, "git", "config"),
+    ]
+    common_dir = get_git_common_dir()
+    if common_dir is not None:
+        paths.append(str(common_dir / "config"))
+    signature: list = [
+        sorted(
+            [k, v]
+            for k, v in os.environ.items()
+            if k.startswith("GIT_CONFIG") or k in ("HOME", "USER", "XDG_CONFIG_HOME")
+        )
+    ]
+    for path in paths:
+        try:
+            st = os.stat(path)
+            signature.append([path, st.st_mtime_ns, st.st_size])
+        except OSError:
+            signature.append([path, None, None])
+    return signature
+
+
+def _resolve_actor_uncached() -> tuple[str, str]:
+    """Resolve (actor, source) from git config / $USER, forking git."""
+    import subprocess
 
     # 2. git config user.email (preferred)
     try:
@@ -1275,8 +2285,8 @@ def get_actor() -> str:
             ["git", "config", "user.email"], capture_output=True, text=True, check=True
         )
         if email := result.stdout.strip():
-            return email
-    except subprocess.CalledProcessError:
+            return email, "git:user.email"
+    except (subprocess.CalledProcessError, FileNotFoundError):
         pass
 
     # 3. git config user.name
@@ -1285,16 +2295,65 @@ def get_actor() -> str:
             ["git", "config", "user.name"], capture_output=True, text=True, check=True
         )
         if name := result.stdout.strip():
-            return name
-    except subprocess.CalledProcessError:
+            return name, "git:user.name"
+    except (subprocess.CalledProcessError, FileNotFoundError):
         pass
 
     # 4. $USER env var
     if user := os.environ.get("USER"):
-        return user
+        return user, "env:USER"
 
     # 5. fallback
-    return "unknown"
+    return "unknown", "fallback"
+
+
+def resolve_actor() -> tuple[str, str, bool]:
+    """Resolve the current actor. Returns (actor, source, cached).
+
+    FLOW_ACTOR is read on every call (it may differ per request under
+    `flowctl serve`). Otherwise the git config lookup is cached in-process
+    and in <state dir>/actor.json, keyed by the config files' stat
+    signature, so editing git config re-resolves on the next call.
+    """
+    # 1. FLOW_ACTOR env var
+    if actor := os.environ.get("FLOW_ACTOR"):
+        return actor.strip(), "env:FLOW_ACTOR", False
+
+    key = _git_config_signature()
+    if _actor_cache.get("key") == key:
+        return _actor_cache["actor"], _actor_cache["source"], True
+
+    cache_path = get_state_dir() / ACTOR_CACHE_FILE
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            _actor_cache.update(cached)
+            return cached["actor"], cached["source"], True
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    actor, source = _resolve_actor_uncached()
+    _actor_cache.update({"key": key, "actor": actor, "source": source})
+    if ensure_flow_exists():
+        try:
+            atomic_write(cache_path, json.dumps(_actor_cache))
+        except OSError:
+            pass
+    return actor, source, False
+
+
+def get_actor() -> str:
+    """Determine current actor for soft-claim semantics.
+
+    Priority:
+    1. FLOW_ACTOR env var
+    2. git config user.email
+    3. git config user.name
+    4. $USER env var
+    5. "unknown"
+    """
+    return resolve_actor()[0]
 
 
 def scan_max_epic_id(flow_dir: Path) -> int:
@@ -1483,53 +2542,215 @@ def clear_task_evidence(task_id: str) -> None:
         atomic_write(spec_path, new_content)
 
 
-def find_dependents(task_id: str, same_epic: bool = False) -> list[str]:
-    """Find tasks that depend on task_id (recursive). Returns list of dependent task IDs."""
-    flow_dir = get_flow_dir()
-    tasks_dir = flow_dir / TASKS_DIR
-    if not tasks_dir.exists():
-        return []
-
-    epic_id = epic_id_from_task(task_id) if same_epic else None
-    dependents: set[str] = set()  # Use set to avoid duplicates
-    to_check = [task_id]
-    checked = set()
+class TaskGraph:
+    """Task dependency graph, built once and shared by graph queries.
 
-    while to_check:
-        checking = to_check.pop(0)
-        if checking in checked:
-            continue
-        checked.add(checking)
+    deps maps task -> tasks it depends on (legacy "deps" included);
+    dependents is the reverse adjacency. Replaces per-node rescans of
+    every task file.
+    """
 
-        for task_file in tasks_dir.glob("fn-*.json"):
-            if "." not in task_file.stem:
+    def __init__(self, tasks: dict[str, dict]):
+        self.tasks = tasks
+        self.deps: dict[str, list[str]] = {}
+        self.dependents: dict[str, list[str]] = {}
+        for tid, task in tasks.items():
+            # Support both legacy "deps" and current "depends_on"
+            deps = task.get("depends_on", task.get("deps", [])) or []
+            self.deps[tid] = deps
+            for dep in deps:
+                self.dependents.setdefault(dep, []).append(tid)
+
+    @classmethod
+    def from_definitions(cls) -> "TaskGraph":
+        """Build from all task definition files (unreadable files skipped)."""
+        tasks_dir = get_flow_dir() / TASKS_DIR
+        tasks: dict[str, dict] = {}
+        try:
+            names = sorted(os.listdir(tasks_dir))
+        except FileNotFoundError:
+            return cls(tasks)
+        for name in names:
+            stem = name[: -len(".json")]
+            if not (name.startswith("fn-") and name.endswith(".json")) or "." not in stem:
                 continue
             try:
-                task_data = load_json(task_file)
-                tid = task_data.get("id", task_file.stem)
+                task_data = load_json_cached(tasks_dir / name)
+                tasks[task_data.get("id", stem)] = task_data
+            except Exception:
+                pass
+        return cls(tasks)
+
+    def find_dependents(self, task_id: str, same_epic: bool = False) -> list[str]:
+        """Tasks that depend on task_id, transitively (BFS over reverse edges)."""
+
+        def _epic_of(tid: str) -> Optional[str]:
+            try:
+                return epic_id_from_task(tid)
+            except ValueError:
+                return None  # Artifact files never match
+
+        epic_id = epic_id_from_task(task_id) if same_epic else None
+        dependents: set[str] = set()
+        checked = {task_id}
+        to_check = deque([task_id])
+        while to_check:
+            checking = to_check.popleft()
+            for tid in self.dependents.get(checking, []):
                 if tid in checked or tid in dependents:
                     continue
                 # Skip if same_epic filter and different epic
-                if same_epic and epic_id_from_task(tid) != epic_id:
+                if same_epic and _epic_of(tid) != epic_id:
                     continue
-                # Support both legacy "deps" and current "depends_on"
-                deps = task_data.get("depends_on", task_data.get("deps", []))
-                if checking in deps:
-                    dependents.add(tid)
-                    to_check.append(tid)
-            except Exception:
-                pass
+                dependents.add(tid)
+                checked.add(tid)
+                to_check.append(tid)
+        return sorted(dependents)
+
+    def find_cycle(self) -> list[str]:
+        """First dependency cycle found by DFS in task order, or [].
+
+        Iterative so long dependency chains don't hit the recursion limit.
+        """
+        visited: set[str] = set()
+        for root in self.tasks:
+            if root in visited:
+                continue
+            visited.add(root)
+            path = [root]
+            on_path = {root}
+            stack = [iter(self.deps.get(root, []))]
+            while stack:
+                for dep in stack[-1]:
+                    if dep not in visited:
+                        visited.add(dep)
+                        path.append(dep)
+                        on_path.add(dep)
+                        stack.append(iter(self.deps.get(dep, [])))
+                        break
+                    if dep in on_path:
+                        return path + [dep]
+                else:
+                    stack.pop()
+                    on_path.discard(path.pop())
+        return []
 
-    return sorted(dependents)
+
+def find_dependents(task_id: str, same_epic: bool = False) -> list[str]:
+    """Find tasks that depend on task_id (recursive). Returns list of dependent task IDs."""
+    return TaskGraph.from_definitions().find_dependents(task_id, same_epic=same_epic)
 
 
 # --- Ralph Run Detection ---
 
 
+RUN_STATE_FILE = "run-state.json"
+# Append-only JSON Lines log per run, written by ralph.sh (run/iteration/
+# selector events) and flowctl (review events): {"ts", "run", "event", ...}
+RUN_EVENTS_FILE = "events.jsonl"
+RALPH_RUNS_CACHE_FILE = "ralph-runs.json"
+# Progress details and the completion block are always near the end
+PROGRESS_TAIL_BYTES = 16 * 1024
+PROGRESS_ITER_RE = re.compile(r"\biter(?:ation)?[:\s=]+(\d+)", re.IGNORECASE)
+PROGRESS_EPIC_RE = re.compile(r"\bepic[:\s=]+(fn-[\w-]+)", re.IGNORECASE)
+PROGRESS_TASK_RE = re.compile(r"\btask[:\s=]+(fn-[\w.-]+\.\d+)", re.IGNORECASE)
+
+
+def read_tail(path: Path, max_bytes: int) -> str:
+    """Last max_bytes of a file, decoded leniently."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - max_bytes))
+        return f.read().decode("utf-8", errors="replace")
+
+
+def read_run_progress(run_dir: Path) -> Optional[dict]:
+    """Current iteration/epic/task of a Ralph run, and whether it finished.
+
+    Prefers the run-state.json sidecar ralph.sh rewrites every iteration;
+    falls back to the tail of progress.txt (latest match wins) for runs
+    started by older scripts. Returns None if the run has no progress yet.
+    """
+    state_file = run_dir / RUN_STATE_FILE
+    try:
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+        return {
+            "iteration": state.get("iteration") or None,
+            "current_epic": state.get("epic"),
+            "current_task": state.get("task"),
+            "completed": bool(state.get("completed")),
+        }
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        content = read_tail(run_dir / "progress.txt", PROGRESS_TAIL_BYTES)
+    except OSError:
+        return None
+
+    def last(pattern: re.Pattern) -> Optional[str]:
+        matches = pattern.findall(content)
+        return matches[-1] if matches else None
+
+    iteration = last(PROGRESS_ITER_RE)
+    return {
+        "iteration": int(iteration) if iteration else None,
+        "current_epic": last(PROGRESS_EPIC_RE),
+        "current_task": last(PROGRESS_TASK_RE),
+        # Require both completion_reason= AND promise=COMPLETE to avoid
+        # false positives from per-iteration promise= logging
+        "completed": "completion_reason=" in content and "promise=COMPLETE" in content,
+    }
+
+
+def ralph_run_alive(run_dir: Path) -> Optional[bool]:
+    """Whether the ralph.sh that owns run_dir is still running.
+
+    Uses the pid/host ralph.sh records in run-state.json. None when that
+    can't be told (run from an older script, or on another host).
+    """
+    import socket
+
+    try:
+        state = json.loads((run_dir / RUN_STATE_FILE).read_text(encoding="utf-8"))
+        if state.get("completed"):
+            return False
+        pid = int(state["pid"])
+        host = state.get("host")
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+    if host and host != socket.gethostname():
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by someone else
+    return True
+
+
+def _run_signature(run_dir: Path) -> Optional[list]:
+    """Stat signature of whichever file decides a run's state."""
+    for name in (RUN_STATE_FILE, "progress.txt"):
+        try:
+            st = (run_dir / name).stat()
+        except OSError:
+            continue
+        return [name, st.st_mtime_ns, st.st_size]
+    return None
+
+
 def find_active_runs() -> list[dict]:
     """
-    Find active Ralph runs by scanning scripts/ralph/runs/*/progress.txt.
-    A run is active if progress.txt exists AND does NOT contain 'promise=COMPLETE'.
+    Find active Ralph runs under scripts/ralph/runs/.
+    A run is active if it has progress (run-state.json or progress.txt)
+    and has not written its completion marker.
+
+    Finished runs are remembered in <state dir>/ralph-runs.json by file
+    stat, so each costs one stat() on later calls; active runs read only
+    the small sidecar (or the progress.txt tail).
     Returns list of dicts with run info.
     """
     repo_root = get_repo_root()
@@ -1539,49 +2760,91 @@ def find_active_runs() -> list[dict]:
     if not runs_dir.exists():
         return active_runs
 
-    for run_dir in runs_dir.iterdir():
+    cache_path = get_state_dir() / RALPH_RUNS_CACHE_FILE
+    try:
+        finished = json.loads(cache_path.read_text(encoding="utf-8")).get("finished", {})
+    except (OSError, ValueError, AttributeError):
+        finished = {}
+    still_finished = {}
+
+    for run_dir in sorted(runs_dir.iterdir()):
         if not run_dir.is_dir():
             continue
-        progress_file = run_dir / "progress.txt"
-        if not progress_file.exists():
+        signature = _run_signature(run_dir)
+        if signature is None:
+            continue
+        if finished.get(run_dir.name) == signature:
+            still_finished[run_dir.name] = signature
             continue
 
-        content = progress_file.read_text(encoding="utf-8", errors="replace")
-
-        # Run is complete if it contains the completion marker block
-        # Require both completion_reason= AND promise=COMPLETE to avoid
-        # false positives from per-iteration promise= logging
-        if "completion_reason=" in content and "promise=COMPLETE" in content:
+        progress = read_run_progress(run_dir)
+        if progress is None:
+            continue
+        if progress["completed"]:
+            still_finished[run_dir.name] = signature
             continue
 
-        # Parse progress info from content
-        run_info = {
-            "id": run_dir.name,
-            "path": str(run_dir),
-            "iteration": None,
-            "current_epic": None,
-            "current_task": None,
-            "paused": (run_dir / "PAUSE").exists(),
-            "stopped": (run_dir / "STOP").exists(),
-        }
+        active_runs.append(
+            {
+                "id": run_dir.name,
+                "path": str(run_dir),
+                "iteration": progress["iteration"],
+                "current_epic": progress["current_epic"],
+                "current_task": progress["current_task"],
+                "paused": (run_dir / "PAUSE").exists(),
+                "stopped": (run_dir / "STOP").exists(),
+            }
+        )
+
+    if still_finished != finished:
+        try:
+            atomic_write_json(cache_path, {"finished": still_finished})
+        except OSError:
+            pass  # cache is best-effort
+
+    return active_runs
 
-        # Extract iteration number (format: "iteration: N" or "Iteration N")
-        iter_match = re.search(r"iteration[:\s]+(\d+)", content, re.IGNORECASE)
-        if iter_match:
-            run_info["iteration"] = int(iter_match.group(1))
 
-        # Extract current epic/task (format varies, try common patterns)
-        epic_match = re.search(r"epic[:\s]+(fn-[\w-]+)", content, re.IGNORECASE)
-        if epic_match:
-            run_info["current_epic"] = epic_match.group(1)
+def append_run_event(run_dir: Path, event: str, **fields: Any) -> None:
+    """Append one event to a run's events.jsonl (single write, O_APPEND)."""
+    from datetime import datetime, timezone
 
-        task_match = re.search(r"task[:\s]+(fn-[\w.-]+\.\d+)", content, re.IGNORECASE)
-        if task_match:
-            run_info["current_task"] = task_match.group(1)
+    record = {
+        "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "run": run_dir.name,
+        "event": event,
+        **fields,
+    }
+    line = json.dumps(record, separators=(",", ":")) + "\n"
+    with open(run_dir / RUN_EVENTS_FILE, "a", encoding="utf-8") as f:
+        f.write(line)
 
-        active_runs.append(run_info)
 
-    return active_runs
+def log_review_event(
+    review: dict,
+    verdict: Optional[str],
+    cached: bool,
+    duration_ms: int,
+    status: str = "done",
+) -> None:
+    """Record a review in the current Ralph run's event log, if inside one."""
+    run_dir = os.environ.get("RALPH_RUN_DIR")
+    if not run_dir or not os.path.isdir(run_dir):
+        return
+    try:
+        append_run_event(
+            Path(run_dir),
+            "review",
+            type=review["type"],
+            id=review["id"],
+            backend="codex",
+            status=status,
+            verdict=verdict,
+            cached=cached,
+            duration_ms=duration_ms,
+        )
+    except OSError:
+        pass  # never fail a review over its log line
 
 
 def find_active_run(
@@ -1723,7 +2986,7 @@ def cmd_status(args: argparse.Namespace) -> None:
         if epics_dir.exists():
             for epic_file in epics_dir.glob("fn-*.json"):
                 try:
-                    epic_data = load_json(epic_file)
+                    epic_data = load_json_cached(epic_file)
                     status = epic_data.get("status", "open")
                     if status in epic_counts:
                         epic_counts[status] += 1
@@ -1731,19 +2994,11 @@ def cmd_status(args: argparse.Namespace) -> None:
                     pass
 
         if tasks_dir.exists():
-            for task_file in tasks_dir.glob("fn-*.json"):
-                # Skip non-task files (must have . before .json)
-                task_id = task_file.stem
-                if "." not in task_id:
-                    continue
-                try:
-                    # Use merged state for accurate status counts
-                    task_data = load_task_with_state(task_id, use_json=True)
-                    status = task_data.get("status", "todo")
-                    if status in task_counts:
-                        task_counts[status] += 1
-                except Exception:
-                    pass
+            # Use merged state for accurate status counts
+            for task_data in load_tasks_with_state(use_json=True).values():
+                status = task_data.get("status", "todo")
+                if status in task_counts:
+                    task_counts[status] += 1
 
     # Get active runs
     active_runs = find_active_runs()
@@ -1840,23 +3095,11 @@ def cmd_ralph_status(args: argparse.Namespace) -> None:
     paused = (run_dir / "PAUSE").exists()
     stopped = (run_dir / "STOP").exists()
 
-    # Read progress.txt for more info
-    progress_file = run_dir / "progress.txt"
-    iteration = None
-    current_epic = None
-    current_task = None
-
-    if progress_file.exists():
-        content = progress_file.read_text(encoding="utf-8", errors="replace")
-        iter_match = re.search(r"iteration[:\s]+(\d+)", content, re.IGNORECASE)
-        if iter_match:
-            iteration = int(iter_match.group(1))
-        epic_match = re.search(r"epic[:\s]+(fn-[\w-]+)", content, re.IGNORECASE)
-        if epic_match:
-            current_epic = epic_match.group(1)
-        task_match = re.search(r"task[:\s]+(fn-[\w.-]+\.\d+)", content, re.IGNORECASE)
-        if task_match:
-            current_task = task_match.group(1)
+    # Read run-state.json / progress.txt tail for more info
+    progress = read_run_progress(run_dir) or {}
+    iteration = progress.get("iteration")
+    current_epic = progress.get("current_epic")
+    current_task = progress.get("current_task")
 
     if args.json:
         json_output(
@@ -1886,6 +3129,87 @@ def cmd_ralph_status(args: argparse.Namespace) -> None:
         print(f"{run_id} ({iter_info}{task_info}){state_str}")
 
 
+def format_run_event(record: dict) -> str:
+    """One-line human form of a run event: ts event key=value ..."""
+    fields = " ".join(
+        f"{k}={v}"
+        for k, v in record.items()
+        if k not in ("ts", "run", "event") and v is not None
+    )
+    return f"{record.get('ts', '?')} {record.get('event', '?')} {fields}".rstrip()
+
+
+def cmd_ralph_events(args: argparse.Namespace) -> None:
+    """Print a Ralph run's event log, optionally following it."""
+    runs_dir = get_repo_root() / "scripts" / "ralph" / "runs"
+    if args.run and (runs_dir / args.run).is_dir():
+        run_dir = runs_dir / args.run  # finished runs too
+    else:
+        _, run_dir = find_active_run(args.run, use_json=args.json)
+    if args.tail is not None and args.tail < 0:
+        error_exit("--tail must be >= 0", use_json=args.json)
+    events_path = run_dir / RUN_EVENTS_FILE
+    wanted = set(args.event or [])
+    done = False
+
+    def parse(chunk: bytes) -> list[tuple[str, dict]]:
+        nonlocal done
+        records = []
+        for line in chunk.decode("utf-8", errors="replace").splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # torn or foreign line
+            if record.get("event") == "run_end":
+                done = True
+            if not wanted or record.get("event") in wanted:
+                records.append((line, record))
+        return records
+
+    def emit(records: list[tuple[str, dict]]) -> None:
+        for line, record in records:
+            print(line if args.json else format_run_event(record), flush=True)
+
+    try:
+        with open(events_path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        data = b""
+    # Only complete lines; a partial last line is picked up when following
+    pos = data.rfind(b"\n") + 1
+    records = parse(data[:pos])
+    if args.tail is not None:
+        records = records[-args.tail :] if args.tail else []
+    emit(records)
+
+    if not args.follow:
+        return
+    try:
+        while not done:
+            time.sleep(0.5)
+            # A run killed by a signal or `set -e` never writes run_end; stop
+            # once its ralph.sh is gone (after one last read)
+            gone = ralph_run_alive(run_dir) is False
+            try:
+                with open(events_path, "rb") as f:
+                    f.seek(pos)
+                    chunk = f.read()
+            except FileNotFoundError:
+                chunk = b""
+            end = chunk.rfind(b"\n") + 1
+            pos += end
+            emit(parse(chunk[:end]))
+            if gone and not done:
+                print(
+                    f"ralph events: run {run_dir.name} ended without run_end "
+                    "(ralph.sh is no longer running)",
+                    file=sys.stderr,
+                )
+                break
+    except KeyboardInterrupt:
+        pass
+
+
 def cmd_config_get(args: argparse.Namespace) -> None:
     """Get a config value."""
     if not ensure_flow_exists():
@@ -2060,6 +3384,8 @@ def require_memory_enabled(args) -> Path:
 
 def cmd_memory_add(args: argparse.Namespace) -> None:
     """Add a memory entry manually."""
+    from datetime import datetime
+
     memory_dir = require_memory_enabled(args)
 
     # Map type to file
@@ -2087,8 +3413,6 @@ def cmd_memory_add(args: argparse.Namespace) -> None:
         )
 
     # Format entry
-    from datetime import datetime
-
     today = datetime.utcnow().strftime("%Y-%m-%d")
 
     # Normalize type name
@@ -2452,11 +3776,9 @@ def cmd_show(args: argparse.Namespace) -> None:
         tasks = []
         tasks_dir = flow_dir / TASKS_DIR
         if tasks_dir.exists():
-            for task_file in sorted(tasks_dir.glob(f"{args.id}.*.json")):
-                task_id = task_file.stem
-                if "." not in task_id:
-                    continue  # Skip non-task files
-                task_data = load_task_with_state(task_id, use_json=args.json)
+            for task_data in load_tasks_with_state(
+                f"{args.id}.*.json", use_json=args.json
+            ).values():
                 if "id" not in task_data:
                     continue  # Skip artifact files (GH-21)
                 tasks.append(
@@ -2525,25 +3847,21 @@ def cmd_epics(args: argparse.Namespace) -> None:
 
     epics = []
     if epics_dir.exists():
+        # Count tasks per epic (with merged runtime state) in one pass
+        task_counts: dict[str, list[int]] = {}
+        for task_id, task_data in load_tasks_with_state(use_json=args.json).items():
+            counts = task_counts.setdefault(task_id.split(".", 1)[0], [0, 0])
+            counts[0] += 1
+            if task_data.get("status") == "done":
+                counts[1] += 1
+
         for epic_file in sorted(epics_dir.glob("fn-*.json")):
             epic_data = normalize_epic(
-                load_json_or_exit(
+                load_json_indexed(
                     epic_file, f"Epic {epic_file.stem}", use_json=args.json
                 )
             )
-            # Count tasks (with merged runtime state)
-            tasks_dir = flow_dir / TASKS_DIR
-            task_count = 0
-            done_count = 0
-            if tasks_dir.exists():
-                for task_file in tasks_dir.glob(f"{epic_data['id']}.*.json"):
-                    task_id = task_file.stem
-                    if "." not in task_id:
-                        continue
-                    task_data = load_task_with_state(task_id, use_json=args.json)
-                    task_count += 1
-                    if task_data.get("status") == "done":
-                        done_count += 1
+            task_count, done_count = task_counts.get(epic_data["id"], (0, 0))
 
             epics.append(
                 {
@@ -2589,13 +3907,8 @@ def cmd_tasks(args: argparse.Namespace) -> None:
     tasks = []
     if tasks_dir.exists():
         pattern = f"{args.epic}.*.json" if args.epic else "fn-*.json"
-        for task_file in sorted(tasks_dir.glob(pattern)):
-            # Skip if it's not a task file (must have . in the name before .json)
-            task_id = task_file.stem
-            if "." not in task_id:
-                continue
-            # Load task with merged runtime state
-            task_data = load_task_with_state(task_id, use_json=args.json)
+        # Load tasks with merged runtime state
+        for task_data in load_tasks_with_state(pattern, use_json=args.json).values():
             if "id" not in task_data:
                 continue  # Skip artifact files (GH-21)
             # Filter by status if requested
@@ -2655,7 +3968,7 @@ def cmd_list(args: argparse.Namespace) -> None:
     if epics_dir.exists():
         for epic_file in sorted(epics_dir.glob("fn-*.json")):
             epic_data = normalize_epic(
-                load_json_or_exit(
+                load_json_indexed(
                     epic_file, f"Epic {epic_file.stem}", use_json=args.json
                 )
             )
@@ -2672,11 +3985,7 @@ def cmd_list(args: argparse.Namespace) -> None:
     tasks_by_epic = {}
     all_tasks = []
     if tasks_dir.exists():
-        for task_file in sorted(tasks_dir.glob("fn-*.json")):
-            task_id = task_file.stem
-            if "." not in task_id:
-                continue
-            task_data = load_task_with_state(task_id, use_json=args.json)
+        for task_data in load_tasks_with_state(use_json=args.json).values():
             if "id" not in task_data or "epic" not in task_data:
                 continue  # Skip artifact files (GH-21)
             epic_id = task_data["epic"]
@@ -3312,11 +4621,9 @@ def cmd_ready(args: argparse.Namespace) -> None:
             use_json=args.json,
         )
     tasks = {}
-    for task_file in tasks_dir.glob(f"{args.epic}.*.json"):
-        task_id = task_file.stem
-        if "." not in task_id:
-            continue
-        task_data = load_task_with_state(task_id, use_json=args.json)
+    for task_data in load_tasks_with_state(
+        f"{args.epic}.*.json", use_json=args.json
+    ).values():
         if "id" not in task_data:
             continue  # Skip artifact files (GH-21)
         tasks[task_data["id"]] = task_data
@@ -3445,24 +4752,107 @@ def cmd_next(args: argparse.Namespace) -> None:
                     epic_ids.append(epic_file.stem)  # Use full ID from filename
         epic_ids.sort(key=lambda e: parse_id(e)[0] or 0)
 
-    current_actor = get_actor()
+    if args.limit is not None and args.limit < 1:
+        error_exit("--limit must be >= 1", use_json=args.json)
+
+    units, blocked_epics = schedule_next_units(
+        epic_ids,
+        current_actor=get_actor(),
+        require_plan_review=args.require_plan_review,
+        limit=args.limit or 1,
+        strict=bool(args.epics_file),
+        use_json=args.json,
+    )
+
+    if args.json:
+        if units:
+            payload = dict(units[0])
+        else:
+            payload = {"status": "none", "epic": None, "task": None, "reason": "none"}
+            if blocked_epics:
+                payload["reason"] = "blocked_by_epic_deps"
+                payload["blocked_epics"] = blocked_epics
+        if args.limit is not None:
+            payload["units"] = units
+        json_output(payload)
+    else:
+        for unit in units:
+            target = unit["task"] or unit["epic"]
+            print(f"{unit['status']} {target} {unit['reason']}")
+        if not units:
+            if blocked_epics:
+                print("none blocked_by_epic_deps")
+                for epic_id, deps in blocked_epics.items():
+                    print(f"  {epic_id}: {', '.join(deps)}")
+            else:
+                print("none")
+
+
+def schedule_next_units(
+    epic_ids: list[str],
+    current_actor: str,
+    require_plan_review: bool = False,
+    limit: int = 1,
+    strict: bool = False,
+    use_json: bool = True,
+) -> tuple[list[dict], dict[str, list[str]]]:
+    """Pick up to `limit` plan/work units across epics in priority order.
+
+    Epics are visited in the given order; each epic and task is loaded once
+    (all tasks in one pass on first need). Per open, unblocked epic the
+    units are: plan (needs_plan_review), else the actor's in_progress tasks
+    (resume_in_progress) followed by todo tasks whose deps are done (ready_task),
+    each sorted by priority then task number.
+
+    Returns (units, blocked_epics). strict makes a missing epic an error
+    (explicit --epics-file lists).
+    """
+    flow_dir = get_flow_dir()
+    epics_dir = flow_dir / EPICS_DIR
+    epic_cache: dict[str, Optional[dict]] = {}
+
+    def get_epic(epic_id: str) -> Optional[dict]:
+        if epic_id not in epic_cache:
+            epic_path = epics_dir / f"{epic_id}.json"
+            epic_cache[epic_id] = (
+                normalize_epic(
+                    load_json_indexed(epic_path, f"Epic {epic_id}", use_json=use_json)
+                )
+                if epic_path.exists()
+                else None
+            )
+        return epic_cache[epic_id]
+
+    tasks_by_epic: Optional[dict[str, dict[str, dict]]] = None
+
+    def get_epic_tasks(epic_id: str) -> dict[str, dict]:
+        nonlocal tasks_by_epic
+        if tasks_by_epic is None:
+            if not (flow_dir / TASKS_DIR).exists():
+                error_exit(
+                    f"{TASKS_DIR}/ missing. Run 'flowctl init' or fix repo state.",
+                    use_json=use_json,
+                )
+            tasks_by_epic = group_tasks_by_epic(load_tasks_with_state(use_json=use_json))
+        return tasks_by_epic.get(epic_id, {})
 
     def sort_key(t: dict) -> tuple[int, int]:
         _, task_num = parse_id(t["id"])
         return (task_priority(t), task_num if task_num is not None else 0)
 
+    units: list[dict] = []
     blocked_epics: dict[str, list[str]] = {}
 
+    def add(status: str, epic_id: str, task_id: Optional[str], reason: str) -> bool:
+        units.append({"status": status, "epic": epic_id, "task": task_id, "reason": reason})
+        return len(units) >= limit
+
     for epic_id in epic_ids:
-        epic_path = flow_dir / EPICS_DIR / f"{epic_id}.json"
-        if not epic_path.exists():
-            if args.epics_file:
-                error_exit(f"Epic {epic_id} not found", use_json=args.json)
+        epic_data = get_epic(epic_id)
+        if epic_data is None:
+            if strict:
+                error_exit(f"Epic {epic_id} not found", use_json=use_json)
             continue
-
-        epic_data = normalize_epic(
-            load_json_or_exit(epic_path, f"Epic {epic_id}", use_json=args.json)
-        )
         if epic_data.get("status") == "done":
             continue
 
@@ -3471,118 +4861,55 @@ def cmd_next(args: argparse.Namespace) -> None:
         for dep in epic_data.get("depends_on_epics", []) or []:
             if dep == epic_id:
                 continue
-            dep_path = flow_dir / EPICS_DIR / f"{dep}.json"
-            if not dep_path.exists():
-                blocked_by.append(dep)
-                continue
-            dep_data = normalize_epic(
-                load_json_or_exit(dep_path, f"Epic {dep}", use_json=args.json)
-            )
-            if dep_data.get("status") != "done":
+            dep_data = get_epic(dep)
+            if dep_data is None or dep_data.get("status") != "done":
                 blocked_by.append(dep)
         if blocked_by:
             blocked_epics[epic_id] = blocked_by
             continue
 
-        if args.require_plan_review and epic_data.get("plan_review_status") != "ship":
-            if args.json:
-                json_output(
-                    {
-                        "status": "plan",
-                        "epic": epic_id,
-                        "task": None,
-                        "reason": "needs_plan_review",
-                    }
-                )
-            else:
-                print(f"plan {epic_id} needs_plan_review")
-            return
-
-        tasks_dir = flow_dir / TASKS_DIR
-        if not tasks_dir.exists():
-            error_exit(
-                f"{TASKS_DIR}/ missing. Run 'flowctl init' or fix repo state.",
-                use_json=args.json,
-            )
+        if require_plan_review and epic_data.get("plan_review_status") != "ship":
+            if add("plan", epic_id, None, "needs_plan_review"):
+                break
+            continue
 
-        tasks: dict[str, dict] = {}
-        for task_file in tasks_dir.glob(f"{epic_id}.*.json"):
-            task_id = task_file.stem
-            if "." not in task_id:
-                continue
-            # Load task with merged runtime state
-            task_data = load_task_with_state(task_id, use_json=args.json)
-            if "id" not in task_data:
-                continue  # Skip artifact files (GH-21)
-            tasks[task_data["id"]] = task_data
+        tasks = get_epic_tasks(epic_id)
 
         # Resume in_progress tasks owned by current actor
-        in_progress = [
-            t
-            for t in tasks.values()
-            if t.get("status") == "in_progress" and t.get("assignee") == current_actor
-        ]
-        in_progress.sort(key=sort_key)
-        if in_progress:
-            task_id = in_progress[0]["id"]
-            if args.json:
-                json_output(
-                    {
-                        "status": "work",
-                        "epic": epic_id,
-                        "task": task_id,
-                        "reason": "resume_in_progress",
-                    }
-                )
-            else:
-                print(f"work {task_id} resume_in_progress")
-            return
-
+        in_progress = sorted(
+            (
+                t
+                for t in tasks.values()
+                if t.get("status") == "in_progress"
+                and t.get("assignee") == current_actor
+            ),
+            key=sort_key,
+        )
         # Ready tasks by deps + priority
-        ready: list[dict] = []
-        for task in tasks.values():
-            if task.get("status") != "todo":
-                continue
-            if task.get("status") == "blocked":
-                continue
-            deps_done = True
-            for dep in task.get("depends_on", []):
-                dep_task = tasks.get(dep)
-                if not dep_task or dep_task.get("status") != "done":
-                    deps_done = False
-                    break
-            if deps_done:
-                ready.append(task)
-
-        ready.sort(key=sort_key)
-        if ready:
-            task_id = ready[0]["id"]
-            if args.json:
-                json_output(
-                    {
-                        "status": "work",
-                        "epic": epic_id,
-                        "task": task_id,
-                        "reason": "ready_task",
-                    }
+        ready = sorted(
+            (
+                t
+                for t in tasks.values()
+                if t.get("status") == "todo"
+                and all(
+                    tasks.get(dep, {}).get("status") == "done"
+                    for dep in t.get("depends_on", [])
                 )
-            else:
-                print(f"work {task_id} ready_task")
-            return
+            ),
+            key=sort_key,
+        )
+        done = False
+        for t in in_progress:
+            if done := add("work", epic_id, t["id"], "resume_in_progress"):
+                break
+        if not done:
+            for t in ready:
+                if done := add("work", epic_id, t["id"], "ready_task"):
+                    break
+        if done:
+            break
 
-    if args.json:
-        payload = {"status": "none", "epic": None, "task": None, "reason": "none"}
-        if blocked_epics:
-            payload["reason"] = "blocked_by_epic_deps"
-            payload["blocked_epics"] = blocked_epics
-        json_output(payload)
-    else:
-        if blocked_epics:
-            print("none blocked_by_epic_deps")
-            for epic_id, deps in blocked_epics.items():
-                print(f"  {epic_id}: {', '.join(deps)}")
-        else:
-            print("none")
+    return units, blocked_epics
 
 
 def cmd_start(args: argparse.Namespace) -> None:
@@ -3872,24 +5199,61 @@ def cmd_block(args: argparse.Namespace) -> None:
         print(f"Task {args.id} blocked")
 
 
+def cmd_whoami(args: argparse.Namespace) -> None:
+    """Show the resolved actor and where it came from."""
+    actor, source, cached = resolve_actor()
+    if args.json:
+        json_output({"actor": actor, "source": source, "cached": cached})
+    else:
+        print(f"{actor} ({source}{', cached' if cached else ''})")
+
+
 def cmd_state_path(args: argparse.Namespace) -> None:
     """Show resolved state directory path."""
+    import shlex
+
     state_dir = get_state_dir()
 
+    if getattr(args, "export", False):
+        # Shell exports so orchestrators resolve paths once per run:
+        #   eval "$(flowctl state-path --export)"
+        state_env = os.environ.get("FLOW_STATE_DIR", "")
+        scheme = SQLITE_STATE_SCHEME if state_env.startswith(SQLITE_STATE_SCHEME) else ""
+        exports = {
+            "FLOW_REPO_ROOT": get_repo_root(),
+            "FLOW_GIT_COMMON_DIR": get_git_common_dir(),
+            "FLOW_STATE_DIR": f"{scheme}{state_dir}",
+        }
+        for key, value in exports.items():
+            if value is not None:
+                print(f"export {key}={shlex.quote(str(value))}")
+        return
+
     if args.task:
         if not is_task_id(args.task):
             error_exit(
                 f"Invalid task ID: {args.task}. Expected format: fn-N.M or fn-N-xxx.M",
                 use_json=args.json,
             )
-        state_path = state_dir / "tasks" / f"{args.task}.state.json"
+        store = get_state_store()
+        if isinstance(store, SqliteStateStore):
+            # All tasks share one database row-per-task
+            state_path = store.db_path
+        else:
+            state_path = state_dir / "tasks" / f"{args.task}.state.json"
         if args.json:
-            json_output({"state_dir": str(state_dir), "task_state_path": str(state_path)})
+            json_output(
+                {
+                    "state_dir": str(state_dir),
+                    "backend": get_state_backend(),
+                    "task_state_path": str(state_path),
+                }
+            )
         else:
             print(state_path)
     else:
         if args.json:
-            json_output({"state_dir": str(state_dir)})
+            json_output({"state_dir": str(state_dir), "backend": get_state_backend()})
         else:
             print(state_dir)
 
@@ -3908,6 +5272,33 @@ def cmd_migrate_state(args: argparse.Namespace) -> None:
     migrated = []
     skipped = []
 
+    if args.from_files:
+        # Import per-task JSON state files into the SQLite store
+        if not isinstance(store, SqliteStateStore):
+            error_exit(
+                "--from-files requires the sqlite state backend "
+                "(config state.backend=sqlite or FLOW_STATE_DIR=sqlite:<dir>)",
+                use_json=args.json,
+            )
+        file_store = LocalFileStateStore(get_state_dir())
+        # One transaction for the whole import
+        with store.lock_task("*"):
+            for task_id in sorted(file_store.list_runtime_files()):
+                runtime = file_store.load_runtime(task_id)
+                if runtime is None or store.load_runtime(task_id) is not None:
+                    skipped.append(task_id)
+                    continue
+                store.save_runtime(task_id, runtime)
+                migrated.append(task_id)
+        if args.json:
+            json_output({"migrated": migrated, "skipped": skipped, "cleaned": False})
+        else:
+            print(f"Imported: {len(migrated)} state files into {store.db_path}")
+            for t in migrated:
+                print(f"  {t}")
+            print(f"Skipped: {len(skipped)} tasks (already in database or unreadable)")
+        return
+
     if not tasks_dir.exists():
         if args.json:
             json_output({"migrated": [], "skipped": [], "message": "No tasks directory"})
@@ -3963,6 +5354,214 @@ def cmd_migrate_state(args: argparse.Namespace) -> None:
             print("Definition files cleaned (runtime fields removed)")
 
 
+# --- Serve (daemon mode) ---
+
+SERVE_SOCKET_FILE = "flowctl.sock"
+# Long-running or interactive commands always run in the caller's process
+SERVE_EXCLUDED_COMMANDS = {"serve", "codex", "rp"}
+# Same for these (command, subcommand) pairs; `ralph events --follow` can
+# block for a whole run and its output must stream
+SERVE_EXCLUDED_SUBCOMMANDS = {("ralph", "events")}
+# Path-pinning env vars: a client whose values differ is not served
+SERVE_PATH_ENV = ("FLOW_REPO_ROOT", "FLOW_GIT_COMMON_DIR", "FLOW_STATE_DIR")
+# Non-FLOW_ env that decides the actor (git config lookup, $USER fallback);
+# applied per request like FLOW_*. Keep in sync with flowctl_client.py.
+SERVE_CLIENT_ENV = ("HOME", "USER", "XDG_CONFIG_HOME")
+SERVE_CLIENT_ENV_PREFIXES = ("FLOW_", "GIT_CONFIG")
+
+
+def is_serve_client_env(key: str) -> bool:
+    """Whether a forwarded env var applies for the length of a served request."""
+    if key in SERVE_PATH_ENV:
+        return False
+    return key in SERVE_CLIENT_ENV or key.startswith(SERVE_CLIENT_ENV_PREFIXES)
+
+
+def serve_fallback_reason(request: dict) -> Optional[str]:
+    """Why this process can't answer the request (None if it can)."""
+    argv = request.get("argv")
+    if not isinstance(argv, list) or not argv or not all(isinstance(a, str) for a in argv):
+        return "malformed request"
+    if argv[0] in SERVE_EXCLUDED_COMMANDS:
+        return f"{argv[0]} is not served"
+    if tuple(argv[:2]) in SERVE_EXCLUDED_SUBCOMMANDS:
+        return f"{argv[0]} {argv[1]} is not served"
+    if "-" in argv:
+        return "stdin input is not forwarded"
+    env = request.get("env") or {}
+    for key in SERVE_PATH_ENV:
+        if key in env and env[key] != os.environ.get(key):
+            return f"{key} differs from server"
+
+    # Client must be inside this repo and not inside a nested worktree
+    repo_root = get_repo_root().resolve()
+    try:
+        cwd = Path(request.get("cwd") or "").resolve()
+        rel = cwd.relative_to(repo_root)
+    except (OSError, ValueError):
+        return "cwd outside served repo"
+    probe = cwd
+    for _ in rel.parts:
+        if (probe / ".git").exists():
+            return "cwd in a nested repo or worktree"
+        probe = probe.parent
+    return None
+
+
+def serve_request(parser: argparse.ArgumentParser, request: dict) -> dict:
+    """Run one forwarded command in-process, capturing its output."""
+    import io
+    import traceback
+
+    reason = serve_fallback_reason(request)
+    if reason:
+        return {"fallback": reason}
+
+    saved_env = dict(os.environ)
+    saved_cwd = os.getcwd()
+    client_env = request.get("env") or {}
+    # Per-request settings come from the client: FLOW_* (actor, review
+    # backend, ...) and the env git config / $USER resolve the actor from
+    for key in list(os.environ):
+        if is_serve_client_env(key) and key not in client_env:
+            del os.environ[key]
+    for key, value in client_env.items():
+        if is_serve_client_env(key):
+            os.environ[key] = str(value)
+
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    try:
+        os.chdir(request["cwd"])
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                args = parser.parse_args(request["argv"])
+                args.func(args)
+            except SystemExit as e:
+                if isinstance(e.code, int) or e.code is None:
+                    code = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    code = 1
+            except Exception:
+                traceback.print_exc()
+                code = 1
+            finally:
+                flush_flow_index()
+    finally:
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+    return {"code": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def serve_refresh() -> None:
+    """Re-stat .flow/ JSON files, parsing only those that changed.
+
+    Run while idle so the next request finds the in-memory model current.
+    """
+    index = get_flow_index()
+    if index is None:
+        return
+    flow_dir = get_flow_dir()
+    dirs = [flow_dir / EPICS_DIR, flow_dir / TASKS_DIR]
+    store = get_state_store()
+    if isinstance(store, LocalFileStateStore):
+        dirs.append(store.tasks_dir)
+    for directory in dirs:
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(".json"):
+                try:
+                    index.load(entry.path)
+                except (OSError, ValueError):
+                    pass
+    flush_flow_index()
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    """Answer flowctl commands over a Unix socket from a warm process."""
+    import shlex
+    import signal
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        error_exit("serve requires Unix domain sockets", use_json=False)
+    if not ensure_flow_exists():
+        error_exit(".flow/ does not exist. Run 'flowctl init' first.", use_json=False)
+
+    # Pin path resolution so clients can be matched against it
+    os.environ["FLOW_REPO_ROOT"] = str(get_repo_root())
+    if common := get_git_common_dir():
+        os.environ["FLOW_GIT_COMMON_DIR"] = str(common)
+    state_env = os.environ.get("FLOW_STATE_DIR", "")
+    scheme = SQLITE_STATE_SCHEME if state_env.startswith(SQLITE_STATE_SCHEME) else ""
+    os.environ["FLOW_STATE_DIR"] = f"{scheme}{get_state_dir()}"
+
+    sock_path = Path(args.socket) if args.socket else get_state_dir() / SERVE_SOCKET_FILE
+    sock_path.parent.mkdir(parents=True, exist_ok=True)
+    if sock_path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(sock_path))
+            error_exit(f"flowctl serve already running on {sock_path}", use_json=False)
+        except OSError:
+            sock_path.unlink()  # Stale socket from a dead server
+        finally:
+            probe.close()
+
+    parser = build_parser()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(sock_path))
+    os.chmod(sock_path, 0o600)
+    server.listen(16)
+    server.settimeout(args.poll if args.poll > 0 else None)
+    print(f"flowctl serve: listening on {sock_path}", file=sys.stderr)
+    print(f"export FLOW_SERVE_SOCKET={shlex.quote(str(sock_path))}")
+    sys.stdout.flush()
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+
+    serve_refresh()
+    last_request = time.monotonic()
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                if args.idle_timeout and time.monotonic() - last_request > args.idle_timeout:
+                    break
+                serve_refresh()
+                continue
+            last_request = time.monotonic()
+            with conn:
+                conn.settimeout(30)
+                try:
+                    with conn.makefile("rb") as f:
+                        request = json.loads(f.readline() or b"{}")
+                    response = serve_request(parser, request)
+                except (OSError, ValueError) as e:
+                    response = {"fallback": f"bad request ({e})"}
+                try:
+                    conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+                except OSError:
+                    pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        try:
+            sock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
 def cmd_epic_close(args: argparse.Namespace) -> None:
     """Close an epic (all tasks must be done)."""
     if not ensure_flow_exists():
@@ -3989,11 +5588,9 @@ def cmd_epic_close(args: argparse.Namespace) -> None:
             use_json=args.json,
         )
     incomplete = []
-    for task_file in tasks_dir.glob(f"{args.id}.*.json"):
-        task_id = task_file.stem
-        if "." not in task_id:
-            continue
-        task_data = load_task_with_state(task_id, use_json=args.json)
+    for task_data in load_tasks_with_state(
+        f"{args.id}.*.json", use_json=args.json
+    ).values():
         if task_data["status"] != "done":
             incomplete.append(f"{task_data['id']} ({task_data['status']})")
 
@@ -4046,9 +5643,15 @@ def validate_flow_root(flow_dir: Path) -> list[str]:
 
 
 def validate_epic(
-    flow_dir: Path, epic_id: str, use_json: bool = True
+    flow_dir: Path,
+    epic_id: str,
+    use_json: bool = True,
+    tasks: Optional[dict[str, dict]] = None,
 ) -> tuple[list[str], list[str], int]:
-    """Validate a single epic. Returns (errors, warnings, task_count)."""
+    """Validate a single epic. Returns (errors, warnings, task_count).
+
+    tasks: the epic's tasks ({id: merged task}) if already loaded.
+    """
     errors = []
     warnings = []
 
@@ -4086,18 +5689,10 @@ def validate_epic(
                 errors.append(f"Epic {epic_id}: depends_on_epics missing epic {dep}")
 
     # Get all tasks (with merged runtime state for accurate status)
-    tasks_dir = flow_dir / TASKS_DIR
-    tasks = {}
-    if tasks_dir.exists():
-        for task_file in tasks_dir.glob(f"{epic_id}.*.json"):
-            task_id = task_file.stem
-            if "." not in task_id:
-                continue  # Skip non-task files
-            # Use merged state to get accurate status
-            task_data = load_task_with_state(task_id, use_json=use_json)
-            if "id" not in task_data:
-                continue  # Skip artifact files (GH-21)
-            tasks[task_data["id"]] = task_data
+    if tasks is None:
+        tasks = group_tasks_by_epic(
+            load_tasks_with_state(f"{epic_id}.*.json", use_json=use_json)
+        ).get(epic_id, {})
 
     # Validate each task
     for task_id, task in tasks.items():
@@ -4131,28 +5726,9 @@ def validate_epic(
                 )
 
     # Cycle detection using DFS
-    def has_cycle(task_id: str, visited: set, rec_stack: set) -> list[str]:
-        visited.add(task_id)
-        rec_stack.add(task_id)
-
-        for dep in tasks.get(task_id, {}).get("depends_on", []):
-            if dep not in visited:
-                cycle = has_cycle(dep, visited, rec_stack)
-                if cycle:
-                    return [task_id] + cycle
-            elif dep in rec_stack:
-                return [task_id, dep]
-
-        rec_stack.remove(task_id)
-        return []
-
-    visited = set()
-    for task_id in tasks:
-        if task_id not in visited:
-            cycle = has_cycle(task_id, visited, set())
-            if cycle:
-                errors.append(f"Dependency cycle detected: {' -> '.join(cycle)}")
-                break
+    cycle = TaskGraph(tasks).find_cycle()
+    if cycle:
+        errors.append(f"Dependency cycle detected: {' -> '.join(cycle)}")
 
     # Check epic done status consistency
     if epic_data["status"] == "done":
@@ -4165,6 +5741,167 @@ def validate_epic(
     return errors, warnings, len(tasks)
 
 
+def group_tasks_by_epic(tasks: dict[str, dict]) -> dict[str, dict[str, dict]]:
+    """Group loaded tasks as {epic_id: {task id: task}}, skipping artifacts."""
+    grouped: dict[str, dict[str, dict]] = {}
+    for task_id, task_data in tasks.items():
+        if "id" not in task_data:
+            continue  # Skip artifact files (GH-21)
+        grouped.setdefault(task_id.split(".", 1)[0], {})[task_data["id"]] = task_data
+    return grouped
+
+
+def _validate_epic_job(job: tuple) -> tuple[list[str], list[str], int]:
+    """validate_epic() entry point for worker processes."""
+    flow_dir, epic_id, tasks, use_json = job
+    return validate_epic(Path(flow_dir), epic_id, use_json=use_json, tasks=tasks)
+
+
+VALIDATE_CACHE_FILE = "validate-cache.json"
+# Bump when validate_epic() rules change so cached results are discarded
+VALIDATE_CACHE_VERSION = 1
+
+
+class ValidationCache:
+    """Per-epic validate results keyed by a content hash of their inputs.
+
+    An epic's key covers its JSON, its spec, the existence of the epics it
+    depends on, its merged tasks and each task spec's content, so editing
+    any of them (or a neighbour disappearing) re-validates just that epic.
+    File content hashes are reused while (mtime_ns, size, inode) match,
+    with the same racy-mtime guard as FlowIndex. Lives in the state dir.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.epics: dict[str, list] = {}
+        self.files: dict[str, list] = {}
+        self.dirty = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == VALIDATE_CACHE_VERSION:
+                self.epics = dict(data.get("epics") or {})
+                self.files = dict(data.get("files") or {})
+        except (OSError, ValueError, AttributeError, TypeError):
+            pass
+        try:
+            st = os.stat(__file__)
+            self.validator = f"{VALIDATE_CACHE_VERSION}:{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            self.validator = str(VALIDATE_CACHE_VERSION)
+
+    def file_hash(self, path: Union[Path, str]) -> Optional[str]:
+        """sha256 of a file's content (None if missing/unreadable)."""
+        import hashlib
+
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        sig = [st.st_mtime_ns, st.st_size, st.st_ino]
+        entry = self.files.get(key)
+        if entry is not None and entry[:3] == sig:
+            return entry[3]
+        try:
+            with open(key, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+        if time.time_ns() - st.st_mtime_ns > INDEX_RACY_NS:
+            self.files[key] = sig + [digest]
+            self.dirty = True
+        elif self.files.pop(key, None) is not None:
+            self.dirty = True
+        return digest
+
+    def epic_key(
+        self, flow_dir: Path, epic_id: str, tasks: dict[str, dict]
+    ) -> Optional[str]:
+        """Hash of everything validate_epic() reads for epic_id.
+
+        None when the epic JSON can't be loaded (never cached).
+        """
+        import hashlib
+
+        tasks_dir = str(flow_dir / TASKS_DIR)
+        epic_path = flow_dir / EPICS_DIR / f"{epic_id}.json"
+        try:
+            epic_data = load_json_cached(epic_path)
+        except Exception:
+            return None
+        deps = epic_data.get("depends_on_epics") if isinstance(epic_data, dict) else None
+        dep_exists = {}
+        if isinstance(deps, list):
+            for dep in deps:
+                if isinstance(dep, str):
+                    dep_exists[dep] = (flow_dir / EPICS_DIR / f"{dep}.json").exists()
+        inputs = {
+            "validator": self.validator,
+            "flow_dir": str(flow_dir),
+            "epic": self.file_hash(epic_path),
+            "spec": self.file_hash(flow_dir / SPECS_DIR / f"{epic_id}.md"),
+            "deps": dep_exists,
+            "tasks": tasks,
+            "task_specs": {
+                task_id: self.file_hash(os.path.join(tasks_dir, f"{task_id}.md"))
+                for task_id in tasks
+            },
+        }
+        encoded = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def lookup(
+        self, epic_id: str, key: Optional[str]
+    ) -> Optional[tuple[list[str], list[str], int]]:
+        entry = self.epics.get(epic_id)
+        if key is None or entry is None or entry[0] != key:
+            return None
+        return entry[1], entry[2], entry[3]
+
+    def store(
+        self,
+        epic_id: str,
+        key: Optional[str],
+        result: tuple[list[str], list[str], int],
+    ) -> None:
+        if key is None:
+            if self.epics.pop(epic_id, None) is not None:
+                self.dirty = True
+            return
+        self.epics[epic_id] = [key, *result]
+        self.dirty = True
+
+    def prune(self, epic_ids: list[str]) -> None:
+        """Drop results for epics that no longer exist."""
+        keep = set(epic_ids)
+        for epic_id in [e for e in self.epics if e not in keep]:
+            del self.epics[epic_id]
+            self.dirty = True
+        for key in [k for k in self.files if not os.path.exists(k)]:
+            del self.files[key]
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache if anything changed. Best-effort."""
+        if not self.dirty:
+            return
+        content = json.dumps(
+            {
+                "version": VALIDATE_CACHE_VERSION,
+                "epics": self.epics,
+                "files": self.files,
+            },
+            separators=(",", ":"),
+        )
+        try:
+            atomic_write(self.path, content)
+            self.dirty = False
+        except OSError:
+            pass
+
+
 def cmd_prep_chat(args: argparse.Namespace) -> None:
     """Prepare JSON payload for rp-cli chat_send. Handles escaping safely."""
     # Read message from file
@@ -4364,6 +6101,8 @@ def cmd_rp_select_get(args: argparse.Namespace) -> None:
 
 
 def cmd_rp_select_add(args: argparse.Namespace) -> None:
+    import shlex
+
     if not args.paths:
         error_exit("select-add requires at least one path", use_json=False, code=2)
     quoted = " ".join(shlex.quote(p) for p in args.paths)
@@ -4402,6 +6141,8 @@ def cmd_rp_chat_send(args: argparse.Namespace) -> None:
 
 
 def cmd_rp_prompt_export(args: argparse.Namespace) -> None:
+    import shlex
+
     cmd = [
         "-w",
         str(args.window),
@@ -4426,6 +6167,8 @@ def cmd_rp_setup_review(args: argparse.Namespace) -> None:
 
     Requires RepoPrompt 1.6.0+ for --response-type review.
     """
+    import shlex
+
     import hashlib
 
     repo_root = os.path.realpath(args.repo_root)
@@ -4546,6 +6289,8 @@ def cmd_rp_setup_review(args: argparse.Namespace) -> None:
 
 def cmd_codex_check(args: argparse.Namespace) -> None:
     """Check if codex CLI is available and return version."""
+    import shutil
+
     codex = shutil.which("codex")
     available = codex is not None
     version = get_codex_version() if available else None
@@ -4560,9 +6305,24 @@ def cmd_codex_check(args: argparse.Namespace) -> None:
 
 
 def build_standalone_review_prompt(
-    base_branch: str, focus: Optional[str], diff_summary: str
+    base_branch: str,
+    focus: Optional[str],
+    diff_summary: str,
+    budget: Optional[int] = None,
+    report: Optional[list] = None,
 ) -> str:
-    """Build review prompt for standalone branch review (no task context)."""
+    """Build review prompt for standalone branch review (no task context).
+
+    Over budget (see build_review_prompt), the diff summary is trimmed.
+    """
+    if budget is None:
+        budget = review_prompt_budget()
+    if budget:
+        fixed = len(build_standalone_review_prompt(base_branch, focus, "", 0).encode("utf-8"))
+        diff_summary = compact_prompt_sections(
+            {"diff_summary": diff_summary}, budget - fixed, report
+        )["diff_summary"]
+
     focus_section = ""
     if focus:
         focus_section = f"""
@@ -4620,26 +6380,199 @@ You MAY mention these as "FYI" observations without affecting the verdict.
 
 ## Output Format
 
-For each issue found:
-- **Severity**: Critical / Major / Minor / Nitpick
-- **File:Line**: Exact location
-- **Problem**: What's wrong
-- **Suggestion**: How to fix
+For each issue found:
+- **Severity**: Critical / Major / Minor / Nitpick
+- **File:Line**: Exact location
+- **Problem**: What's wrong
+- **Suggestion**: How to fix
+
+Be critical. Find real issues.
+
+**REQUIRED**: End your response with exactly one verdict tag:
+- `<verdict>SHIP</verdict>` - Ready to merge
+- `<verdict>NEEDS_WORK</verdict>` - Issues must be fixed first
+- `<verdict>MAJOR_RETHINK</verdict>` - Fundamental problems, reconsider approach
+"""
+
+
+REVIEW_CACHE_DIR = "review-cache"
+# Defaults; FLOW_REVIEW_CACHE_TTL (seconds) / FLOW_REVIEW_CACHE_MAX_BYTES override
+REVIEW_CACHE_TTL = 7 * 24 * 3600
+REVIEW_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+
+def review_diff_content(base_branch: str) -> bytes:
+    """What an impl review sees: `git diff <base>` plus untracked files.
+
+    Untracked (not ignored) files are folded in by path and content hash, so
+    adding a new file after a review changes the cache key.
+    """
+    import hashlib
+    import subprocess
+
+    repo_root = get_repo_root()
+    try:
+        diff = subprocess.run(
+            ["git", "diff", base_branch], capture_output=True, cwd=repo_root
+        ).stdout
+        untracked = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+            capture_output=True,
+            cwd=repo_root,
+        ).stdout
+    except OSError:
+        return b""
+    parts = [diff]
+    for rel in sorted(p for p in untracked.split(b"\0") if p):
+        digest = hashlib.sha256()
+        try:
+            with open(repo_root / os.fsdecode(rel), "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            pass  # Unreadable or vanished: the path alone still counts
+        parts.append(b"\0untracked\0" + rel + b"\0" + digest.hexdigest().encode())
+    return b"".join(parts)
+
+
+def review_cache_key(
+    review_type: str,
+    review_id: str,
+    base_branch: str,
+    spec: str,
+    diff: bytes = b"",
+    hints: str = "",
+) -> str:
+    """Content address of a review: type, id, base, model, spec, diff and
+    context hint hashes."""
+    import hashlib
+
+    parts = {
+        "type": review_type,
+        "id": review_id,
+        "base": base_branch,
+        "model": codex_model(),
+        "spec": hashlib.sha256(spec.encode("utf-8")).hexdigest(),
+        "diff": hashlib.sha256(diff).hexdigest(),
+        "hints": hashlib.sha256(hints.encode("utf-8")).hexdigest(),
+    }
+    encoded = json.dumps(parts, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ReviewCache:
+    """Finished codex reviews by content address, under <state dir>/review-cache/.
+
+    One JSON file per key. Entries older than the TTL are ignored and
+    removed; past the size cap the least recently used files go first.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.ttl = env_int("FLOW_REVIEW_CACHE_TTL", REVIEW_CACHE_TTL)
+        self.max_bytes = env_int("FLOW_REVIEW_CACHE_MAX_BYTES", REVIEW_CACHE_MAX_BYTES)
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self.root / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink()
+                return None
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            # Touch on hit so eviction drops least recently used entries
+            os.utime(path, (time.time(), path.stat().st_mtime))
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def put(self, key: str, entry: dict) -> None:
+        """Store a finished review and evict. Best-effort."""
+        try:
+            atomic_write(self.root / f"{key}.json", json.dumps(entry))
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        now = time.time()
+        files = []
+        try:
+            entries = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                st = entry.stat()
+                if now - st.st_mtime > self.ttl:
+                    os.unlink(entry.path)
+                else:
+                    files.append((st.st_atime, st.st_size, entry.path))
+            except FileNotFoundError:
+                continue  # removed by a concurrent eviction
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+def get_review_cache(no_cache: bool = False) -> Optional[ReviewCache]:
+    """Review cache for the current state dir (None when disabled)."""
+    if no_cache:
+        return None
+    return ReviewCache(get_state_dir() / REVIEW_CACHE_DIR)
+
+
+def read_receipt_session(receipt_path: Optional[str]) -> Optional[str]:
+    """Session id from an existing receipt (a re-review), else None."""
+    if not receipt_path:
+        return None
+    receipt_file = Path(receipt_path)
+    if not receipt_file.exists():
+        return None
+    try:
+        receipt_data = json.loads(receipt_file.read_text(encoding="utf-8"))
+        return receipt_data.get("session_id")
+    except (json.JSONDecodeError, Exception):
+        return None
+
 
-Be critical. Find real issues.
+def report_prompt_compaction(review_id: str, prompt: str, compacted: list[dict]) -> None:
+    """Tell the caller (on stderr) which prompt sections were trimmed."""
+    if not compacted:
+        return
+    trimmed = ", ".join(
+        f"{c['section']} {c['bytes']}->{c['kept_bytes']}B (-{c['omitted_lines']} lines)"
+        for c in compacted
+    )
+    print(
+        f"{review_id}: review prompt trimmed to {len(prompt.encode('utf-8'))} bytes "
+        f"(budget {review_prompt_budget()}): {trimmed}",
+        file=sys.stderr,
+    )
 
-**REQUIRED**: End your response with exactly one verdict tag:
-- `<verdict>SHIP</verdict>` - Ready to merge
-- `<verdict>NEEDS_WORK</verdict>` - Issues must be fixed first
-- `<verdict>MAJOR_RETHINK</verdict>` - Fundamental problems, reconsider approach
-"""
 
+def prepare_impl_review(
+    task_id: Optional[str],
+    base_branch: str,
+    focus: Optional[str] = None,
+    receipt_path: Optional[str] = None,
+    use_json: bool = True,
+    cache: bool = True,
+) -> dict:
+    """Validate inputs and build the prompt for an implementation review.
 
-def cmd_codex_impl_review(args: argparse.Namespace) -> None:
-    """Run implementation review via codex exec."""
-    task_id = args.task
-    base_branch = args.base
-    focus = getattr(args, "focus", None)
+    Returns a review dict (type, id, prompt, session_id, receipt, ...)
+    for run_codex_exec / run_reviews and write_review_receipt. With
+    cache=False the full diff is not read and cache_key is None.
+    """
+    import subprocess
 
     # Standalone mode (no task ID) - review branch without task context
     standalone = task_id is None
@@ -4647,18 +6580,18 @@ def cmd_codex_impl_review(args: argparse.Namespace) -> None:
     if not standalone:
         # Task-specific review requires .flow/
         if not ensure_flow_exists():
-            error_exit(".flow/ does not exist", use_json=args.json)
+            error_exit(".flow/ does not exist", use_json=use_json)
 
         # Validate task ID
         if not is_task_id(task_id):
-            error_exit(f"Invalid task ID: {task_id}", use_json=args.json)
+            error_exit(f"Invalid task ID: {task_id}", use_json=use_json)
 
         # Load task spec
         flow_dir = get_flow_dir()
         task_spec_path = flow_dir / TASKS_DIR / f"{task_id}.md"
 
         if not task_spec_path.exists():
-            error_exit(f"Task spec not found: {task_spec_path}", use_json=args.json)
+            error_exit(f"Task spec not found: {task_spec_path}", use_json=use_json)
 
         task_spec = task_spec_path.read_text(encoding="utf-8")
 
@@ -4673,105 +6606,78 @@ def cmd_codex_impl_review(args: argparse.Namespace) -> None:
         diff_summary = diff_result.stdout.strip()
     except subprocess.CalledProcessError:
         diff_summary = ""
-
     # Build prompt
+    compacted: list[dict] = []
+    context_hints = ""
     if standalone:
-        prompt = build_standalone_review_prompt(base_branch, focus, diff_summary)
+        prompt = build_standalone_review_prompt(
+            base_branch, focus, diff_summary, report=compacted
+        )
     else:
         # Get context hints for task-specific review
         context_hints = gather_context_hints(base_branch)
-        prompt = build_review_prompt("impl", task_spec, context_hints, diff_summary)
+        prompt = build_review_prompt(
+            "impl", task_spec, context_hints, diff_summary, report=compacted
+        )
+    report_prompt_compaction(task_id or "branch", prompt, compacted)
 
     # Check for existing session in receipt (indicates re-review)
-    receipt_path = args.receipt if hasattr(args, "receipt") and args.receipt else None
-    session_id = None
-    is_rereview = False
-    if receipt_path:
-        receipt_file = Path(receipt_path)
-        if receipt_file.exists():
-            try:
-                receipt_data = json.loads(receipt_file.read_text(encoding="utf-8"))
-                session_id = receipt_data.get("session_id")
-                is_rereview = session_id is not None
-            except (json.JSONDecodeError, Exception):
-                pass
+    session_id = read_receipt_session(receipt_path)
 
     # For re-reviews, prepend instruction to re-read changed files
-    if is_rereview:
+    if session_id is not None:
         changed_files = get_changed_files(base_branch)
         if changed_files:
             rereview_preamble = build_rereview_preamble(changed_files, "implementation")
             prompt = rereview_preamble + prompt
 
-    # Run codex
-    output, thread_id = run_codex_exec(prompt, session_id=session_id)
-
-    # Parse verdict
-    verdict = parse_codex_verdict(output)
-
-    # Determine review id (task_id for task reviews, "branch" for standalone)
     review_id = task_id if task_id else "branch"
-
-    # Write receipt if path provided (Ralph-compatible schema)
-    if receipt_path:
-        receipt_data = {
-            "type": "impl_review",  # Required by Ralph
-            "id": review_id,  # Required by Ralph
-            "mode": "codex",
-            "base": base_branch,
-            "verdict": verdict,
-            "session_id": thread_id,
-            "timestamp": now_iso(),
-            "review": output,  # Full review feedback for fix loop
-        }
-        # Add iteration if running under Ralph
-        ralph_iter = os.environ.get("RALPH_ITERATION")
-        if ralph_iter:
-            try:
-                receipt_data["iteration"] = int(ralph_iter)
-            except ValueError:
-                pass
-        if focus:
-            receipt_data["focus"] = focus
-        Path(receipt_path).write_text(
-            json.dumps(receipt_data, indent=2) + "\n", encoding="utf-8"
-        )
-
-    # Output
-    if args.json:
-        json_output(
-            {
-                "type": "impl_review",
-                "id": review_id,
-                "verdict": verdict,
-                "session_id": thread_id,
-                "mode": "codex",
-                "standalone": standalone,
-                "review": output,  # Full review feedback for fix loop
-            }
+    cache_key = None
+    if cache:
+        # Full diff plus untracked files identifies the change for the review cache
+        cache_key = review_cache_key(
+            "impl_review",
+            review_id,
+            base_branch,
+            spec=task_spec if not standalone else (focus or ""),
+            diff=review_diff_content(base_branch),
+            hints=context_hints,
         )
-    else:
-        print(output)
-        print(f"\nVERDICT={verdict or 'UNKNOWN'}")
+    return {
+        "type": "impl_review",
+        # Review id: task_id for task reviews, "branch" for standalone
+        "id": review_id,
+        "base": base_branch,
+        "focus": focus,
+        "standalone": standalone,
+        "prompt": prompt,
+        "compacted": compacted,
+        "session_id": session_id,
+        "receipt": receipt_path,
+        "cache_key": cache_key,
+    }
 
 
-def cmd_codex_plan_review(args: argparse.Namespace) -> None:
-    """Run plan review via codex exec."""
+def prepare_plan_review(
+    epic_id: str,
+    base_branch: str = "main",
+    receipt_path: Optional[str] = None,
+    use_json: bool = True,
+) -> dict:
+    """Validate inputs and build the prompt for a plan review (see prepare_impl_review)."""
     if not ensure_flow_exists():
-        error_exit(".flow/ does not exist", use_json=args.json)
-
-    epic_id = args.epic
+        error_exit(".flow/ does not exist", use_json=use_json)
 
     # Validate epic ID
     if not is_epic_id(epic_id):
-        error_exit(f"Invalid epic ID: {epic_id}", use_json=args.json)
+        error_exit(f"Invalid epic ID: {epic_id}", use_json=use_json)
 
     # Load epic spec
     flow_dir = get_flow_dir()
     epic_spec_path = flow_dir / SPECS_DIR / f"{epic_id}.md"
 
     if not epic_spec_path.exists():
-        error_exit(f"Epic spec not found: {epic_spec_path}", use_json=args.json)
+        error_exit(f"Epic spec not found: {epic_spec_path}", use_json=use_json)
 
     epic_spec = epic_spec_path.read_text(encoding="utf-8")
 
@@ -4783,31 +6689,23 @@ def cmd_codex_plan_review(args: argparse.Namespace) -> None:
         task_content = task_file.read_text(encoding="utf-8")
         task_specs_parts.append(f"### {task_id}\n\n{task_content}")
 
-    task_specs = "\n\n---\n\n".join(task_specs_parts) if task_specs_parts else ""
+    task_specs = TASK_SPECS_SEPARATOR.join(task_specs_parts) if task_specs_parts else ""
 
     # Get context hints (from main branch for plans)
-    base_branch = args.base if hasattr(args, "base") and args.base else "main"
     context_hints = gather_context_hints(base_branch)
 
     # Build prompt
-    prompt = build_review_prompt("plan", epic_spec, context_hints, task_specs=task_specs)
+    compacted: list[dict] = []
+    prompt = build_review_prompt(
+        "plan", epic_spec, context_hints, task_specs=task_specs, report=compacted
+    )
+    report_prompt_compaction(epic_id, prompt, compacted)
 
     # Check for existing session in receipt (indicates re-review)
-    receipt_path = args.receipt if hasattr(args, "receipt") and args.receipt else None
-    session_id = None
-    is_rereview = False
-    if receipt_path:
-        receipt_file = Path(receipt_path)
-        if receipt_file.exists():
-            try:
-                receipt_data = json.loads(receipt_file.read_text(encoding="utf-8"))
-                session_id = receipt_data.get("session_id")
-                is_rereview = session_id is not None
-            except (json.JSONDecodeError, Exception):
-                pass
+    session_id = read_receipt_session(receipt_path)
 
     # For re-reviews, prepend instruction to re-read spec files
-    if is_rereview:
+    if session_id is not None:
         # For plan reviews, epic spec and task specs may change
         spec_files = [str(epic_spec_path)]
         # Add task spec files
@@ -4816,43 +6714,179 @@ def cmd_codex_plan_review(args: argparse.Namespace) -> None:
         rereview_preamble = build_rereview_preamble(spec_files, "plan")
         prompt = rereview_preamble + prompt
 
-    # Run codex
-    output, thread_id = run_codex_exec(prompt, session_id=session_id)
+    return {
+        "type": "plan_review",
+        "id": epic_id,
+        "base": base_branch,
+        "prompt": prompt,
+        "compacted": compacted,
+        "session_id": session_id,
+        "receipt": receipt_path,
+        "cache_key": review_cache_key(
+            "plan_review",
+            epic_id,
+            base_branch,
+            spec=epic_spec + "\0" + task_specs,
+            hints=context_hints,
+        ),
+    }
 
-    # Parse verdict
-    verdict = parse_codex_verdict(output)
 
-    # Write receipt if path provided (Ralph-compatible schema)
-    if receipt_path:
-        receipt_data = {
-            "type": "plan_review",  # Required by Ralph
-            "id": epic_id,  # Required by Ralph
-            "mode": "codex",
+def write_review_receipt(
+    review: dict, verdict: Optional[str], thread_id: Optional[str], output: str
+) -> None:
+    """Write the Ralph-compatible receipt for a finished review."""
+    receipt_data = {
+        "type": review["type"],  # Required by Ralph
+        "id": review["id"],  # Required by Ralph
+        "mode": "codex",
+    }
+    if review["type"] == "impl_review":
+        receipt_data["base"] = review["base"]
+    receipt_data.update(
+        {
             "verdict": verdict,
             "session_id": thread_id,
             "timestamp": now_iso(),
             "review": output,  # Full review feedback for fix loop
         }
-        # Add iteration if running under Ralph
-        ralph_iter = os.environ.get("RALPH_ITERATION")
-        if ralph_iter:
-            try:
-                receipt_data["iteration"] = int(ralph_iter)
-            except ValueError:
-                pass
-        Path(receipt_path).write_text(
-            json.dumps(receipt_data, indent=2) + "\n", encoding="utf-8"
+    )
+    # Add iteration if running under Ralph
+    ralph_iter = os.environ.get("RALPH_ITERATION")
+    if ralph_iter:
+        try:
+            receipt_data["iteration"] = int(ralph_iter)
+        except ValueError:
+            pass
+    if review.get("focus"):
+        receipt_data["focus"] = review["focus"]
+    Path(review["receipt"]).write_text(
+        json.dumps(receipt_data, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def cache_review(
+    cache: Optional[ReviewCache],
+    review: dict,
+    output: str,
+    thread_id: Optional[str],
+    verdict: Optional[str],
+) -> None:
+    """Remember a finished review (only ones that reached a verdict)."""
+    if cache and verdict:
+        cache.put(
+            review["cache_key"],
+            {
+                "type": review["type"],
+                "id": review["id"],
+                "verdict": verdict,
+                "session_id": thread_id,
+                "review": output,
+                "created_at": now_iso(),
+            },
+        )
+
+
+def run_review(
+    review: dict, cache: Optional[ReviewCache] = None
+) -> tuple[str, Optional[str], Optional[str], bool]:
+    """Run a prepared review via codex, or return its cached result.
+
+    Returns (output, thread_id, verdict, cached). While codex runs, raw
+    output streams to <receipt>.partial.
+    """
+    hit = cache.get(review["cache_key"]) if cache else None
+    if hit:
+        return hit.get("review", ""), hit.get("session_id"), hit.get("verdict"), True
+
+    partial = Path(review["receipt"] + ".partial") if review["receipt"] else None
+    if partial:
+        partial.parent.mkdir(parents=True, exist_ok=True)
+        partial.unlink(missing_ok=True)
+    output, thread_id, verdict = run_codex_exec(
+        review["prompt"], session_id=review["session_id"], stream_path=partial
+    )
+    if partial:
+        partial.unlink(missing_ok=True)
+    cache_review(cache, review, output, thread_id, verdict)
+    return output, thread_id, verdict, False
+
+
+def cmd_codex_impl_review(args: argparse.Namespace) -> None:
+    """Run implementation review via codex exec."""
+    receipt_path = args.receipt if hasattr(args, "receipt") and args.receipt else None
+    review = prepare_impl_review(
+        args.task,
+        args.base,
+        focus=getattr(args, "focus", None),
+        receipt_path=receipt_path,
+        use_json=args.json,
+        cache=not args.no_cache,
+    )
+
+    # Run codex, or reuse an identical earlier review
+    started = time.monotonic()
+    output, thread_id, verdict, cached = run_review(
+        review, get_review_cache(args.no_cache)
+    )
+    log_review_event(review, verdict, cached, round((time.monotonic() - started) * 1000))
+
+    # Write receipt if path provided (Ralph-compatible schema)
+    if receipt_path:
+        write_review_receipt(review, verdict, thread_id, output)
+
+    # Output
+    if args.json:
+        json_output(
+            {
+                "type": "impl_review",
+                "id": review["id"],
+                "verdict": verdict,
+                "session_id": thread_id,
+                "mode": "codex",
+                "standalone": review["standalone"],
+                "cached": cached,
+                "compacted": review["compacted"],
+                "review": output,  # Full review feedback for fix loop
+            }
         )
+    else:
+        print(output)
+        print(f"\nVERDICT={verdict or 'UNKNOWN'}")
+
+
+def cmd_codex_plan_review(args: argparse.Namespace) -> None:
+    """Run plan review via codex exec."""
+    receipt_path = args.receipt if hasattr(args, "receipt") and args.receipt else None
+    review = prepare_plan_review(
+        args.epic,
+        args.base if hasattr(args, "base") and args.base else "main",
+        receipt_path=receipt_path,
+        use_json=args.json,
+    )
+
+    # Run codex, or reuse an identical earlier review
+    started = time.monotonic()
+    output, thread_id, verdict, cached = run_review(
+        review, get_review_cache(args.no_cache)
+    )
+    log_review_event(review, verdict, cached, round((time.monotonic() - started) * 1000))
+
+    # Write receipt if path provided (Ralph-compatible schema)
+    if receipt_path:
+        write_review_receipt(review, verdict, thread_id, output)
 
     # Output
     if args.json:
         json_output(
             {
                 "type": "plan_review",
-                "id": epic_id,
+                "id": review["id"],
                 "verdict": verdict,
                 "session_id": thread_id,
                 "mode": "codex",
+                "cached": cached,
+                "compacted": review["compacted"],
                 "review": output,  # Full review feedback for fix loop
             }
         )
@@ -4861,6 +6895,152 @@ def cmd_codex_plan_review(args: argparse.Namespace) -> None:
         print(f"\nVERDICT={verdict or 'UNKNOWN'}")
 
 
+async def run_reviews(
+    reviews: list[dict],
+    concurrency: int = 4,
+    stop_file: Optional[Path] = None,
+    cache: Optional[ReviewCache] = None,
+) -> list[dict]:
+    """Run prepared reviews concurrently (at most `concurrency` at once).
+
+    Each review's stdout streams into <receipt>.partial while it runs; the
+    receipt itself is only written once the review finishes, so Ralph never
+    sees a half-done receipt. If stop_file appears (Ralph STOP), running
+    codex processes are killed and pending reviews are cancelled. Reviews
+    found in cache complete at once without taking a slot.
+    Returns one result dict per review, in input order.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(review: dict) -> dict:
+        result = {"type": review["type"], "id": review["id"], "verdict": None}
+        started = time.monotonic()
+        hit = cache.get(review["cache_key"]) if cache else None
+        if hit:
+            if review["receipt"]:
+                write_review_receipt(
+                    review, hit.get("verdict"), hit.get("session_id"), hit.get("review", "")
+                )
+            result.update(
+                status="done",
+                verdict=hit.get("verdict"),
+                session_id=hit.get("session_id"),
+                cached=True,
+                seconds=0.0,
+            )
+            return result
+        partial = Path(review["receipt"] + ".partial") if review["receipt"] else None
+        try:
+            async with semaphore:
+                if partial:
+                    partial.unlink(missing_ok=True)
+                parsed = await run_codex_exec_async(
+                    review["prompt"],
+                    session_id=review["session_id"],
+                    stream_path=partial,
+                )
+        except asyncio.CancelledError:
+            result["status"] = "cancelled"
+        except ReviewError as e:
+            result.update(status="error", error=str(e))
+        else:
+            if review["receipt"]:
+                write_review_receipt(review, parsed.verdict, parsed.thread_id, parsed.output)
+                partial.unlink(missing_ok=True)
+            cache_review(cache, review, parsed.output, parsed.thread_id, parsed.verdict)
+            result.update(
+                status="done",
+                verdict=parsed.verdict,
+                session_id=parsed.thread_id,
+                cached=False,
+            )
+        result["seconds"] = round(time.monotonic() - started, 1)
+        return result
+
+    tasks = [asyncio.ensure_future(run_one(review)) for review in reviews]
+
+    async def watch_stop() -> None:
+        while not stop_file.exists():
+            await asyncio.sleep(1)
+        for task in tasks:
+            task.cancel()
+
+    watcher = asyncio.ensure_future(watch_stop()) if stop_file else None
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        if watcher:
+            watcher.cancel()
+
+
+def cmd_codex_batch_review(args: argparse.Namespace) -> None:
+    """Run several plan/impl reviews concurrently via codex exec."""
+    import asyncio
+
+    concurrency = args.concurrency or int(os.environ.get("FLOW_REVIEW_CONCURRENCY", "4"))
+    if concurrency < 1:
+        error_exit("--concurrency must be >= 1", use_json=args.json)
+
+    receipt_dir = Path(args.receipt_dir) if args.receipt_dir else None
+    if receipt_dir:
+        receipt_dir.mkdir(parents=True, exist_ok=True)
+
+    # Prepare every prompt up front so bad targets fail before any codex runs
+    reviews = []
+    for target in dict.fromkeys(args.targets):
+        kind = "impl" if is_task_id(target) else "plan" if is_epic_id(target) else None
+        if kind is None:
+            error_exit(f"Invalid target: {target} (expected fn-N or fn-N.M)", use_json=args.json)
+        # Same receipt names as Ralph: plan-<epic>.json / impl-<task>.json
+        receipt = str(receipt_dir / f"{kind}-{target}.json") if receipt_dir else None
+        if kind == "impl":
+            reviews.append(
+                prepare_impl_review(
+                    target,
+                    args.base,
+                    receipt_path=receipt,
+                    use_json=args.json,
+                    cache=not args.no_cache,
+                )
+            )
+        else:
+            reviews.append(
+                prepare_plan_review(target, args.base, receipt_path=receipt, use_json=args.json)
+            )
+
+    # Under Ralph, stop when the run's STOP file appears
+    stop_file = Path(args.stop_file) if args.stop_file else None
+    if stop_file is None and os.environ.get("RALPH_RUN_DIR"):
+        stop_file = Path(os.environ["RALPH_RUN_DIR"]) / "STOP"
+
+    results = asyncio.run(
+        run_reviews(reviews, concurrency, stop_file, get_review_cache(args.no_cache))
+    )
+    ok = all(r["status"] == "done" for r in results)
+    for review, r in zip(reviews, results):
+        log_review_event(
+            review,
+            r["verdict"],
+            bool(r.get("cached")),
+            round(r.get("seconds", 0) * 1000),
+            status=r["status"],
+        )
+
+    if args.json:
+        json_output({"reviews": results, "concurrency": concurrency}, success=ok)
+    else:
+        for r in results:
+            outcome = (r["verdict"] or "UNKNOWN") if r["status"] == "done" else r["status"].upper()
+            timing = "cached" if r.get("cached") else f"{r['seconds']}s"
+            print(f"{r['type']} {r['id']} {outcome} ({timing})")
+            if r.get("error"):
+                print(f"  {r['error']}", file=sys.stderr)
+    if not ok:
+        sys.exit(1)
+
+
 # --- Checkpoint commands ---
 
 
@@ -5085,10 +7265,27 @@ def cmd_validate(args: argparse.Namespace) -> None:
 
     flow_dir = get_flow_dir()
 
+    if args.jobs < 1:
+        error_exit("--jobs must be >= 1", use_json=args.json)
+
+    # Unchanged epics reuse their last result; --full re-checks (and
+    # refreshes) everything
+    cache = ValidationCache(get_state_dir() / VALIDATE_CACHE_FILE)
+
     # MU-3: Validate all mode
     if getattr(args, "all", False):
+        timings: dict[str, float] = {}
+        started = phase_start = time.perf_counter()
+
+        def end_phase(name: str) -> None:
+            nonlocal phase_start
+            now = time.perf_counter()
+            timings[name] = round((now - phase_start) * 1000, 1)
+            phase_start = now
+
         # First validate .flow/ root invariants
         root_errors = validate_flow_root(flow_dir)
+        end_phase("root")
 
         epics_dir = flow_dir / EPICS_DIR
 
@@ -5106,10 +7303,48 @@ def cmd_validate(args: argparse.Namespace) -> None:
         total_tasks = 0
         epic_results = []
 
+        # One task + runtime state load shared by every epic
+        tasks_by_epic = group_tasks_by_epic(load_tasks_with_state(use_json=args.json))
+        end_phase("load")
+
+        results: list[Optional[tuple[list[str], list[str], int]]] = []
+        keys: list[Optional[str]] = []
+        jobs = []
         for epic_id in epic_ids:
-            errors, warnings, task_count = validate_epic(
-                flow_dir, epic_id, use_json=args.json
-            )
+            epic_tasks = tasks_by_epic.get(epic_id, {})
+            key = cache.epic_key(flow_dir, epic_id, epic_tasks)
+            keys.append(key)
+            results.append(None if args.full else cache.lookup(epic_id, key))
+            if results[-1] is None:
+                jobs.append((str(flow_dir), epic_id, epic_tasks, args.json))
+        cache_hits = len(epic_ids) - len(jobs)
+        end_phase("hash")
+
+        if args.jobs > 1 and len(jobs) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            workers = min(args.jobs, len(jobs))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                fresh = list(
+                    pool.map(
+                        _validate_epic_job,
+                        jobs,
+                        chunksize=max(1, len(jobs) // (workers * 4)),
+                    )
+                )
+        else:
+            fresh = [_validate_epic_job(job) for job in jobs]
+        fresh_iter = iter(fresh)
+        for i, epic_id in enumerate(epic_ids):
+            if results[i] is None:
+                results[i] = next(fresh_iter)
+                cache.store(epic_id, keys[i], results[i])
+        cache.prune(epic_ids)
+        cache.save()
+        end_phase("epics")
+        timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+
+        for epic_id, (errors, warnings, task_count) in zip(epic_ids, results):
             all_errors.extend(errors)
             all_warnings.extend(warnings)
             total_tasks += task_count
@@ -5135,6 +7370,11 @@ def cmd_validate(args: argparse.Namespace) -> None:
                     "total_tasks": total_tasks,
                     "total_errors": len(all_errors),
                     "total_warnings": len(all_warnings),
+                    **(
+                        {"timings_ms": timings, "cached_epics": cache_hits}
+                        if args.timings
+                        else {}
+                    ),
                 },
                 success=valid,
             )
@@ -5151,6 +7391,11 @@ def cmd_validate(args: argparse.Namespace) -> None:
                 print("  Warnings:")
                 for w in all_warnings:
                     print(f"    - {w}")
+            if args.timings:
+                print(f"  Cached: {cache_hits}/{len(epic_ids)} epics")
+                print("  Timings (ms):")
+                for phase, ms in timings.items():
+                    print(f"    {phase}: {ms}")
 
         # Exit with non-zero if validation failed
         if not valid:
@@ -5163,9 +7408,16 @@ def cmd_validate(args: argparse.Namespace) -> None:
             f"Invalid epic ID: {args.epic}. Expected format: fn-N or fn-N-xxx", use_json=args.json
         )
 
-    errors, warnings, task_count = validate_epic(
-        flow_dir, args.epic, use_json=args.json
-    )
+    tasks = group_tasks_by_epic(
+        load_tasks_with_state(f"{args.epic}.*.json", use_json=args.json)
+    ).get(args.epic, {})
+    key = cache.epic_key(flow_dir, args.epic, tasks)
+    result = None if args.full else cache.lookup(args.epic, key)
+    if result is None:
+        result = validate_epic(flow_dir, args.epic, use_json=args.json, tasks=tasks)
+        cache.store(args.epic, key, result)
+        cache.save()
+    errors, warnings, task_count = result
     valid = len(errors) == 0
 
     if args.json:
@@ -5200,29 +7452,25 @@ def cmd_validate(args: argparse.Namespace) -> None:
 # --- Main ---
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(
-        description="flowctl - CLI for .flow/ task tracking",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    # init
+def _add_init_parser(subparsers) -> None:
     p_init = subparsers.add_parser("init", help="Initialize .flow/ directory")
     p_init.add_argument("--json", action="store_true", help="JSON output")
     p_init.set_defaults(func=cmd_init)
 
-    # detect
+
+def _add_detect_parser(subparsers) -> None:
     p_detect = subparsers.add_parser("detect", help="Check if .flow/ exists")
     p_detect.add_argument("--json", action="store_true", help="JSON output")
     p_detect.set_defaults(func=cmd_detect)
 
-    # status
+
+def _add_status_parser(subparsers) -> None:
     p_status = subparsers.add_parser("status", help="Show .flow state and active runs")
     p_status.add_argument("--json", action="store_true", help="JSON output")
     p_status.set_defaults(func=cmd_status)
 
-    # config
+
+def _add_config_parser(subparsers) -> None:
     p_config = subparsers.add_parser("config", help="Config commands")
     config_sub = p_config.add_subparsers(dest="config_cmd", required=True)
 
@@ -5237,6 +7485,8 @@ def main() -> None:
     p_config_set.add_argument("--json", action="store_true", help="JSON output")
     p_config_set.set_defaults(func=cmd_config_set)
 
+
+def _add_review_backend_parser(subparsers) -> None:
     # review-backend (helper for skills)
     p_review_backend = subparsers.add_parser(
         "review-backend", help="Get review backend (ASK if not configured)"
@@ -5244,7 +7494,8 @@ def main() -> None:
     p_review_backend.add_argument("--json", action="store_true", help="JSON output")
     p_review_backend.set_defaults(func=cmd_review_backend)
 
-    # memory
+
+def _add_memory_parser(subparsers) -> None:
     p_memory = subparsers.add_parser("memory", help="Memory commands")
     memory_sub = p_memory.add_subparsers(dest="memory_cmd", required=True)
 
@@ -5276,6 +7527,8 @@ def main() -> None:
     p_memory_search.add_argument("--json", action="store_true", help="JSON output")
     p_memory_search.set_defaults(func=cmd_memory_search)
 
+
+def _add_epic_parser(subparsers) -> None:
     # epic create
     p_epic = subparsers.add_parser("epic", help="Epic commands")
     epic_sub = p_epic.add_subparsers(dest="epic_cmd", required=True)
@@ -5328,6 +7581,8 @@ def main() -> None:
     p_epic_rm_dep.add_argument("--json", action="store_true", help="JSON output")
     p_epic_rm_dep.set_defaults(func=cmd_epic_rm_dep)
 
+
+def _add_task_parser(subparsers) -> None:
     # task create
     p_task = subparsers.add_parser("task", help="Task commands")
     task_sub = p_task.add_subparsers(dest="task_cmd", required=True)
@@ -5381,6 +7636,8 @@ def main() -> None:
     p_task_reset.add_argument("--json", action="store_true", help="JSON output")
     p_task_reset.set_defaults(func=cmd_task_reset)
 
+
+def _add_dep_parser(subparsers) -> None:
     # dep add
     p_dep = subparsers.add_parser("dep", help="Dependency commands")
     dep_sub = p_dep.add_subparsers(dest="dep_cmd", required=True)
@@ -5391,18 +7648,21 @@ def main() -> None:
     p_dep_add.add_argument("--json", action="store_true", help="JSON output")
     p_dep_add.set_defaults(func=cmd_dep_add)
 
-    # show
+
+def _add_show_parser(subparsers) -> None:
     p_show = subparsers.add_parser("show", help="Show epic or task")
     p_show.add_argument("id", help="Epic (fn-N) or task (fn-N.M) ID")
     p_show.add_argument("--json", action="store_true", help="JSON output")
     p_show.set_defaults(func=cmd_show)
 
-    # epics
+
+def _add_epics_parser(subparsers) -> None:
     p_epics = subparsers.add_parser("epics", help="List all epics")
     p_epics.add_argument("--json", action="store_true", help="JSON output")
     p_epics.set_defaults(func=cmd_epics)
 
-    # tasks
+
+def _add_tasks_parser(subparsers) -> None:
     p_tasks = subparsers.add_parser("tasks", help="List tasks")
     p_tasks.add_argument("--epic", help="Filter by epic ID (fn-N)")
     p_tasks.add_argument(
@@ -5413,23 +7673,27 @@ def main() -> None:
     p_tasks.add_argument("--json", action="store_true", help="JSON output")
     p_tasks.set_defaults(func=cmd_tasks)
 
-    # list
+
+def _add_list_parser(subparsers) -> None:
     p_list = subparsers.add_parser("list", help="List all epics and tasks")
     p_list.add_argument("--json", action="store_true", help="JSON output")
     p_list.set_defaults(func=cmd_list)
 
-    # cat
+
+def _add_cat_parser(subparsers) -> None:
     p_cat = subparsers.add_parser("cat", help="Print spec markdown")
     p_cat.add_argument("id", help="Epic (fn-N) or task (fn-N.M) ID")
     p_cat.set_defaults(func=cmd_cat)
 
-    # ready
+
+def _add_ready_parser(subparsers) -> None:
     p_ready = subparsers.add_parser("ready", help="List ready tasks")
     p_ready.add_argument("--epic", required=True, help="Epic ID (fn-N)")
     p_ready.add_argument("--json", action="store_true", help="JSON output")
     p_ready.set_defaults(func=cmd_ready)
 
-    # next
+
+def _add_next_parser(subparsers) -> None:
     p_next = subparsers.add_parser("next", help="Select next plan/work unit")
     p_next.add_argument("--epics-file", help="JSON file with ordered epic list")
     p_next.add_argument(
@@ -5437,10 +7701,16 @@ def main() -> None:
         action="store_true",
         help="Require plan review before work",
     )
+    p_next.add_argument(
+        "--limit",
+        type=int,
+        help="Return up to N units (adds a 'units' list to JSON output)",
+    )
     p_next.add_argument("--json", action="store_true", help="JSON output")
     p_next.set_defaults(func=cmd_next)
 
-    # start
+
+def _add_start_parser(subparsers) -> None:
     p_start = subparsers.add_parser("start", help="Start task")
     p_start.add_argument("id", help="Task ID (fn-N.M)")
     p_start.add_argument(
@@ -5450,7 +7720,8 @@ def main() -> None:
     p_start.add_argument("--json", action="store_true", help="JSON output")
     p_start.set_defaults(func=cmd_start)
 
-    # done
+
+def _add_done_parser(subparsers) -> None:
     p_done = subparsers.add_parser("done", help="Complete task")
     p_done.add_argument("id", help="Task ID (fn-N.M)")
     p_done.add_argument("--summary-file", help="Done summary markdown file")
@@ -5461,7 +7732,8 @@ def main() -> None:
     p_done.add_argument("--json", action="store_true", help="JSON output")
     p_done.set_defaults(func=cmd_done)
 
-    # block
+
+def _add_block_parser(subparsers) -> None:
     p_block = subparsers.add_parser("block", help="Block task with reason")
     p_block.add_argument("id", help="Task ID (fn-N.M)")
     p_block.add_argument(
@@ -5470,15 +7742,52 @@ def main() -> None:
     p_block.add_argument("--json", action="store_true", help="JSON output")
     p_block.set_defaults(func=cmd_block)
 
-    # state-path
+
+def _add_whoami_parser(subparsers) -> None:
+    p_whoami = subparsers.add_parser(
+        "whoami", help="Show the actor used for task claims"
+    )
+    p_whoami.add_argument("--json", action="store_true", help="JSON output")
+    p_whoami.set_defaults(func=cmd_whoami)
+
+
+def _add_state_path_parser(subparsers) -> None:
     p_state_path = subparsers.add_parser(
         "state-path", help="Show resolved state directory path"
     )
     p_state_path.add_argument("--task", help="Task ID to show state file path for")
+    p_state_path.add_argument(
+        "--export",
+        action="store_true",
+        help="Print shell exports (FLOW_REPO_ROOT, FLOW_GIT_COMMON_DIR, FLOW_STATE_DIR)",
+    )
     p_state_path.add_argument("--json", action="store_true", help="JSON output")
     p_state_path.set_defaults(func=cmd_state_path)
 
-    # migrate-state
+
+def _add_serve_parser(subparsers) -> None:
+    p_serve = subparsers.add_parser(
+        "serve", help="Serve commands over a Unix socket (daemon mode)"
+    )
+    p_serve.add_argument(
+        "--socket", help=f"Socket path (default: <state dir>/{SERVE_SOCKET_FILE})"
+    )
+    p_serve.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=0,
+        help="Exit after this many idle seconds (default: never)",
+    )
+    p_serve.add_argument(
+        "--poll",
+        type=float,
+        default=1.0,
+        help="Seconds between idle rescans of .flow/ (default: 1)",
+    )
+    p_serve.set_defaults(func=cmd_serve)
+
+
+def _add_migrate_state_parser(subparsers) -> None:
     p_migrate = subparsers.add_parser(
         "migrate-state", help="Migrate runtime state from definition files to state-dir"
     )
@@ -5487,19 +7796,42 @@ def main() -> None:
         action="store_true",
         help="Remove runtime fields from definition files after migration",
     )
+    p_migrate.add_argument(
+        "--from-files",
+        action="store_true",
+        help="Import per-task state files into the sqlite state backend",
+    )
     p_migrate.add_argument("--json", action="store_true", help="JSON output")
     p_migrate.set_defaults(func=cmd_migrate_state)
 
-    # validate
+
+def _add_validate_parser(subparsers) -> None:
     p_validate = subparsers.add_parser("validate", help="Validate epic or all")
     p_validate.add_argument("--epic", help="Epic ID (fn-N)")
     p_validate.add_argument(
         "--all", action="store_true", help="Validate all epics and tasks"
     )
+    p_validate.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Validate epics in N worker processes (--all only, default: 1)",
+    )
+    p_validate.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report per-phase timings (--all only)",
+    )
+    p_validate.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-validate everything, ignoring cached results",
+    )
     p_validate.add_argument("--json", action="store_true", help="JSON output")
     p_validate.set_defaults(func=cmd_validate)
 
-    # checkpoint
+
+def _add_checkpoint_parser(subparsers) -> None:
     p_checkpoint = subparsers.add_parser("checkpoint", help="Checkpoint commands")
     checkpoint_sub = p_checkpoint.add_subparsers(dest="checkpoint_cmd", required=True)
 
@@ -5524,6 +7856,8 @@ def main() -> None:
     p_checkpoint_delete.add_argument("--json", action="store_true", help="JSON output")
     p_checkpoint_delete.set_defaults(func=cmd_checkpoint_delete)
 
+
+def _add_prep_chat_parser(subparsers) -> None:
     # prep-chat (for rp-cli chat_send JSON escaping)
     p_prep = subparsers.add_parser(
         "prep-chat", help="Prepare JSON for rp-cli chat_send"
@@ -5545,6 +7879,8 @@ def main() -> None:
     p_prep.add_argument("--output", "-o", help="Output file (default: stdout)")
     p_prep.set_defaults(func=cmd_prep_chat)
 
+
+def _add_ralph_parser(subparsers) -> None:
     # ralph (Ralph run control)
     p_ralph = subparsers.add_parser("ralph", help="Ralph run control commands")
     ralph_sub = p_ralph.add_subparsers(dest="ralph_cmd", required=True)
@@ -5569,6 +7905,26 @@ def main() -> None:
     p_ralph_status.add_argument("--json", action="store_true", help="JSON output")
     p_ralph_status.set_defaults(func=cmd_ralph_status)
 
+    p_ralph_events = ralph_sub.add_parser(
+        "events", help="Show a Ralph run's event log (events.jsonl)"
+    )
+    p_ralph_events.add_argument(
+        "--run", help="Run ID (auto-detect if single active; any run by ID)"
+    )
+    p_ralph_events.add_argument(
+        "--follow", "-f", action="store_true", help="Keep printing new events until the run ends"
+    )
+    p_ralph_events.add_argument("--tail", type=int, help="Only the last N events")
+    p_ralph_events.add_argument(
+        "--event", action="append", help="Only this event type (repeatable)"
+    )
+    p_ralph_events.add_argument(
+        "--json", action="store_true", help="Raw JSON Lines output"
+    )
+    p_ralph_events.set_defaults(func=cmd_ralph_events)
+
+
+def _add_rp_parser(subparsers) -> None:
     # rp (RepoPrompt wrappers)
     p_rp = subparsers.add_parser("rp", help="RepoPrompt helpers")
     rp_sub = p_rp.add_subparsers(dest="rp_cmd", required=True)
@@ -5675,6 +8031,8 @@ def main() -> None:
     p_rp_setup.add_argument("--json", action="store_true", help="JSON output")
     p_rp_setup.set_defaults(func=cmd_rp_setup_review)
 
+
+def _add_codex_parser(subparsers) -> None:
     # codex (Codex CLI wrappers)
     p_codex = subparsers.add_parser("codex", help="Codex CLI helpers")
     codex_sub = p_codex.add_subparsers(dest="codex_cmd", required=True)
@@ -5697,6 +8055,11 @@ def main() -> None:
     p_codex_impl.add_argument(
         "--receipt", help="Receipt file path for session continuity"
     )
+    p_codex_impl.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run codex (skip the review result cache)",
+    )
     p_codex_impl.add_argument("--json", action="store_true", help="JSON output")
     p_codex_impl.set_defaults(func=cmd_codex_impl_review)
 
@@ -5706,11 +8069,103 @@ def main() -> None:
     p_codex_plan.add_argument(
         "--receipt", help="Receipt file path for session continuity"
     )
+    p_codex_plan.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run codex (skip the review result cache)",
+    )
     p_codex_plan.add_argument("--json", action="store_true", help="JSON output")
     p_codex_plan.set_defaults(func=cmd_codex_plan_review)
 
-    args = parser.parse_args()
-    args.func(args)
+    p_codex_batch = codex_sub.add_parser(
+        "batch-review", help="Run several plan/impl reviews concurrently"
+    )
+    p_codex_batch.add_argument(
+        "targets", nargs="+", help="Epic IDs (plan review) and/or task IDs (impl review)"
+    )
+    p_codex_batch.add_argument(
+        "--base", default="main", help="Base branch for diff/context"
+    )
+    p_codex_batch.add_argument(
+        "--concurrency",
+        type=int,
+        help="Max reviews at once (default: FLOW_REVIEW_CONCURRENCY or 4)",
+    )
+    p_codex_batch.add_argument(
+        "--receipt-dir", help="Write <plan|impl>-<id>.json receipts here"
+    )
+    p_codex_batch.add_argument(
+        "--stop-file",
+        help="Cancel when this file appears (default: $RALPH_RUN_DIR/STOP)",
+    )
+    p_codex_batch.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run codex (skip the review result cache)",
+    )
+    p_codex_batch.add_argument("--json", action="store_true", help="JSON output")
+    p_codex_batch.set_defaults(func=cmd_codex_batch_review)
+
+
+# Top-level command -> parser registrar. build_parser() registers only the
+# invoked command, so a hot call like `flowctl show` doesn't build every
+# subparser.
+COMMAND_PARSERS = {
+    "init": _add_init_parser,
+    "detect": _add_detect_parser,
+    "status": _add_status_parser,
+    "config": _add_config_parser,
+    "review-backend": _add_review_backend_parser,
+    "memory": _add_memory_parser,
+    "epic": _add_epic_parser,
+    "task": _add_task_parser,
+    "dep": _add_dep_parser,
+    "show": _add_show_parser,
+    "epics": _add_epics_parser,
+    "tasks": _add_tasks_parser,
+    "list": _add_list_parser,
+    "cat": _add_cat_parser,
+    "ready": _add_ready_parser,
+    "next": _add_next_parser,
+    "start": _add_start_parser,
+    "done": _add_done_parser,
+    "block": _add_block_parser,
+    "state-path": _add_state_path_parser,
+    "whoami": _add_whoami_parser,
+    "serve": _add_serve_parser,
+    "migrate-state": _add_migrate_state_parser,
+    "validate": _add_validate_parser,
+    "checkpoint": _add_checkpoint_parser,
+    "prep-chat": _add_prep_chat_parser,
+    "ralph": _add_ralph_parser,
+    "rp": _add_rp_parser,
+    "codex": _add_codex_parser,
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="flowctl - CLI for .flow/ task tracking",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    # Unknown command or --help: register everything for choices/usage
+    if command in COMMAND_PARSERS:
+        COMMAND_PARSERS[command](subparsers)
+    else:
+        for register in COMMAND_PARSERS.values():
+            register(subparsers)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    args = build_parser(argv[0] if argv else None).parse_args(argv)
+    try:
+        args.func(args)
+    finally:
+        flush_flow_index()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+flowctl client - forwards a command to a running `flowctl serve`.
+
+Used by the flowctl wrapper when FLOW_SERVE_SOCKET is set. Anything the
+server can't answer (not running, different repo, stdin input, excluded
+command) runs flowctl in-process instead, so callers never need to care.
+"""
+
+import json
+import os
+import socket
+import sys
+
+FLOWCTL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "flowctl.py")
+
+# Env the server applies per request (flowctl.is_serve_client_env): FLOW_*
+# settings plus what git config / $USER actor resolution reads
+CLIENT_ENV = ("HOME", "USER", "XDG_CONFIG_HOME")
+CLIENT_ENV_PREFIXES = ("FLOW_", "GIT_CONFIG")
+
+
+def forward(sock_path: str, argv: list) -> dict:
+    """Send one command to the server and return its response."""
+    env = {
+        k: v
+        for k, v in os.environ.items()
+        if k in CLIENT_ENV or k.startswith(CLIENT_ENV_PREFIXES)
+    }
+    request = {"argv": argv, "cwd": os.getcwd(), "env": env}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(sock_path)
+        conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks) or b"{}")
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    sock_path = os.environ.get("FLOW_SERVE_SOCKET")
+    if sock_path and argv and "-" not in argv:
+        try:
+            response = forward(sock_path, argv)
+        except (OSError, ValueError):
+            response = {}
+        if "code" in response:
+            sys.stdout.write(response.get("stdout", ""))
+            sys.stderr.write(response.get("stderr", ""))
+            sys.stdout.flush()
+            sys.exit(response["code"])
+    # Not served: run flowctl in this process (imported, so bytecode is cached)
+    sys.argv[0] = FLOWCTL
+    sys.path.insert(0, os.path.dirname(FLOWCTL))
+    import flowctl
+
+    flowctl.main(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,52 +3,29 @@
 转换 extract-data-2025-12-25.json 到 SkinLab 格式
 
 将抓取的产品数据转换为符合 SkinLab Product 模型的格式
+
+使用方法：
+    python3 convert_extracted_data.py --input extract-data.json --output products_converted.json
+    python3 convert_extracted_data.py --input extract-data.jsonl --output products_converted.jsonl
+
+输入/输出以 .jsonl / .ndjson 结尾时按 JSON Lines 处理（每行一个产品），
+产品逐条读取、转换并写出。
 """
 
-import json
-import re
-from typing import Dict, List, Any
-
-# 产品分类映射
-CATEGORY_MAPPING = {
-    'cleanser': ['cleanser', 'cleansing', 'face wash', 'facial cleanser', 'mousse', 'cream-to-foam'],
-    'toner': ['toner', 'essence', 'lotion p50', 'exfoliating toner'],
-    'serum': ['serum', 'treatment', 'oil', 'facial oil', 'elixir', 'dew drops', 'boosters'],
-    'moisturizer': ['moisturizer', 'cream', 'lotion', 'emulsion', 'gel', 'hydrating'],
-    'sunscreen': ['sunscreen', 'spf', 'glow screen', 'mineral sunscreen'],
-    'mask': ['mask', 'facial mist'],
-    'exfoliant': ['exfoliant', 'peel', 'polish', 'micro polish'],
-    'eyeCream': ['eye cream', 'eye', 'undereye'],
-    'other': ['patch', 'dots', 'ointment', 'lip', 'body cream', 'bum bum']
-}
-
-# 肤质关键词映射
-SKIN_TYPE_KEYWORDS = {
-    'dry': ['dry', 'dehydrated', 'moisture', 'hydrat'],
-    'oily': ['oily', 'oil control', 'shine control', 'sebum'],
-    'sensitive': ['sensitive', 'gentle', 'soothing', 'calm'],
-    'combination': ['combination', 'balanced']
-}
-
-# 护肤问题关键词映射
-CONCERN_KEYWORDS = {
-    'acne': ['acne', 'breakout', 'blemish', 'pimple', 'cystic'],
-    'aging': ['aging', 'anti-aging', 'wrinkle', 'fine line', 'firm'],
-    'pigmentation': ['pigment', 'dark spot', 'discoloration', 'brighten', 'radiance'],
-    'sensitivity': ['sensitive', 'irritation', 'redness', 'soothing'],
-    'dryness': ['dry', 'dehydrat', 'moisture', 'hydrat'],
-    'pores': ['pore', 'clog', 'blackhead']
-}
+import argparse
+from typing import Dict, List
+
+from data_validation import iter_records, open_writer
+from rule_engine import load_rules
+
+# 分类 / 肤质 / 护肤问题的关键词规则（normalization_rules.json，与 data_validation.py 共用）
+NORMALIZATION_RULES = load_rules()
 
 def infer_category(product_name: str, description: str) -> str:
     """推断产品分类"""
-    combined = (product_name + ' ' + description).lower()
-
-    for category, keywords in CATEGORY_MAPPING.items():
-        for keyword in keywords:
-            if keyword in combined:
-                return category
-    return 'other'
+    rules = NORMALIZATION_RULES['extracted_category']
+    hit = rules.first(product_name + ' ' + description)
+    return hit.value if hit else rules.default
 
 def infer_skin_types(description: str, reviews: List[Dict]) -> List[str]:
     """推断适用肤质"""
@@ -56,18 +33,14 @@ def infer_skin_types(description: str, reviews: List[Dict]) -> List[str]:
     for review in reviews:
         combined += ' ' + review.get('reviewText', '').lower()
 
-    skin_types = []
-    for skin_type, keywords in SKIN_TYPE_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in combined:
-                skin_types.append(skin_type)
-                break
+    rules = NORMALIZATION_RULES['skin_type']
+    skin_types = [hit.value for hit in rules.all(combined)]
 
     # 如果没有明确的肤质，默认 normal
     if not skin_types:
-        skin_types.append('normal')
+        skin_types.append(rules.default)
 
-    return list(set(skin_types))
+    return list(dict.fromkeys(skin_types))
 
 def infer_concerns(description: str, reviews: List[Dict]) -> List[str]:
     """推断针对问题"""
@@ -75,14 +48,9 @@ def infer_concerns(description: str, reviews: List[Dict]) -> List[str]:
     for review in reviews:
         combined += ' ' + review.get('reviewText', '').lower()
 
-    concerns = []
-    for concern, keywords in CONCERN_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in combined:
-                concerns.append(concern)
-                break
+    concerns = [hit.value for hit in NORMALIZATION_RULES['concern'].all(combined)]
 
-    return list(set(concerns))
+    return list(dict.fromkeys(concerns))
 
 def extract_ingredients_from_description(description: str) -> List[str]:
     """从描述中提取成分"""
@@ -115,7 +83,7 @@ def extract_ingredients_from_description(description: str) -> List[str]:
         if keyword in desc_lower:
             ingredients.append(ingredient_name)
 
-    return list(set(ingredients))
+    return list(dict.fromkeys(ingredients))
 
 def calculate_average_rating(reviews: List[Dict]) -> float:
     """计算平均评分"""
@@ -173,81 +141,92 @@ def extract_brand(product_name: str) -> str:
     return product_name.split()[0]
 
 def convert_to_skinlab_format(input_file: str, output_file: str):
-    """转换为 SkinLab 格式"""
-
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    products = data['skincareProducts']
-    converted_products = []
-
-    print(f"开始转换 {len(products)} 个产品...\n")
-
-    for idx, product in enumerate(products, 1):
-        product_name = product['productName']
-        description = product['productDescription']
-        reviews = product.get('userReviews', [])
-
-        # 提取品牌
-        brand = extract_brand(product_name)
-
-        # 生成 ID
-        product_id = f"product-{idx:03d}"
-
-        # 推断分类
-        category = infer_category(product_name, description)
-
-        # 推断肤质和问题
-        skin_types = infer_skin_types(description, reviews)
-        concerns = infer_concerns(description, reviews)
-
-        # 提取成分
-        ingredients = extract_ingredients_from_description(description)
-
-        # 计算评分
-        avg_rating = calculate_average_rating(reviews)
-
-        # 推断价格档位
-        price_range = infer_price_range(product_name, brand)
-
-        converted = {
-            'id': product_id,
-            'name': product_name,
-            'brand': brand,
-            'category': category,
-            'skinTypes': skin_types,
-            'concerns': concerns,
-            'priceRange': price_range,
-            'ingredients': ingredients,
-            'averageRating': avg_rating,
-            'sampleSize': len(reviews),
-            'description': description,
-            'sourceUrl': product.get('productName_citation', ''),
-            'userReviews': reviews[:3]  # 保留前 3 条评价
-        }
-
-        converted_products.append(converted)
-
-        print(f"{idx}. {product_name}")
-        print(f"   品牌: {brand}")
-        print(f"   分类: {category}")
-        print(f"   成分: {len(ingredients)} 个")
-        print(f"   评分: {avg_rating}/5 ({len(reviews)} 条评价)")
-        print()
-
-    output_data = {'products': converted_products}
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    """转换为 SkinLab 格式（逐条读取和写出）"""
+
+    total = 0
+    ingredient_total = 0
+    rating_sum = 0
+    rating_count = 0
+
+    print(f"开始转换: {input_file}\n")
+
+    with open(input_file, 'r', encoding='utf-8') as fin, \
+            open(output_file, 'w', encoding='utf-8') as fout:
+        writer = open_writer(fout, output_file, 'products')
+
+        for idx, product in enumerate(iter_records(fin, input_file, 'skincareProducts'), 1):
+            product_name = product['productName']
+            description = product['productDescription']
+            reviews = product.get('userReviews', [])
+
+            # 提取品牌
+            brand = extract_brand(product_name)
+
+            # 生成 ID
+            product_id = f"product-{idx:03d}"
+
+            # 推断分类
+            category = infer_category(product_name, description)
+
+            # 推断肤质和问题
+            skin_types = infer_skin_types(description, reviews)
+            concerns = infer_concerns(description, reviews)
+
+            # 提取成分
+            ingredients = extract_ingredients_from_description(description)
+
+            # 计算评分
+            avg_rating = calculate_average_rating(reviews)
+
+            # 推断价格档位
+            price_range = infer_price_range(product_name, brand)
+
+            converted = {
+                'id': product_id,
+                'name': product_name,
+                'brand': brand,
+                'category': category,
+                'skinTypes': skin_types,
+                'concerns': concerns,
+                'priceRange': price_range,
+                'ingredients': ingredients,
+                'averageRating': avg_rating,
+                'sampleSize': len(reviews),
+                'description': description,
+                'sourceUrl': product.get('productName_citation', ''),
+                'userReviews': reviews[:3]  # 保留前 3 条评价
+            }
+
+            writer.write(converted)
+            total += 1
+            ingredient_total += len(ingredients)
+            if avg_rating:
+                rating_sum += avg_rating
+                rating_count += 1
+
+            print(f"{idx}. {product_name}")
+            print(f"   品牌: {brand}")
+            print(f"   分类: {category}")
+            print(f"   成分: {len(ingredients)} 个")
+            print(f"   评分: {avg_rating}/5 ({len(reviews)} 条评价)")
+            print()
+
+        writer.close()
 
     print(f"✓ 转换完成！已保存到: {output_file}")
     print(f"\n统计:")
-    print(f"  总产品数: {len(converted_products)}")
-    print(f"  平均成分数: {sum(len(p['ingredients']) for p in converted_products) / len(converted_products):.1f}")
-    print(f"  平均评分: {sum(p['averageRating'] for p in converted_products if p['averageRating']) / len([p for p in converted_products if p['averageRating']]):.2f}/5")
+    print(f"  总产品数: {total}")
+    if total:
+        print(f"  平均成分数: {ingredient_total / total:.1f}")
+    if rating_count:
+        print(f"  平均评分: {rating_sum / rating_count:.2f}/5")
 
 if __name__ == '__main__':
-    convert_to_skinlab_format(
-        '/Users/ruirui/Downloads/extract-data-2025-12-25.json',
-        '/Users/ruirui/Code/Ai_Code/SkinLab/products_converted.json'
-    )
+    parser = argparse.ArgumentParser(description="转换抓取的产品数据为 SkinLab 格式")
+    parser.add_argument('--input', default='/Users/ruirui/Downloads/extract-data-2025-12-25.json',
+                        help="抓取数据文件（JSON: {\"skincareProducts\": [...]} 或 JSONL）")
+    parser.add_argument('--output', default='/Users/ruirui/Code/Ai_Code/SkinLab/products_converted.json',
+                        help="输出文件（.json 或 .jsonl）")
+    args = parser.parse_args()
+
+    convert_to_skinlab_format(args.input, args.output)
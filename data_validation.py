@@ -10,15 +10,29 @@ SkinLab 数据验证和清洗脚本
 使用方法：
     python3 data_validation.py --input ingredients_seed.json --output ingredients.json --type ingredient
     python3 data_validation.py --input products_seed.json --output products.json --type product
+    python3 data_validation.py --input products_big.json --output products.json --type product --stream
+    python3 data_validation.py --input products.jsonl --output products_validated.jsonl --type product
+    python3 data_validation.py --input products_big.json --output products.json --type product --jobs 4
+    python3 data_validation.py --input products_big.json --output products.json --type product \
+        --log-level quiet --diagnostics diagnostics.jsonl
+
+输入/输出文件以 .jsonl / .ndjson 结尾时按 JSON Lines 处理（每行一条记录；
+成分记录用 "key" 字段携带原来的键）。产品的 JSONL 输入或输出总是流式处理。
 """
 
+import contextlib
+import io
 import json
+import os
 import sys
 import argparse
-from typing import Dict, List, Any, Tuple
-from collections import Counter
+from typing import Dict, List, Any, Tuple, Iterator, Iterable, IO, Union, Callable, Optional
+from collections import Counter, deque
+from itertools import chain, islice
 import re
 
+from rule_engine import load_rules
+
 
 # ==================== 配置 ====================
 
@@ -37,6 +51,146 @@ PRODUCT_CATEGORIES = [
 
 PRICE_RANGES = ["budget", "midRange", "premium", "luxury"]
 
+# 分类 / function / irritationRisk 的映射规则（normalization_rules.json，导入时编译一次）
+NORMALIZATION_RULES = load_rules()
+
+# 流式读取时每次读入的字符数
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 报告中最多列出的问题数
+REPORT_MAX_ERRORS = 20
+
+# --jobs 模式下每批发送给工作进程的记录数
+PARALLEL_BATCH_SIZE = 256
+
+# 逐条日志级别：debug 打印每条记录的处理进度（默认，即原有输出），info 只打印
+# 映射/推断/提示，warning 只打印警告，quiet 都不打印（报告中改为输出统计表）
+LOG_LEVELS = {"debug": 10, "info": 20, "warning": 30, "quiet": 100}
+
+# 诊断事件缓冲条数，满后一次性写入 --diagnostics 文件
+DIAG_BUFFER_SIZE = 1000
+
+# 诊断事件编码器（复用实例，省去 json.dumps 每次构造的开销）
+DIAG_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# 统计表中各诊断事件的名称
+DIAG_EVENT_LABELS = {
+    "record": "处理记录",
+    "key_mismatch": "提示: key 与 name 不匹配",
+    "safety_rating_default": "警告: safetyRating 使用默认值",
+    "map_function": "映射: function",
+    "map_irritation_risk": "映射: irritationRisk",
+    "map_category": "映射: category",
+    "price_unparsed": "警告: 无法解析 price",
+    "infer_price_range": "推断: priceRange",
+    "rating_default": "警告: averageRating 使用默认值",
+}
+
+# JSON Lines（每行一条记录）文件扩展名
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+# JSONL 成分记录中保存原键的字段
+INGREDIENT_KEY_FIELD = "key"
+
+
+# ==================== 日志与诊断 ====================
+
+class Diagnostics:
+    """逐条记录的诊断信息：按级别打印，全部计数，可缓冲后批量写入 JSONL 文件"""
+
+    def __init__(self, level: str = "debug", sink: Optional[IO[str]] = None, collect: bool = False):
+        self.level_name = level
+        self.level = LOG_LEVELS[level]
+        self.sink = sink
+        # 工作进程没有 sink，只收集事件随批次结果传回
+        self.collect = collect
+        self.counts = Counter()
+        self.buffer = []
+
+    def emit(self, level: str, event: str, message: str, **fields: Any):
+        self.counts[event] += 1
+        if LOG_LEVELS[level] >= self.level:
+            print(message)
+        if self.sink is not None or self.collect:
+            record = {"level": level, "event": event, **fields, "message": message.strip()}
+            self.buffer.append(DIAG_ENCODER.encode(record) + "\n")
+            if len(self.buffer) >= DIAG_BUFFER_SIZE:
+                self.flush()
+
+    def flush(self):
+        if self.sink is not None and self.buffer:
+            self.sink.write("".join(self.buffer))
+            self.buffer = []
+
+    def take(self) -> Tuple[Counter, List[str]]:
+        """取出并清空计数和事件（工作进程用）"""
+        taken = (self.counts, self.buffer)
+        self.counts, self.buffer = Counter(), []
+        return taken
+
+    def merge(self, counts: Counter, lines: List[str]):
+        """合并工作进程传回的计数和事件"""
+        self.counts.update(counts)
+        if self.sink is not None:
+            self.buffer.extend(lines)
+            if len(self.buffer) >= DIAG_BUFFER_SIZE:
+                self.flush()
+
+    def print_summary(self):
+        """诊断统计表（逐条日志被隐藏时代替逐条输出）"""
+        print("\n诊断统计:")
+        for event, count in sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0])):
+            print(f"  {DIAG_EVENT_LABELS.get(event, event)}: {count}")
+
+
+DIAG = Diagnostics()
+
+
+# ==================== 并行处理 ====================
+
+def _init_worker(level: str):
+    global DIAG
+    DIAG = Diagnostics(level, collect=True)
+
+
+def _run_batch(func: Callable, batch: List[tuple]) -> Tuple[List[Any], str, Tuple[Counter, List[str]]]:
+    """工作进程：处理一批记录，并收集期间打印的内容和诊断事件"""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        results = [func(*item) for item in batch]
+    return results, buf.getvalue(), DIAG.take()
+
+
+def map_records(func: Callable, items: Iterable[tuple], jobs: int = 1) -> Iterator[Any]:
+    """按输入顺序逐条返回 func(*item) 的结果
+
+    jobs > 1 时分批交给进程池处理；每批的打印输出按顺序回放，
+    因此结果和 stdout 都与串行运行完全一致。同时在途的批次有上限，
+    流式输入不会被一次性读入内存。
+    """
+    if jobs <= 1:
+        for item in items:
+            yield func(*item)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    items = iter(items)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(DIAG.level_name,)) as pool:
+        pending = deque()
+        while True:
+            batch = list(islice(items, PARALLEL_BATCH_SIZE))
+            if batch:
+                pending.append(pool.submit(_run_batch, func, batch))
+            if pending and (not batch or len(pending) >= jobs * 2):
+                results, output, diagnostics = pending.popleft().result()
+                sys.stdout.write(output)
+                DIAG.merge(*diagnostics)
+                yield from results
+            elif not batch:
+                return
+
 
 # ==================== 成分验证 ====================
 
@@ -96,45 +250,46 @@ def clean_ingredient(key: str, ingredient: Dict[str, Any]) -> Dict[str, Any]:
     if "name" in cleaned:
         standard_key = re.sub(r'[^a-z0-9]', '', cleaned["name"].lower())
         if standard_key != key:
-            print(f"  提示: key '{key}' 不匹配 name '{cleaned['name']}'，建议使用: '{standard_key}'")
+            DIAG.emit("info", "key_mismatch",
+                      f"  提示: key '{key}' 不匹配 name '{cleaned['name']}'，建议使用: '{standard_key}'",
+                      id=key, suggested=standard_key)
 
     # 转换 safetyRating 为整数
     if "safetyRating" in cleaned:
         try:
             cleaned["safetyRating"] = max(1, min(10, int(cleaned["safetyRating"])))
         except (ValueError, TypeError):
-            print(f"  警告: 无法转换 safetyRating，使用默认值 5")
+            DIAG.emit("warning", "safety_rating_default", "  警告: 无法转换 safetyRating，使用默认值 5",
+                      id=key, value=str(cleaned["safetyRating"]))
             cleaned["safetyRating"] = 5
 
-    # 标准化 function
+    # 标准化 function（尝试映射常见的错误值）
     if "function" in cleaned and cleaned["function"] not in INGREDIENT_FUNCTIONS:
-        # 尝试映射常见的错误值
-        func_mapping = {
-            "solvent": "other",
-            "humectant": "moisturizing",
-            "emollient": "moisturizing",
-            "whitening": "brightening",
-            "anti-aging": "antiAging",
-            "antioxidant": "antiAging"
-        }
+        rules = NORMALIZATION_RULES["ingredient_function"]
         original = cleaned["function"]
-        cleaned["function"] = func_mapping.get(original.lower(), "other")
-        if original.lower() in func_mapping:
-            print(f"  映射: function '{original}' → '{cleaned['function']}'")
+        hit = rules.first(original)
+        cleaned["function"] = hit.value if hit else rules.default
+        if hit:
+            DIAG.emit("info", "map_function", f"  映射: function '{original}' → '{cleaned['function']}'",
+                      id=key, original=original, value=cleaned["function"], rule=hit.rule)
 
     # 标准化 irritationRisk
     if "irritationRisk" in cleaned:
         risk = cleaned["irritationRisk"].lower()
         if risk not in IRRITATION_LEVELS:
             # 尝试映射
-            risk_mapping = {"minimal": "none", "very low": "low", "moderate": "medium", "severe": "high"}
-            cleaned["irritationRisk"] = risk_mapping.get(risk, "low")
-            print(f"  映射: irritationRisk '{ingredient['irritationRisk']}' → '{cleaned['irritationRisk']}'")
+            rules = NORMALIZATION_RULES["irritation_risk"]
+            hit = rules.first(risk)
+            cleaned["irritationRisk"] = hit.value if hit else rules.default
+            DIAG.emit("info", "map_irritation_risk",
+                      f"  映射: irritationRisk '{ingredient['irritationRisk']}' → '{cleaned['irritationRisk']}'",
+                      id=key, original=ingredient["irritationRisk"], value=cleaned["irritationRisk"],
+                      rule=hit.rule if hit else None)
 
     # 清洗 aliases（如果存在）
     if "aliases" in cleaned and isinstance(cleaned["aliases"], list):
         cleaned["aliases"] = [re.sub(r'[^a-z0-9]', '', alias.lower()) for alias in cleaned["aliases"]]
-        cleaned["aliases"] = list(set(cleaned["aliases"]))  # 去重
+        cleaned["aliases"] = list(dict.fromkeys(cleaned["aliases"]))  # 去重但保持顺序
 
     # 清洗 benefits
     if "benefits" in cleaned and isinstance(cleaned["benefits"], list):
@@ -153,22 +308,25 @@ def clean_ingredient(key: str, ingredient: Dict[str, Any]) -> Dict[str, Any]:
     return cleaned
 
 
-def validate_ingredients_json(data: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
-    """验证和清洗整个成分 JSON"""
+def process_ingredient(key: str, ingredient: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+    """验证并清洗单个成分，返回 (问题列表, 清洗结果)"""
+    item_errors = validate_ingredient(key, ingredient)
+    DIAG.emit("debug", "record", f"处理: {key}", id=key)
+    return item_errors, clean_ingredient(key, ingredient)
+
+
+def validate_ingredients_json(data: Dict[str, Any], jobs: int = 1) -> Tuple[List[str], Dict[str, Any]]:
+    """验证和清洗整个成分 JSON（jobs > 1 时多进程处理，结果顺序不变）"""
     errors = []
     cleaned = {}
 
     print("\n开始验证成分数据...")
     print(f"总计: {len(data)} 个成分\n")
 
-    for key, ingredient in data.items():
-        # 验证
-        item_errors = validate_ingredient(key, ingredient)
+    results = map_records(process_ingredient, data.items(), jobs)
+    for key, (item_errors, cleaned_ingredient) in zip(data, results):
         errors.extend(item_errors)
-
-        # 清洗
-        print(f"处理: {key}")
-        cleaned[key] = clean_ingredient(key, ingredient)
+        cleaned[key] = cleaned_ingredient
 
     # 检查重复的 name
     names = [ing.get("name", "") for ing in data.values()]
@@ -239,25 +397,14 @@ def clean_product(product: Dict[str, Any]) -> Dict[str, Any]:
 
     # 标准化 category
     if "category" in cleaned and cleaned["category"] not in PRODUCT_CATEGORIES:
-        cat_mapping = {
-            "face wash": "cleanser",
-            "facial cleanser": "cleanser",
-            "essence": "serum",
-            "cream": "moisturizer",
-            "lotion": "moisturizer",
-            "sun protection": "sunscreen",
-            "spf": "sunscreen",
-            "sheet mask": "mask",
-            "eye": "eyeCream"
-        }
-        original = cleaned["category"].lower()
-        for key, value in cat_mapping.items():
-            if key in original:
-                cleaned["category"] = value
-                print(f"  映射: category '{product['category']}' → '{value}'")
-                break
+        rules = NORMALIZATION_RULES["product_category"]
+        hit = rules.first(cleaned["category"])
+        if hit:
+            cleaned["category"] = hit.value
+            DIAG.emit("info", "map_category", f"  映射: category '{product['category']}' → '{hit.value}'",
+                      id=product.get("id"), original=product["category"], value=hit.value, rule=hit.rule)
         else:
-            cleaned["category"] = "other"
+            cleaned["category"] = rules.default
 
     # 清洗 ingredients（转为字符串数组）
     if "ingredients" in cleaned:
@@ -275,7 +422,8 @@ def clean_product(product: Dict[str, Any]) -> Dict[str, Any]:
             price_str = str(cleaned["price"]).replace("$", "").replace(",", "").strip()
             cleaned["price"] = float(price_str)
         except (ValueError, TypeError):
-            print(f"  警告: 无法解析 price '{cleaned['price']}'，保持原值")
+            DIAG.emit("warning", "price_unparsed", f"  警告: 无法解析 price '{cleaned['price']}'，保持原值",
+                      id=product.get("id"), value=str(cleaned["price"]))
 
     # 映射 price → priceRange
     if "price" in cleaned and "priceRange" not in cleaned:
@@ -288,7 +436,9 @@ def clean_product(product: Dict[str, Any]) -> Dict[str, Any]:
             cleaned["priceRange"] = "premium"
         else:
             cleaned["priceRange"] = "luxury"
-        print(f"  推断: priceRange = '{cleaned['priceRange']}' (price: ${price})")
+        DIAG.emit("info", "infer_price_range",
+                  f"  推断: priceRange = '{cleaned['priceRange']}' (price: ${price})",
+                  id=product.get("id"), price=price, value=cleaned["priceRange"])
 
     # 清洗 averageRating
     if "averageRating" in cleaned:
@@ -296,14 +446,23 @@ def clean_product(product: Dict[str, Any]) -> Dict[str, Any]:
             rating = float(cleaned["averageRating"])
             cleaned["averageRating"] = max(0, min(5, round(rating, 1)))
         except (ValueError, TypeError):
-            print(f"  警告: 无效的 averageRating，使用默认值 0")
+            DIAG.emit("warning", "rating_default", "  警告: 无效的 averageRating，使用默认值 0",
+                      id=product.get("id"), value=str(cleaned["averageRating"]))
             cleaned["averageRating"] = 0
 
     return cleaned
 
 
-def validate_products_json(data: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
-    """验证和清洗整个产品 JSON"""
+def process_product(product: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+    """验证并清洗单个产品，返回 (问题列表, 清洗结果)"""
+    item_errors = validate_product(product)
+    pid = product.get("id", "unknown")
+    DIAG.emit("debug", "record", f"处理: {pid} - {product.get('name', '')}", id=pid)
+    return item_errors, clean_product(product)
+
+
+def validate_products_json(data: Dict[str, Any], jobs: int = 1) -> Tuple[List[str], Dict[str, Any]]:
+    """验证和清洗整个产品 JSON（jobs > 1 时多进程处理，结果顺序不变）"""
     errors = []
 
     if "products" not in data:
@@ -317,15 +476,9 @@ def validate_products_json(data: Dict[str, Any]) -> Tuple[List[str], Dict[str, A
 
     cleaned_products = []
 
-    for product in products:
-        # 验证
-        item_errors = validate_product(product)
+    for item_errors, cleaned in map_records(process_product, ((p,) for p in products), jobs):
         errors.extend(item_errors)
-
-        # 清洗
-        pid = product.get("id", "unknown")
-        print(f"处理: {pid} - {product.get('name', '')}")
-        cleaned_products.append(clean_product(product))
+        cleaned_products.append(cleaned)
 
     # 检查重复的 id
     ids = [p.get("id", "") for p in products]
@@ -336,6 +489,319 @@ def validate_products_json(data: Dict[str, Any]) -> Tuple[List[str], Dict[str, A
     return errors, {"products": cleaned_products}
 
 
+# ==================== 流式处理 ====================
+
+def iter_json_array(f: IO[str], key: str, raw: bool = False) -> Iterator[Any]:
+    """逐条读取顶层对象中 key 数组的元素，不整体加载文件
+
+    内存只保留当前元素和一个读取块。其他顶层键会被解析后丢弃。
+    raw=True 时返回每个元素的 JSON 原文（交给工作进程解析）。
+    缺少 key 时在产出第一个元素之前抛出 KeyError，JSON 格式错误时抛出 json.JSONDecodeError。
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        # 丢弃已消费的部分，再读入一块
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = f.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                return ""
+
+    def expect(ch: str) -> None:
+        nonlocal pos
+        if peek() != ch:
+            raise json.JSONDecodeError(f"期望 '{ch}'", buf, pos)
+        pos += 1
+
+    def value(as_text: bool = False) -> Any:
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # 元素跨越了读取块边界：读入更多后重试
+                if fill():
+                    continue
+                raise
+            # 数字恰好在块末尾时可能被截断（如 "12" | "3"）
+            if end == len(buf) and fill():
+                continue
+            start, pos = pos, end
+            return buf[start:end] if as_text else obj
+
+    expect("{")
+    if peek() == "}":
+        raise KeyError(key)
+    while True:
+        name = value()
+        expect(":")
+        if name == key:
+            expect("[")
+            if peek() == "]":
+                return
+            while True:
+                yield value(raw)
+                if peek() == ",":
+                    pos += 1
+                    continue
+                expect("]")
+                return
+        value()  # 跳过其他顶层键
+        if peek() == ",":
+            pos += 1
+            continue
+        expect("}")
+        raise KeyError(key)
+
+
+def is_jsonl(path: str) -> bool:
+    """按扩展名判断是否为 JSON Lines 文件"""
+    return path.lower().endswith(JSONL_SUFFIXES)
+
+
+def iter_jsonl(f: IO[str]) -> Iterator[Any]:
+    """逐行读取 JSON Lines（跳过空行），出错时报告行号"""
+    for lineno, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"第 {lineno} 行: {e.msg}", e.doc, e.pos) from None
+
+
+def iter_records(f: IO[str], path: str, key: str, raw: bool = False) -> Iterator[Any]:
+    """逐条读取记录：JSONL 每行一条，JSON 则读取顶层 key 数组
+
+    raw=True 时返回每条记录的 JSON 原文而不是解析结果。
+    """
+    if not is_jsonl(path):
+        return iter_json_array(f, key, raw)
+    if raw:
+        return (line.strip() for line in f if line.strip())
+    return iter_jsonl(f)
+
+
+class JSONArrayWriter:
+    """逐条写出 {key: [...]}，格式与 json.dump(indent=2) 完全一致"""
+
+    def __init__(self, f: IO[str], key: str = "products"):
+        self.f = f
+        self.count = 0
+        f.write("{\n  " + json.dumps(key, ensure_ascii=False) + ": [")
+
+    @staticmethod
+    def render(record: Any) -> str:
+        return json.dumps(record, ensure_ascii=False, indent=2).replace("\n", "\n    ")
+
+    def write_text(self, text: str):
+        """写出一条已由 render 渲染的记录"""
+        self.f.write(("," if self.count else "") + "\n    " + text)
+        self.count += 1
+
+    def write(self, record: Any):
+        self.write_text(self.render(record))
+
+    def close(self):
+        self.f.write("\n  ]\n}" if self.count else "]\n}")
+
+
+class JSONLWriter:
+    """逐条写出 JSON Lines"""
+
+    def __init__(self, f: IO[str]):
+        self.f = f
+        self.count = 0
+
+    @staticmethod
+    def render(record: Any) -> str:
+        return json.dumps(record, ensure_ascii=False)
+
+    def write_text(self, text: str):
+        """写出一条已由 render 渲染的记录"""
+        self.f.write(text + "\n")
+        self.count += 1
+
+    def write(self, record: Any):
+        self.write_text(self.render(record))
+
+    def close(self):
+        pass
+
+
+def open_writer(f: IO[str], path: str, key: str) -> Union[JSONArrayWriter, JSONLWriter]:
+    """按输出文件扩展名选择记录写出格式"""
+    return JSONLWriter(f) if is_jsonl(path) else JSONArrayWriter(f, key)
+
+
+def read_ingredients_jsonl(f: IO[str]) -> Dict[str, Any]:
+    """读取成分 JSONL 为 {key: 成分}；缺少 key 字段时由 name 生成"""
+    data = {}
+    for record in iter_jsonl(f):
+        record = dict(record)
+        key = record.pop(INGREDIENT_KEY_FIELD, None)
+        if not key:
+            key = re.sub(r'[^a-z0-9]', '', str(record.get("name", "")).lower())
+        data[key] = record
+    return data
+
+
+def write_ingredients_jsonl(data: Dict[str, Any], f: IO[str]):
+    """写出成分 JSONL，每行 {"key": 键, ...成分字段}"""
+    writer = JSONLWriter(f)
+    for key, ingredient in data.items():
+        writer.write({INGREDIENT_KEY_FIELD: key, **ingredient})
+
+
+class ProductStats:
+    """产品报告统计，逐条累加（流式模式无需保留全部产品）"""
+
+    def __init__(self):
+        self.total = 0
+        self.categories = Counter()
+        self.price_ranges = Counter()
+        self.ing_count_sum = 0
+        self.ing_count_n = 0
+        self.ing_count_min = None
+        self.ing_count_max = None
+        self.rating_sum = 0
+        self.rating_n = 0
+
+    @staticmethod
+    def summarize(product: Dict[str, Any]) -> tuple:
+        """报告和查重所需的字段：(id, category, priceRange, 成分数或 None, averageRating)"""
+        ings = product.get("ingredients")
+        return (
+            product.get("id", ""),
+            product.get("category"),
+            product.get("priceRange"),
+            len(ings) if isinstance(ings, list) else None,
+            product.get("averageRating"),
+        )
+
+    def add(self, product: Dict[str, Any]):
+        self.add_summary(self.summarize(product))
+
+    def add_summary(self, summary: tuple):
+        _, category, price_range, n, rating = summary
+        self.total += 1
+        self.categories[category] += 1
+        self.price_ranges[price_range] += 1
+        if n is not None:
+            self.ing_count_sum += n
+            self.ing_count_n += 1
+            self.ing_count_min = n if self.ing_count_min is None else min(self.ing_count_min, n)
+            self.ing_count_max = n if self.ing_count_max is None else max(self.ing_count_max, n)
+        if rating:
+            self.rating_sum += rating
+            self.rating_n += 1
+
+    def print_summary(self):
+        print(f"\n总产品数: {self.total}")
+
+        # 统计 category 分布
+        print("\n产品分类分布:")
+        for cat, count in self.categories.most_common():
+            print(f"  {cat}: {count}")
+
+        # 统计 priceRange 分布
+        print("\n价格档位分布:")
+        for pr, count in self.price_ranges.most_common():
+            print(f"  {pr}: {count}")
+
+        # 统计成分数量
+        if self.ing_count_n:
+            print(f"\n成分数量: 平均 {self.ing_count_sum/self.ing_count_n:.1f}, 范围 [{self.ing_count_min}, {self.ing_count_max}]")
+
+        # 评分统计
+        if self.rating_n:
+            print(f"\n平均评分: {self.rating_sum/self.rating_n:.2f}")
+
+
+def render_product(record: Union[str, Dict[str, Any]], jsonl: bool) -> Tuple[List[str], str, tuple]:
+    """验证、清洗并渲染单个产品，返回 (问题列表, 输出文本, 统计摘要)
+
+    record 可以是 JSON 原文：--jobs 模式下解析和渲染都在工作进程中完成，
+    主进程只负责读写文本。
+    """
+    product = json.loads(record) if isinstance(record, str) else record
+    item_errors, cleaned = process_product(product)
+    writer = JSONLWriter if jsonl else JSONArrayWriter
+    return item_errors, writer.render(cleaned), ProductStats.summarize(cleaned)
+
+
+def validate_products_stream(
+    products: Iterable[Union[str, Dict[str, Any]]],
+    writer: Union[JSONArrayWriter, JSONLWriter],
+    jobs: int = 1,
+) -> Tuple[List[str], int, ProductStats]:
+    """流式验证和清洗产品：逐条读取、清洗并立即写出
+
+    products 为产品或其 JSON 原文（jobs > 1 时建议传原文，见 iter_records）。
+    只保留前 REPORT_MAX_ERRORS 条问题（另返回问题总数）和每个 id 的计数
+    （用于查重），内存占用与产品总数基本无关。
+    """
+    errors = []
+    error_count = 0
+    stats = ProductStats()
+    id_counts = {}
+
+    def add_errors(new_errors: List[str]):
+        nonlocal error_count
+        error_count += len(new_errors)
+        errors.extend(new_errors[:REPORT_MAX_ERRORS - len(errors)])
+
+    print("\n开始流式验证产品数据...\n")
+
+    # 缺少根键时 iter_json_array 在取第一条之前就抛出 KeyError；
+    # 只在这里捕获，逐条处理中的 KeyError 照常抛出
+    products = iter(products)
+    try:
+        head = list(islice(products, 1))
+    except KeyError:
+        head = []
+        add_errors(["JSON 缺少 'products' 根键"])
+
+    jsonl = isinstance(writer, JSONLWriter)
+    items = ((p, jsonl) for p in chain(head, products))
+    for item_errors, text, summary in map_records(render_product, items, jobs):
+        add_errors(item_errors)
+        writer.write_text(text)
+        stats.add_summary(summary)
+
+        # clean_product 不修改 id
+        key = summary[0]
+        id_counts[key] = id_counts.get(key, 0) + 1
+    writer.close()
+
+    # 检查重复的 id
+    duplicates = [pid for pid, count in id_counts.items() if count > 1]
+    if duplicates:
+        add_errors([f"发现重复的产品 ID: {duplicates}"])
+
+    return errors, error_count, stats
+
+
 # ==================== 数据质量报告 ====================
 
 def generate_report(data_type: str, data: Dict[str, Any], errors: List[str]):
@@ -371,61 +837,120 @@ def generate_report(data_type: str, data: Dict[str, Any], errors: List[str]):
             print(f"  {field}: {count}/{total} ({100*count/total:.1f}%)")
 
     elif data_type == "product":
-        products = data.get("products", [])
-        total = len(products)
-        print(f"\n总产品数: {total}")
+        stats = ProductStats()
+        for product in data.get("products", []):
+            stats.add(product)
+        stats.print_summary()
 
-        # 统计 category 分布
-        categories = [p.get("category") for p in products]
-        print("\n产品分类分布:")
-        for cat, count in Counter(categories).most_common():
-            print(f"  {cat}: {count}")
+    if DIAG.level > LOG_LEVELS["debug"]:
+        DIAG.print_summary()
+    print_error_summary(errors, len(errors))
 
-        # 统计 priceRange 分布
-        prices = [p.get("priceRange") for p in products]
-        print("\n价格档位分布:")
-        for pr, count in Counter(prices).most_common():
-            print(f"  {pr}: {count}")
-
-        # 统计成分数量
-        ing_counts = [len(p.get("ingredients", [])) for p in products if isinstance(p.get("ingredients"), list)]
-        if ing_counts:
-            print(f"\n成分数量: 平均 {sum(ing_counts)/len(ing_counts):.1f}, 范围 [{min(ing_counts)}, {max(ing_counts)}]")
 
-        # 评分统计
-        ratings = [p.get("averageRating", 0) for p in products if p.get("averageRating")]
-        if ratings:
-            print(f"\n平均评分: {sum(ratings)/len(ratings):.2f}")
-
-    # 错误报告
-    print(f"\n发现 {len(errors)} 个问题:")
-    if errors:
-        for i, error in enumerate(errors[:20], 1):  # 最多显示 20 个
+def print_error_summary(errors: List[str], error_count: int):
+    """报告末尾的问题列表（errors 可以只是前若干条）"""
+    print(f"\n发现 {error_count} 个问题:")
+    if error_count:
+        for i, error in enumerate(errors[:REPORT_MAX_ERRORS], 1):
             print(f"  {i}. {error}")
-        if len(errors) > 20:
-            print(f"  ... 还有 {len(errors)-20} 个问题")
+        if error_count > REPORT_MAX_ERRORS:
+            print(f"  ... 还有 {error_count-REPORT_MAX_ERRORS} 个问题")
     else:
         print("  ✓ 数据验证通过")
 
     print("\n" + "="*60 + "\n")
 
 
+def run_product_stream(args) -> int:
+    """--stream 模式：边读边写，先写入临时文件，完成后再替换输出文件"""
+    print(f"读取文件: {args.input}")
+    try:
+        fin = open(args.input, "r", encoding="utf-8")
+    except FileNotFoundError:
+        print(f"错误: 文件不存在 - {args.input}")
+        return 1
+
+    tmp_output = args.output + ".tmp"
+    try:
+        with fin, open(tmp_output, "w", encoding="utf-8") as fout:
+            errors, error_count, stats = validate_products_stream(
+                iter_records(fin, args.input, "products", raw=args.jobs > 1),
+                open_writer(fout, args.output, "products"),
+                args.jobs,
+            )
+    except json.JSONDecodeError as e:
+        print(f"错误: JSON 格式错误 - {e.msg}")
+        os.remove(tmp_output)
+        return 1
+
+    # 生成报告
+    print("\n" + "="*60)
+    print("数据质量报告 (product)")
+    print("="*60)
+    stats.print_summary()
+    if DIAG.level > LOG_LEVELS["debug"]:
+        DIAG.print_summary()
+    print_error_summary(errors, error_count)
+
+    if error_count and args.strict:
+        os.remove(tmp_output)
+        print("严格模式：由于存在错误，不输出文件")
+        return 1
+
+    os.replace(tmp_output, args.output)
+    print(f"✓ 完成！输出文件已保存到: {args.output}")
+    return 1 if error_count else 0
+
+
 # ==================== 主程序 ====================
 
 def main():
     parser = argparse.ArgumentParser(description="验证和清洗 SkinLab 数据")
-    parser.add_argument("--input", required=True, help="输入 JSON 文件路径")
-    parser.add_argument("--output", required=True, help="输出 JSON 文件路径")
+    parser.add_argument("--input", required=True, help="输入 JSON / JSONL 文件路径")
+    parser.add_argument("--output", required=True, help="输出 JSON / JSONL 文件路径")
     parser.add_argument("--type", required=True, choices=["ingredient", "product"], help="数据类型")
     parser.add_argument("--strict", action="store_true", help="严格模式：有错误时不输出文件")
+    parser.add_argument("--stream", action="store_true",
+                        help="流式模式（仅 product）：逐条读取、清洗并写出，内存占用与文件大小无关")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="并行进程数（默认 1）；输出与串行运行完全一致")
+    parser.add_argument("--log-level", choices=list(LOG_LEVELS), default="debug",
+                        help="逐条日志级别（默认 debug 打印每条记录；quiet 只在报告中输出统计表）")
+    parser.add_argument("--diagnostics", help="把全部逐条诊断事件写入此 JSONL 文件（批量缓冲写入）")
 
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        print("错误: --jobs 必须 >= 1")
+        sys.exit(1)
+
+    global DIAG
+    sink = open(args.diagnostics, "w", encoding="utf-8") if args.diagnostics else None
+    DIAG = Diagnostics(args.log_level, sink)
+    try:
+        run(args)
+    finally:
+        DIAG.flush()
+        if sink is not None:
+            sink.close()
+
+
+def run(args):
+    """按参数执行验证（main 负责日志配置）"""
+
+    if args.stream and args.type != "product":
+        print("错误: --stream 目前只支持 --type product")
+        sys.exit(1)
+    # 产品的 JSONL 和并行处理都走流式路径（输出与非流式完全一致）
+    if args.type == "product" and (args.stream or args.jobs > 1
+                                   or is_jsonl(args.input) or is_jsonl(args.output)):
+        sys.exit(run_product_stream(args))
+
     # 读取输入文件
     print(f"读取文件: {args.input}")
     try:
         with open(args.input, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            data = read_ingredients_jsonl(f) if is_jsonl(args.input) else json.load(f)
     except FileNotFoundError:
         print(f"错误: 文件不存在 - {args.input}")
         sys.exit(1)
@@ -435,9 +960,9 @@ def main():
 
     # 验证和清洗
     if args.type == "ingredient":
-        errors, cleaned = validate_ingredients_json(data)
+        errors, cleaned = validate_ingredients_json(data, args.jobs)
     else:
-        errors, cleaned = validate_products_json(data)
+        errors, cleaned = validate_products_json(data, args.jobs)
 
     # 生成报告
     generate_report(args.type, cleaned, errors)
@@ -449,7 +974,10 @@ def main():
 
     print(f"写入文件: {args.output}")
     with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(cleaned, f, ensure_ascii=False, indent=2)
+        if is_jsonl(args.output):
+            write_ingredients_jsonl(cleaned, f)
+        else:
+            json.dump(cleaned, f, ensure_ascii=False, indent=2)
 
     print(f"✓ 完成！输出文件已保存到: {args.output}")
 
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+JSON ⇄ JSON Lines 转换脚本
+
+在数据管道的 JSON 文档（products_*.json 等）和 JSONL（每行一条记录）之间转换，
+方便按记录追加、拆分、并行处理和局部重跑。格式由扩展名决定（.jsonl / .ndjson 为 JSONL）。
+
+使用方法：
+    python3 jsonl_convert.py --input products_final.json --output products_final.jsonl --type product
+    python3 jsonl_convert.py --input products_final.jsonl --output products_final.json --type product
+    python3 jsonl_convert.py --input ingredients.json --output ingredients.jsonl --type ingredient
+    python3 jsonl_convert.py --input extract-data.json --output extract-data.jsonl --type extracted
+
+product / extracted 逐条流式转换；JSONL → JSON 的输出与 json.dump(indent=2) 完全一致。
+"""
+
+import argparse
+import json
+import sys
+
+from data_validation import (
+    is_jsonl,
+    iter_records,
+    open_writer,
+    read_ingredients_jsonl,
+    write_ingredients_jsonl,
+)
+
+# 各数据类型在 JSON 文档中的根键（ingredient 为 {key: 成分} 对象）
+ROOT_KEYS = {
+    "product": "products",
+    "extracted": "skincareProducts",
+}
+
+
+def convert_records(input_file: str, output_file: str, key: str) -> int:
+    """逐条转换数组型数据，返回记录数"""
+    with open(input_file, "r", encoding="utf-8") as fin, \
+            open(output_file, "w", encoding="utf-8") as fout:
+        writer = open_writer(fout, output_file, key)
+        for record in iter_records(fin, input_file, key):
+            writer.write(record)
+        writer.close()
+    return writer.count
+
+
+def convert_ingredients(input_file: str, output_file: str) -> int:
+    """转换成分数据（{key: 成分} ⇄ 每行 {"key": ..., ...}），返回记录数"""
+    with open(input_file, "r", encoding="utf-8") as f:
+        data = read_ingredients_jsonl(f) if is_jsonl(input_file) else json.load(f)
+    with open(output_file, "w", encoding="utf-8") as f:
+        if is_jsonl(output_file):
+            write_ingredients_jsonl(data, f)
+        else:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    return len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 与 JSON Lines 互相转换")
+    parser.add_argument("--input", required=True, help="输入文件（.json 或 .jsonl）")
+    parser.add_argument("--output", required=True, help="输出文件（.json 或 .jsonl）")
+    parser.add_argument("--type", required=True, choices=["product", "ingredient", "extracted"],
+                        help="数据类型（extracted 为抓取的原始 skincareProducts 数据）")
+
+    args = parser.parse_args()
+
+    try:
+        if args.type == "ingredient":
+            count = convert_ingredients(args.input, args.output)
+        else:
+            count = convert_records(args.input, args.output, ROOT_KEYS[args.type])
+    except FileNotFoundError as e:
+        print(f"错误: 文件不存在 - {e.filename}")
+        sys.exit(1)
+    except KeyError as e:
+        print(f"错误: JSON 缺少 {e} 根键")
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"错误: JSON 格式错误 - {e.msg}")
+        sys.exit(1)
+
+    print(f"✓ 已转换 {count} 条记录: {args.input} → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
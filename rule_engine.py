@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+归一化规则引擎
+
+分类 / function / irritationRisk / 肤质 / 护肤问题的映射表保存在
+normalization_rules.json，由 data_validation.py 和 convert_extracted_data.py 共用。
+每张表加载时编译一次（每个进程只读一次文件）：
+    substring  关键词出现在文本中即命中，多条命中时按文件中的顺序取第一条；
+               编译为按优先级排好的 (关键词, value) 元组逐个 `in` 判断——这些表
+               只有几十个关键词，CPython 的子串查找比合并正则的逐位置扫描快 2~10 倍
+    exact      整个文本（小写）等于关键词才命中，字典查找
+短字段值的匹配结果会缓存。匹配结果带上命中的关键词，便于日志说明映射原因。
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "normalization_rules.json")
+
+MATCH_TYPES = ("substring", "exact")
+
+# 匹配结果缓存：只缓存不超过此长度的文本，条数满后清空
+CACHE_MAX_TEXT = 64
+CACHE_SIZE = 4096
+
+
+class RuleMatch(NamedTuple):
+    """一次命中：映射结果和命中的关键词"""
+    value: str
+    rule: str
+
+
+class RuleSet:
+    """一张映射表（{value: [关键词, ...]}，关键词按出现顺序决定优先级）"""
+
+    def __init__(self, name: str, match: str, rules: Dict[str, List[str]], default: Optional[str] = None):
+        if match not in MATCH_TYPES:
+            raise ValueError(f"规则表 {name}: 未知的 match 类型 '{match}'，期望: {list(MATCH_TYPES)}")
+        self.name = name
+        self.match_type = match
+        self.default = default
+        # 规则序号即优先级
+        self.rules: List[Tuple[str, str]] = [
+            (keyword.lower(), value) for value, keywords in rules.items() for keyword in keywords
+        ]
+        self._exact: Dict[str, int] = {}
+        for index, (keyword, _) in enumerate(self.rules):
+            self._exact.setdefault(keyword, index)
+        # 短文本（分类、function 等字段值）重复率高，缓存匹配结果
+        self._cache: Dict[str, Optional[RuleMatch]] = {}
+
+    def _find(self, text: str) -> Optional[RuleMatch]:
+        if self.match_type == "exact":
+            index = self._exact.get(text)
+            if index is None:
+                return None
+            keyword, value = self.rules[index]
+            return RuleMatch(value, keyword)
+        for keyword, value in self.rules:
+            if keyword in text:
+                return RuleMatch(value, keyword)
+        return None
+
+    def first(self, text: str) -> Optional[RuleMatch]:
+        """优先级最高的命中，未命中返回 None"""
+        text = text.lower()
+        if len(text) > CACHE_MAX_TEXT:
+            return self._find(text)
+        try:
+            return self._cache[text]
+        except KeyError:
+            pass
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache.clear()
+        hit = self._cache[text] = self._find(text)
+        return hit
+
+    def all(self, text: str) -> List[RuleMatch]:
+        """每个命中的 value 一条（取其优先级最高的关键词），按规则顺序排列"""
+        text = text.lower()
+        if self.match_type == "exact":
+            hit = self._find(text)
+            return [hit] if hit else []
+        matches: Dict[str, RuleMatch] = {}
+        for keyword, value in self.rules:
+            if value not in matches and keyword in text:
+                matches[value] = RuleMatch(value, keyword)
+        return list(matches.values())
+
+
+@lru_cache(maxsize=None)
+def load_rules(path: str = RULES_FILE) -> Dict[str, RuleSet]:
+    """读取并编译规则文件（每个进程每个文件只编译一次）"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        name: RuleSet(name, table["match"], table["rules"], table.get("default"))
+        for name, table in data.items()
+    }
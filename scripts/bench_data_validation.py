@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+data_validation.py logging benchmarks.
+
+Generates a synthetic product file (messy categories, "$" prices, missing
+priceRange) and runs data_validation.py on it once per log mode, reporting
+wall-clock time and how much was written to stdout. stdout goes to a pty by
+default, like an interactive run; pass --pipe to measure a redirected run.
+Point --script at an older copy (e.g. `git show <rev>:data_validation.py
+> /tmp/old.py`) to compare before/after.
+
+Usage:
+    python3 scripts/bench_data_validation.py
+    python3 scripts/bench_data_validation.py --records 100000 --jobs 4
+    python3 scripts/bench_data_validation.py --pipe --repeat 3
+"""
+
+import argparse
+import json
+import os
+import pty
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SCRIPT = REPO_ROOT / "data_validation.py"
+
+# (label, extra arguments); "{diag}" is replaced with a temp diagnostics path
+LOG_MODES = [
+    ("debug (default)", []),
+    ("warning", ["--log-level", "warning"]),
+    ("quiet", ["--log-level", "quiet"]),
+    ("quiet + diagnostics", ["--log-level", "quiet", "--diagnostics", "{diag}"]),
+]
+
+# Raw categories as scraped; most hit a cat_mapping entry and log a mapping
+RAW_CATEGORIES = ["Facial Cleanser", "serum", "Night Cream", "Essence", "SPF 50 Lotion", "toner"]
+
+
+def make_products(path: Path, records: int) -> None:
+    """Write `records` synthetic products to a JSON Lines file."""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(records):
+            product = {
+                "id": f"bench-{i:06d}",
+                "name": f"Bench Product {i}",
+                "brand": f"Brand {i % 50}",
+                "category": RAW_CATEGORIES[i % len(RAW_CATEGORIES)],
+                "ingredients": "Water, Glycerin, Niacinamide, Panthenol",
+                "price": f"${10 + i % 400}.00",
+                "averageRating": "n/a" if i % 10 == 0 else 3.5 + (i % 15) / 10,
+            }
+            f.write(json.dumps(product, ensure_ascii=False) + "\n")
+
+
+def run_pipe(cmd: list[str]) -> tuple[float, int]:
+    """Run with stdout on a pipe; return (seconds, stdout bytes)."""
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start, len(proc.stdout)
+
+
+def run_pty(cmd: list[str]) -> tuple[float, int]:
+    """Run with stdout on a pseudo-terminal; return (seconds, stdout bytes)."""
+    master, slave = pty.openpty()
+    received = [0]
+
+    def drain() -> None:
+        while True:
+            try:
+                chunk = os.read(master, 65536)
+            except OSError:
+                break
+            if not chunk:
+                break
+            received[0] += len(chunk)
+
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=slave, stderr=subprocess.DEVNULL)
+    os.close(slave)
+    proc.wait()
+    elapsed = time.perf_counter() - start
+    reader.join()
+    os.close(master)
+    return elapsed, received[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--script", default=str(DEFAULT_SCRIPT), help="data_validation.py to benchmark")
+    parser.add_argument("--records", type=int, default=100_000, help="Synthetic product count")
+    parser.add_argument("--jobs", type=int, default=1, help="Passed through as --jobs")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per mode (best is reported)")
+    parser.add_argument("--pipe", action="store_true", help="Send stdout to a pipe instead of a pty")
+    args = parser.parse_args()
+
+    runner = run_pipe if args.pipe else run_pty
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        source = tmp_path / "products.jsonl"
+        make_products(source, args.records)
+        print(f"{args.records} products, stdout to {'pipe' if args.pipe else 'pty'}, jobs={args.jobs}")
+        print(f"{'mode':<22} {'seconds':>8} {'stdout KB':>10}")
+        for label, extra in LOG_MODES:
+            diag = tmp_path / "diagnostics.jsonl"
+            cmd = [
+                sys.executable, args.script,
+                "--input", str(source), "--output", str(tmp_path / "out.jsonl"),
+                "--type", "product", "--jobs", str(args.jobs),
+            ] + [arg.replace("{diag}", str(diag)) for arg in extra]
+            results = [runner(cmd) for _ in range(args.repeat)]
+            seconds = min(r[0] for r in results)
+            print(f"{label:<22} {seconds:>8.2f} {results[0][1] / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+flowctl benchmarks.
+
+Runs flowctl commands in-process against the current repo (or a synthetic
+.flow tree) and reports subprocess forks and wall-clock time per command.
+Point --flowctl at an older copy (e.g. `git show <rev>:.flow/bin/flowctl.py
+> /tmp/old.py`) to compare before/after.
+
+Usage:
+    python3 scripts/bench_flowctl.py forks
+    python3 scripts/bench_flowctl.py forks --flowctl /tmp/old.py --repeat 5
+    python3 scripts/bench_flowctl.py index --tasks 2000
+    python3 scripts/bench_flowctl.py dependents --tasks 5000 --per-epic 50
+    python3 scripts/bench_flowctl.py hints --files 500 --changed 50
+    python3 scripts/bench_flowctl.py swift
+    python3 scripts/bench_flowctl.py serve --tasks 2000
+    python3 scripts/bench_flowctl.py startup
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_FLOWCTL = REPO_ROOT / ".flow" / "bin" / "flowctl.py"
+
+# Hot commands used by Ralph and interactive listing
+FORK_COMMANDS = [
+    ["list", "--json"],
+    ["tasks", "--json"],
+    ["epics", "--json"],
+    ["status", "--json"],
+    ["show", "fn-1", "--json"],
+    ["ready", "--epic", "fn-1", "--json"],
+    ["next", "--json"],
+]
+
+# Hot Ralph commands and their budget (ms of wall-clock over a bare
+# `python3 -c pass`), measured through the .flow/bin/flowctl wrapper with
+# bytecode cached and repo paths exported as ralph.sh does. `next` reads
+# every epic and task, so it gets extra headroom.
+STARTUP_COMMANDS = [
+    (["show", "fn-1", "--json"], 60.0),
+    (["next", "--json"], 80.0),
+    (["state-path"], 60.0),
+]
+
+# Budget (ms) for extracting symbols from every Swift file under SkinLab/
+SWIFT_SCAN_BUDGET_MS = 1000.0
+
+# Listing commands served by the persistent task index
+INDEX_COMMANDS = [
+    ["list", "--json"],
+    ["tasks", "--json"],
+    ["epics", "--json"],
+    ["status", "--json"],
+    ["next", "--json"],
+]
+
+
+def load_flowctl(path: Path, name: str = "flowctl_bench"):
+    """Import flowctl.py as a fresh module (no state shared between runs)."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextlib.contextmanager
+def count_forks():
+    """Count subprocess.Popen calls made inside the block (yields a 1-item list)."""
+    forks = [0]
+    real_popen = subprocess.Popen
+
+    class CountingPopen(real_popen):
+        def __init__(self, *args, **kwargs):
+            forks[0] += 1
+            super().__init__(*args, **kwargs)
+
+    subprocess.Popen = CountingPopen
+    try:
+        yield forks
+    finally:
+        subprocess.Popen = real_popen
+
+
+def run_command(path: Path, argv: list[str]) -> tuple[int, float]:
+    """Run one flowctl command in-process. Returns (forks, seconds)."""
+    module = load_flowctl(path)
+    saved_argv = sys.argv
+    sys.argv = ["flowctl"] + argv
+    start = time.perf_counter()
+    try:
+        with count_forks() as forks, contextlib.redirect_stdout(io.StringIO()):
+            try:
+                module.main()
+            except SystemExit:
+                pass
+    finally:
+        elapsed = time.perf_counter() - start
+        sys.argv = saved_argv
+    return forks[0], elapsed
+
+
+def make_synthetic_flow(root: Path, tasks: int, per_epic: int = 50) -> None:
+    """Write a .flow tree with `tasks` tasks in chains of `per_epic` per epic.
+
+    Each task depends on its predecessor; files are backdated so flowctl's
+    index treats them as settled.
+    """
+    flow_dir = root / ".flow"
+    for sub in ("epics", "tasks", "specs"):
+        (flow_dir / sub).mkdir(parents=True, exist_ok=True)
+    (root / ".git").mkdir(exist_ok=True)
+    epics = max(1, (tasks + per_epic - 1) // per_epic)
+    (flow_dir / "meta.json").write_text(
+        json.dumps({"schema_version": 2, "next_epic": epics + 1})
+    )
+    stamp = "2026-01-01T00:00:00Z"
+    for e in range(1, epics + 1):
+        epic_id = f"fn-{e}"
+        (flow_dir / "epics" / f"{epic_id}.json").write_text(
+            json.dumps(
+                {
+                    "id": epic_id,
+                    "title": f"Epic {e}",
+                    "status": "open",
+                    "plan_review_status": "ship",
+                    "depends_on_epics": [],
+                    "spec_path": f".flow/specs/{epic_id}.md",
+                    "next_task": per_epic + 1,
+                    "created_at": stamp,
+                    "updated_at": stamp,
+                }
+            )
+        )
+        for t in range(1, per_epic + 1):
+            if (e - 1) * per_epic + t > tasks:
+                break
+            task_id = f"{epic_id}.{t}"
+            (flow_dir / "tasks" / f"{task_id}.json").write_text(
+                json.dumps(
+                    {
+                        "id": task_id,
+                        "epic": epic_id,
+                        "title": f"Task {task_id}",
+                        "status": "todo",
+                        "priority": None,
+                        "depends_on": [f"{epic_id}.{t - 1}"] if t > 1 else [],
+                        "spec_path": f".flow/tasks/{task_id}.md",
+                        "created_at": stamp,
+                        "updated_at": stamp,
+                    }
+                )
+            )
+    past = time.time() - 3600
+    for dirpath, _, filenames in os.walk(flow_dir):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+
+
+@contextlib.contextmanager
+def synthetic_env(root: Path, **extra: str):
+    """chdir into a synthetic repo with path env vars set (no git forks)."""
+    saved_env = dict(os.environ)
+    saved_cwd = os.getcwd()
+    os.environ.update(
+        FLOW_REPO_ROOT=str(root),
+        FLOW_GIT_COMMON_DIR=str(root / ".git"),
+        FLOW_ACTOR="bench",
+        **extra,
+    )
+    os.chdir(root)
+    try:
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+
+
+def cmd_forks(args: argparse.Namespace) -> None:
+    path = Path(args.flowctl).resolve()
+    print(f"flowctl: {path}")
+    print(f"{'command':<32} {'forks':>6} {'ms (best)':>10}")
+    for argv in FORK_COMMANDS:
+        results = [run_command(path, argv) for _ in range(args.repeat)]
+        forks = results[0][0]
+        best_ms = min(r[1] for r in results) * 1000
+        print(f"{' '.join(argv):<32} {forks:>6} {best_ms:>10.1f}")
+
+
+def cmd_index(args: argparse.Namespace) -> None:
+    path = Path(args.flowctl).resolve()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_synthetic_flow(root, args.tasks)
+        print(f"flowctl: {path}")
+        print(f"synthetic tree: {args.tasks} tasks")
+        print(f"{'command':<20} {'no index ms':>12} {'warm index ms':>14}")
+        for argv in INDEX_COMMANDS:
+            with synthetic_env(root, FLOW_NO_INDEX="1"):
+                cold = min(run_command(path, argv)[1] for _ in range(args.repeat))
+            with synthetic_env(root):
+                run_command(path, argv)  # populate index
+                warm = min(run_command(path, argv)[1] for _ in range(args.repeat))
+            print(f"{' '.join(argv):<20} {cold * 1000:>12.1f} {warm * 1000:>14.1f}")
+
+
+def timed(fn, *args, **kwargs):
+    """Call fn and return (result, seconds)."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def cmd_dependents(args: argparse.Namespace) -> None:
+    path = Path(args.flowctl).resolve()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_synthetic_flow(root, args.tasks, per_epic=args.per_epic)
+        print(f"flowctl: {path}")
+        print(f"synthetic tree: {args.tasks} tasks, chains of {args.per_epic}")
+        with synthetic_env(root):
+            module = load_flowctl(path)
+            deps, secs = timed(module.find_dependents, "fn-1.1", same_epic=True)
+            print(f"find_dependents(fn-1.1): {len(deps)} dependents in {secs * 1000:.1f} ms")
+
+            flow_dir = root / ".flow"
+            epic_ids = sorted(p.stem for p in (flow_dir / "epics").glob("fn-*.json"))
+            start = time.perf_counter()
+            for epic_id in epic_ids:
+                module.validate_epic(flow_dir, epic_id)
+            secs = time.perf_counter() - start
+            print(f"validate_epic x{len(epic_ids)}: {secs * 1000:.1f} ms")
+
+
+def make_source_repo(root: Path, files: int, changed: int) -> None:
+    """Create a git repo of Python modules that call into each other.
+
+    Module N defines 10 functions and calls a few from modules N-1..N-3.
+    `main` holds the initial commit; the working tree then edits the first
+    `changed` modules, so `git diff main` reports them.
+    """
+
+    def git(*argv: str) -> None:
+        subprocess.run(["git", *argv], cwd=root, check=True, capture_output=True)
+
+    git("init", "-q", "-b", "main")
+    git("config", "user.email", "bench@example.com")
+    git("config", "user.name", "bench")
+    src = root / "src"
+    src.mkdir()
+    for n in range(files):
+        lines = [f"from . import mod{max(n - 1, 0)}", ""]
+        for f in range(10):
+            lines.append(f"def func_{n}_{f}(value):")
+            calls = [f"func_{m}_{f}" for m in range(max(0, n - 3), n)]
+            lines.append(f"    return [{', '.join(calls)}], value" if calls else "    return value")
+            lines.append("")
+        (src / f"mod{n}.py").write_text("\n".join(lines))
+    git("add", "-A")
+    git("commit", "-q", "-m", "init")
+    for n in range(min(changed, files)):
+        with open(src / f"mod{n}.py", "a") as f:
+            f.write(f"\ndef added_{n}():\n    return {n}\n")
+
+
+def cmd_hints(args: argparse.Namespace) -> None:
+    path = Path(args.flowctl).resolve()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_source_repo(root, args.files, args.changed)
+        print(f"flowctl: {path}")
+        print(f"source repo: {args.files} modules, {args.changed} changed")
+        with synthetic_env(root):
+            # First run starts with no symbol index; later runs reuse it
+            runs = []
+            for _ in range(1 + args.repeat):
+                module = load_flowctl(path)
+                with count_forks() as forks:
+                    hints, secs = timed(module.gather_context_hints, "main")
+                runs.append((forks[0], secs))
+            count = len(hints.splitlines()) - 1 if hints else 0
+            print(f"gather_context_hints: {count} hints")
+            print(f"  cold: {runs[0][0]} forks, {runs[0][1] * 1000:.1f} ms")
+            warm = min(runs[1:], key=lambda r: r[1])
+            print(f"  warm: {warm[0]} forks, {warm[1] * 1000:.1f} ms (best of {args.repeat})")
+
+
+def cmd_swift(args: argparse.Namespace) -> None:
+    path = Path(args.flowctl).resolve()
+    module = load_flowctl(path)
+    files = sorted(Path(args.path).rglob("*.swift"))
+    print(f"flowctl: {path}")
+    print(f"swift files: {len(files)} under {args.path}")
+    best = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        symbols = [module.extract_symbols_from_file(f) for f in files]
+        secs = time.perf_counter() - start
+        best = secs if best is None else min(best, secs)
+    total = sum(len(found) for found in symbols)
+    empty = sum(1 for found in symbols if not found)
+    ms = best * 1000
+    flag = "" if ms <= SWIFT_SCAN_BUDGET_MS else "  OVER BUDGET"
+    print(f"symbols: {total} ({empty} files without any)")
+    print(f"extract_symbols_from_file: {ms:.1f} ms (best), budget {SWIFT_SCAN_BUDGET_MS:.0f} ms{flag}")
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    wrapper = Path(args.flowctl).resolve().parent / "flowctl"
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_synthetic_flow(root, args.tasks)
+        sock = root / "bench.sock"
+        print(f"flowctl: {wrapper}")
+        print(f"synthetic tree: {args.tasks} tasks")
+        with synthetic_env(root):
+            server = subprocess.Popen(
+                [str(wrapper), "serve", "--socket", str(sock), "--idle-timeout", "60"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                while not sock.exists():
+                    time.sleep(0.05)
+                print(f"{'command':<20} {'direct ms':>10} {'served ms':>10}")
+                for argv in INDEX_COMMANDS:
+                    row = []
+                    for env in ({}, {"FLOW_SERVE_SOCKET": str(sock)}):
+                        best = None
+                        for _ in range(args.repeat):
+                            start = time.perf_counter()
+                            subprocess.run(
+                                [str(wrapper)] + argv,
+                                stdout=subprocess.DEVNULL,
+                                env={**os.environ, **env},
+                                check=False,
+                            )
+                            elapsed = time.perf_counter() - start
+                            best = elapsed if best is None else min(best, elapsed)
+                        row.append(best * 1000)
+                    print(f"{' '.join(argv):<20} {row[0]:>10.1f} {row[1]:>10.1f}")
+            finally:
+                server.terminate()
+                server.wait()
+
+
+def median_ms(cmd: list[str], env: dict, repeat: int) -> float:
+    """Median wall-clock of running cmd, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env, check=False)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def cmd_startup(args: argparse.Namespace) -> None:
+    wrapper = Path(args.flowctl).resolve().parent / "flowctl"
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.update(FLOW_REPO_ROOT=str(REPO_ROOT), FLOW_GIT_COMMON_DIR=str(REPO_ROOT / ".git"))
+    subprocess.run([str(wrapper), "state-path"], stdout=subprocess.DEVNULL, env=env, check=False)
+
+    bare = median_ms([sys.executable, "-c", "pass"], env, args.repeat)
+    print(f"flowctl: {wrapper}")
+    print(f"bare interpreter: {bare:.1f} ms")
+    print(f"{'command':<20} {'ms':>8} {'overhead':>9} {'target':>7}")
+    for argv, target in STARTUP_COMMANDS:
+        ms = median_ms([str(wrapper)] + argv, env, args.repeat)
+        flag = "" if ms - bare <= target else "  OVER TARGET"
+        print(f"{' '.join(argv):<20} {ms:>8.1f} {ms - bare:>+9.1f} {target:>+7.0f}{flag}")
+
+    # -X importtime for the first hot command: heaviest imports by cumulative us
+    bootstrap = (
+        "import sys; d = sys.argv.pop(1); sys.argv[0] = d + '/flowctl.py'; "
+        "sys.path.insert(0, d); import flowctl; flowctl.main()"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", bootstrap, str(wrapper.parent)]
+        + STARTUP_COMMANDS[0][0],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].strip()))
+    print(f"\nimporttime ({' '.join(STARTUP_COMMANDS[0][0])}), top {args.top} cumulative:")
+    for cumulative, name in sorted(rows, reverse=True)[: args.top]:
+        print(f"  {cumulative / 1000:>7.1f} ms  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="flowctl benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p_forks = subparsers.add_parser("forks", help="Count forks per command")
+    p_forks.add_argument("--flowctl", default=str(DEFAULT_FLOWCTL), help="flowctl.py to benchmark")
+    p_forks.add_argument("--repeat", type=int, default=3, help="Runs per command")
+    p_forks.set_defaults(func=cmd_forks)
+
+    p_index = subparsers.add_parser("index", help="Listing with/without task index")
+    p_index.add_argument("--flowctl", default=str(DEFAULT_FLOWCTL), help="flowctl.py to benchmark")
+    p_index.add_argument("--tasks", type=int, default=2000, help="Synthetic task count")
+    p_index.add_argument("--repeat", type=int, default=3, help="Runs per command")
+    p_index.set_defaults(func=cmd_index)
+
+    p_deps = subparsers.add_parser("dependents", help="Dependency graph queries")
+    p_deps.add_argument("--flowctl", default=str(DEFAULT_FLOWCTL), help="flowctl.py to benchmark")
+    p_deps.add_argument("--tasks", type=int, default=5000, help="Synthetic task count")
+    p_deps.add_argument("--per-epic", type=int, default=50, help="Chain length per epic")
+    p_deps.set_defaults(func=cmd_dependents)
+
+    p_hints = subparsers.add_parser("hints", help="Review context-hint gathering")
+    p_hints.add_argument("--flowctl", default=str(DEFAULT_FLOWCTL), help="flowctl.py to benchmark")
+    p_hints.add_argument("--files", type=int, default=500, help="Modules in the source repo")
+    p_hints.add_argument("--changed", type=int, default=50, help="Modules changed vs main")
+    p_hints.add_argument("--repeat", type=int, default=3, help="Runs")
+    p_hints.set_defaults(func=cmd_hints)
+
+    p_swift = subparsers.add_parser("swift", help="Swift symbol extraction time")
+    p_swift.add_argument("--flowctl", default=str(DEFAULT_FLOWCTL), help="flowctl.py to benchmark")
+    p_swift.add_argument("--path", default=str(REPO_ROOT / "SkinLab"), help="Directory to scan")
+    p_swift.add_argument("--repeat", type=int, default=3, help="Runs")
+    p_swift.set_defaults(func=cmd_swift)
+
+    p_serve = subparsers.add_parser("serve", help="Wrapper calls direct vs via flowctl serve")
+    p_serve.add_argument("--flowctl", default=str(DEFAULT_FLOWCTL), help="flowctl.py to benchmark")
+    p_serve.add_argument("--tasks", type=int, default=2000, help="Synthetic task count")
+    p_serve.add_argument("--repeat", type=int, default=3, help="Runs per command")
+    p_serve.set_defaults(func=cmd_serve)
+
+    p_startup = subparsers.add_parser("startup", help="Startup wall-clock and import times")
+    p_startup.add_argument("--flowctl", default=str(DEFAULT_FLOWCTL), help="flowctl.py to benchmark")
+    p_startup.add_argument("--repeat", type=int, default=9, help="Runs per command")
+    p_startup.add_argument("--top", type=int, default=12, help="Imports to list")
+    p_startup.set_defaults(func=cmd_startup)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,11 @@ set -euo pipefail
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 ROOT_DIR="$(cd "$SCRIPT_DIR/../.." && pwd)"
 CONFIG="$SCRIPT_DIR/config.env"
-FLOWCTL="$SCRIPT_DIR/flowctl"
+# Use the repo's flowctl (.flow/bin) when installed: it honours the FLOW_*
+# path exports below, caches actor resolution and can forward to `flowctl serve`.
+# The vendored copy next to this script is the fallback.
+FLOWCTL="$ROOT_DIR/.flow/bin/flowctl"
+[[ -x "$FLOWCTL" ]] || FLOWCTL="$SCRIPT_DIR/flowctl"
 
 fail() { echo "ralph: $*" >&2; exit 1; }
 log() {
@@ -163,6 +167,12 @@ EPICS="${EPICS:-}"
 
 CLAUDE_BIN="${CLAUDE_BIN:-claude}"
 
+# Resolve repo paths once; flowctl skips `git rev-parse` when these are set
+export FLOW_REPO_ROOT="${FLOW_REPO_ROOT:-$ROOT_DIR}"
+if [[ -z "${FLOW_GIT_COMMON_DIR:-}" ]] && common_dir="$(git -C "$ROOT_DIR" rev-parse --path-format=absolute --git-common-dir 2>/dev/null)"; then
+  export FLOW_GIT_COMMON_DIR="$common_dir"
+fi
+
 sanitize_id() {
   local v="$1"
   v="${v// /_}"
@@ -248,7 +258,11 @@ print(json.dumps({"epics": parts}, indent=2, sort_keys=True))
 PY
 }
 
-RUN_ID="$(date -u +%Y%m%dT%H%M%SZ)-$(hostname -s 2>/dev/null || hostname)-$(sanitize_id "$(get_actor)")-$$-$(rand4)"
+# Resolve the actor once; exported so every flowctl call in the run (ours and
+# Claude's) uses it instead of re-reading git config
+FLOW_ACTOR="$(get_actor)"
+export FLOW_ACTOR
+RUN_ID="$(date -u +%Y%m%dT%H%M%SZ)-$(hostname -s 2>/dev/null || hostname)-$(sanitize_id "$FLOW_ACTOR")-$$-$(rand4)"
 RUN_DIR="$SCRIPT_DIR/runs/$RUN_ID"
 mkdir -p "$RUN_DIR"
 ATTEMPTS_FILE="$RUN_DIR/attempts.json"
@@ -257,6 +271,8 @@ BRANCHES_FILE="$RUN_DIR/branches.json"
 RECEIPTS_DIR="$RUN_DIR/receipts"
 mkdir -p "$RECEIPTS_DIR"
 PROGRESS_FILE="$RUN_DIR/progress.txt"
+RUN_STATE_FILE="$RUN_DIR/run-state.json"
+EVENTS_FILE="$RUN_DIR/events.jsonl"
 {
   echo "# Ralph Progress Log"
   echo "Run: $RUN_ID"
@@ -300,6 +316,80 @@ append_progress() {
   } >> "$PROGRESS_FILE"
 }
 
+# run-state.json: small sidecar rewritten every iteration so `flowctl status`
+# and `flowctl ralph ...` never have to scan the (growing) progress log.
+# Best-effort, like emit_event: a failed write must not abort the run.
+write_run_state() {
+  local completed="${1:-0}"
+  local completion_reason="${2:-}"
+  python3 - "$RUN_STATE_FILE" "$RUN_ID" "${iter:-0}" "${status:-}" "${epic_id:-}" "${task_id:-}" "$completed" "$completion_reason" "$$" "${HOSTNAME:-}" <<'PY' || true
+import json, os, sys, time
+path, run_id, iteration, status, epic, task, completed, reason, pid, host = sys.argv[1:11]
+data = {
+    "run": run_id,
+    "pid": int(pid),
+    "host": host or None,
+    "iteration": int(iteration),
+    "status": status or None,
+    "epic": epic or None,
+    "task": task or None,
+    "completed": completed == "1",
+    "completion_reason": reason or None,
+    "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+}
+tmp = f"{path}.tmp"
+with open(tmp, "w", encoding="utf-8") as f:
+    json.dump(data, f, indent=2, sort_keys=True)
+os.replace(tmp, path)
+PY
+}
+
+write_completion_marker() {
+  local reason="$1"
+  {
+    echo "completion_reason=$reason"
+    echo "promise=COMPLETE"
+  } >> "$PROGRESS_FILE"
+  write_run_state 1 "$reason"
+  emit_event run_end "reason=$reason" "iterations=${iter:-0}" "started=$RUN_STARTED"
+}
+
+# Seconds since the epoch (sub-second where bash provides it)
+now_ts() {
+  local ts="${EPOCHREALTIME:-}"
+  [[ -n "$ts" ]] || ts="$(date +%s)"
+  printf '%s' "${ts/,/.}"
+}
+
+# events.jsonl: append-only JSON Lines log of this run, shared with flowctl
+# (which adds review events). One object per line: ts, run, event, fields.
+# Args are key=value; integers become numbers, empty values null, and
+# started=<now_ts> / <name>_started=<now_ts> become duration_ms / <name>_ms.
+# Read with: flowctl ralph events [--follow]
+emit_event() {
+  local event="$1"
+  shift
+  python3 - "$EVENTS_FILE" "$RUN_ID" "$event" "$(now_ts)" "$@" <<'PY' || true
+import json, re, sys
+from datetime import datetime, timezone
+path, run_id, event, now = sys.argv[1:5]
+now = float(now)
+ts = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+rec = {"ts": ts, "run": run_id, "event": event}
+for arg in sys.argv[5:]:
+    key, _, value = arg.partition("=")
+    if key == "started" or key.endswith("_started"):
+        name = "duration" if key == "started" else key[: -len("_started")]
+        rec[f"{name}_ms"] = round((now - float(value)) * 1000)
+    elif re.fullmatch(r"-?\d+", value):
+        rec[key] = int(value)
+    else:
+        rec[key] = value or None
+with open(path, "a", encoding="utf-8") as f:
+    f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+PY
+}
+
 init_branches_file() {
   if [[ -f "$BRANCHES_FILE" ]]; then return; fi
   local base_branch
@@ -456,8 +546,53 @@ if [[ -n "${EPICS// }" ]]; then
   write_epics_file "$EPICS" > "$EPICS_FILE"
 fi
 
+# Keep one warm `flowctl serve` for the run; the .flow/bin wrapper (used by
+# this script and, via scripts/ralph/flowctl, by Claude) forwards to it while
+# FLOW_SERVE_SOCKET is exported and runs flowctl directly otherwise.
+SERVE_PID=""
+start_flowctl_serve() {
+  [[ "${RALPH_SERVE:-1}" == "1" && "$FLOWCTL" == "$ROOT_DIR/.flow/bin/flowctl" ]] || return 0
+  if [[ -n "${FLOW_SERVE_SOCKET:-}" && -S "$FLOW_SERVE_SOCKET" ]]; then
+    log "using flowctl serve at $FLOW_SERVE_SOCKET"
+    return 0
+  fi
+  local sock="$RUN_DIR/flowctl.sock"
+  # Unix socket paths are limited to ~104 bytes
+  (( ${#sock} < 100 )) || sock="${TMPDIR:-/tmp}/flowctl-ralph-$$.sock"
+  "$FLOWCTL" serve --socket "$sock" --idle-timeout "${RALPH_SERVE_IDLE_TIMEOUT:-3600}" \
+    >/dev/null 2>>"$RUN_DIR/serve.log" &
+  SERVE_PID=$!
+  local _
+  for _ in {1..50}; do
+    [[ -S "$sock" ]] && break
+    kill -0 "$SERVE_PID" 2>/dev/null || break
+    sleep 0.1
+  done
+  if [[ -S "$sock" ]]; then
+    export FLOW_SERVE_SOCKET="$sock"
+    log "flowctl serve pid=$SERVE_PID socket=$sock"
+  else
+    log "flowctl serve did not start (see $RUN_DIR/serve.log); calling flowctl directly"
+    kill "$SERVE_PID" 2>/dev/null || true
+    SERVE_PID=""
+  fi
+}
+
+stop_flowctl_serve() {
+  [[ -n "$SERVE_PID" ]] || return 0
+  kill "$SERVE_PID" 2>/dev/null || true
+  wait "$SERVE_PID" 2>/dev/null || true
+  SERVE_PID=""
+}
+
+trap stop_flowctl_serve EXIT
+start_flowctl_serve
+
 ui_header
 ui_config
+RUN_STARTED="$(now_ts)"
+emit_event run_start "epics=${EPICS:-}" "max_iterations=$MAX_ITERATIONS" \
+  "plan_review=$PLAN_REVIEW" "work_review=$WORK_REVIEW" "branch_mode=$BRANCH_MODE"
 
 iter=1
 while (( iter <= MAX_ITERATIONS )); do
@@ -467,20 +602,26 @@ while (( iter <= MAX_ITERATIONS )); do
   [[ -n "$EPICS_FILE" ]] && selector_args+=(--epics-file "$EPICS_FILE")
   [[ "$REQUIRE_PLAN_REVIEW" == "1" ]] && selector_args+=(--require-plan-review)
 
+  iter_started="$(now_ts)"
+  emit_event iteration_start "iter=$iter"
   selector_json="$("${selector_args[@]}")"
   status="$(json_get status "$selector_json")"
   epic_id="$(json_get epic "$selector_json")"
   task_id="$(json_get task "$selector_json")"
   reason="$(json_get reason "$selector_json")"
+  emit_event selector "iter=$iter" "status=$status" "epic=${epic_id:-}" "task=${task_id:-}" \
+    "reason=${reason:-}" "started=$iter_started"
 
   log "iter $iter status=$status epic=${epic_id:-} task=${task_id:-} reason=${reason:-}"
   ui_iteration "$iter" "$status" "${epic_id:-}" "${task_id:-}"
+  write_run_state
 
   if [[ "$status" == "none" ]]; then
     if [[ "$reason" == "blocked_by_epic_deps" ]]; then
       log "blocked by epic deps"
     fi
     maybe_close_epics
+    write_completion_marker "NO_WORK"
     ui_complete
     echo "<promise>COMPLETE</promise>"
     exit 0
@@ -513,6 +654,8 @@ while (( iter <= MAX_ITERATIONS )); do
   fi
 
   export FLOW_RALPH="1"
+  # Lets flowctl (e.g. codex batch-review) notice this run's STOP file
+  export RALPH_RUN_DIR="$RUN_DIR"
   claude_args=(-p --output-format text)
 
   # Autonomous mode system prompt - critical for preventing drift
@@ -542,6 +685,7 @@ Violations break automation and leave the user with incomplete work. Be precise,
   ui_waiting
 
   set +e
+  claude_started="$(now_ts)"
   claude_out="$("$CLAUDE_BIN" "${claude_args[@]}" "$prompt" 2>&1)"
   claude_rc=$?
   set -e
@@ -586,8 +730,13 @@ Violations break automation and leave the user with incomplete work. Be precise,
   promise="$(printf '%s' "$claude_out" | extract_tag promise)"
   ui_verdict "$verdict"
   append_progress "$verdict" "$promise" "$plan_review_status" "$task_status"
+  emit_event iteration_end "iter=$iter" "status=$status" "epic=${epic_id:-}" "task=${task_id:-}" \
+    "verdict=${verdict:-}" "promise=${promise:-}" "claude_rc=$claude_rc" \
+    "task_status=${task_status:-}" "plan_review_status=${plan_review_status:-}" \
+    "force_retry=$force_retry" "claude_started=$claude_started" "started=$iter_started"
 
   if echo "$claude_out" | grep -q "<promise>COMPLETE</promise>"; then
+    write_completion_marker "DONE"
     ui_complete
     echo "<promise>COMPLETE</promise>"
     exit 0
@@ -606,6 +755,7 @@ Violations break automation and leave the user with incomplete work. Be precise,
 
   if [[ "$exit_code" -eq 1 ]]; then
     log "exit=fail"
+    write_completion_marker "FAILED"
     ui_fail "Claude returned FAIL promise"
     exit 1
   fi
@@ -614,6 +764,7 @@ Violations break automation and leave the user with incomplete work. Be precise,
     attempts="$(bump_attempts "$ATTEMPTS_FILE" "$task_id")"
     log "retry task=$task_id attempts=$attempts"
     ui_retry "$task_id" "$attempts" "$MAX_ATTEMPTS_PER_TASK"
+    emit_event task_retry "iter=$iter" "task=$task_id" "attempts=$attempts"
     if (( attempts >= MAX_ATTEMPTS_PER_TASK )); then
       reason_file="$RUN_DIR/block-${task_id}.md"
       {
@@ -626,6 +777,7 @@ Violations break automation and leave the user with incomplete work. Be precise,
       } > "$reason_file"
       "$FLOWCTL" block "$task_id" --reason-file "$reason_file" --json || true
       ui_blocked "$task_id"
+      emit_event task_blocked "iter=$iter" "task=$task_id" "attempts=$attempts"
     fi
   fi
 
@@ -633,6 +785,9 @@ Violations break automation and leave the user with incomplete work. Be precise,
   iter=$((iter + 1))
 done
 
+# The loop leaves iter one past the last iteration that ran
+iter=$((iter - 1))
+write_completion_marker "MAX_ITERATIONS"
 ui_fail "Max iterations ($MAX_ITERATIONS) reached"
 echo "ralph: max iterations reached" >&2
 exit 1